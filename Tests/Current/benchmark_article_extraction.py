@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Article Extraction Benchmark - Compare the full-article text extractors in
+services/news-feed/extractors.py (the original BeautifulSoup selector walk
+and the lxml readability-style scorer) for throughput and extraction quality.
+
+Usage:
+    # Saved pages: every page.html may have a page.txt with the expected article text
+    python Tests/Current/benchmark_article_extraction.py --corpus /path/to/saved_pages
+
+    # Generated pages with known article text and typical boilerplate
+    python Tests/Current/benchmark_article_extraction.py --synthetic 300 --save-corpus /tmp/pages
+
+Quality is token precision/recall/F1 of the extracted text against the
+expected text. Pages without a .txt file only count towards throughput.
+"""
+import argparse
+import json
+import logging
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "services" / "news-feed"))
+
+from extractors import EXTRACTORS, ARTICLE_MAX_CHARS  # noqa: E402
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+WORDS = (
+    "market council energy report minister growth research climate election budget "
+    "technology policy security network analysis industry health transport data "
+    "city court investment science education trade union weather survey".split()
+)
+
+# (opening, closing) markup around the article body, from explicit to hint-free
+CONTAINERS = [
+    ('<article class="story">', "</article>"),
+    ('<div class="entry-content">', "</div>"),
+    ('<div id="story-body" class="col-8">', "</div>"),
+    ('<div class="c-1x">', "</div>"),
+    ('<section><div class="wrapper"><div>', "</div></div></section>"),
+]
+
+
+def _sentence(rng: random.Random) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(8, 20))]
+    if rng.random() < 0.5:
+        words.insert(rng.randint(2, len(words) - 1), words.pop() + ",")
+    return " ".join(words).capitalize() + "."
+
+
+def _links(rng: random.Random, count: int) -> str:
+    return "".join(f'<li><a href="/s/{rng.randint(1, 9999)}">{_sentence(rng)}</a></li>' for _ in range(count))
+
+
+def synthetic_page(rng: random.Random) -> Tuple[bytes, str]:
+    """A news page with nav, sidebars, comments and footer around a known article."""
+    paragraphs = [" ".join(_sentence(rng) for _ in range(rng.randint(2, 5))) for _ in range(rng.randint(4, 14))]
+    opening, closing = rng.choice(CONTAINERS)
+    body = "".join(f"<p>{p}</p>" for p in paragraphs)
+    html = f"""<!DOCTYPE html><html><head><title>{_sentence(rng)}</title>
+<script>{"var tracking = {};" * rng.randint(50, 400)}</script>
+<style>{".c{{margin:0}}" * rng.randint(50, 400)}</style></head>
+<body>
+<div class="top-bar"><ul class="menu">{_links(rng, rng.randint(10, 40))}</ul></div>
+<div class="cookie-popup"><p>{_sentence(rng)} {_sentence(rng)}</p></div>
+<div class="layout">
+{opening}<h1>{_sentence(rng)}</h1>{body}{closing}
+<div class="sidebar related"><ul>{_links(rng, rng.randint(5, 20))}</ul></div>
+<div class="comments">{"".join(f'<div class="comment"><p>{_sentence(rng)} {_sentence(rng)}</p></div>' for _ in range(rng.randint(0, 15)))}</div>
+<div class="newsletter"><p>{_sentence(rng)}</p><form><input name="email"></form></div>
+</div>
+<div class="site-footer"><ul>{_links(rng, rng.randint(10, 30))}</ul><p>{_sentence(rng)}</p></div>
+</body></html>"""
+    return html.encode("utf-8"), " ".join(paragraphs)
+
+
+def load_corpus(path: Path) -> List[Tuple[str, bytes, Optional[str]]]:
+    pages = []
+    for html_path in sorted(path.glob("*.html")):
+        expected_path = html_path.with_suffix(".txt")
+        expected = expected_path.read_text(encoding="utf-8") if expected_path.exists() else None
+        pages.append((html_path.name, html_path.read_bytes(), expected))
+    return pages
+
+
+def token_scores(extracted: str, expected: str) -> Tuple[float, float, float]:
+    """Bag-of-words precision, recall and F1."""
+    got = Counter(extracted.lower().split())
+    want = Counter(expected.lower().split())
+    overlap = sum((got & want).values())
+    precision = overlap / sum(got.values()) if got else 0.0
+    recall = overlap / sum(want.values()) if want else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return precision, recall, f1
+
+
+def measure(extract: Callable[[bytes], str], pages: List[Tuple[str, bytes, Optional[str]]],
+            runs: int, max_chars: int) -> Dict[str, float]:
+    samples: List[float] = []
+    quality: List[Tuple[float, float, float]] = []
+    for run in range(runs):
+        for name, html, expected in pages:
+            start = time.perf_counter()
+            text = extract(html)
+            samples.append((time.perf_counter() - start) * 1000)
+            if run == 0 and expected is not None:
+                # Both extractors truncate, so score against the same prefix
+                quality.append(token_scores(text, expected[:max_chars]))
+
+    total_seconds = sum(samples) / 1000
+    total_bytes = sum(len(html) for _, html, _ in pages) * runs
+    samples.sort()
+    result = {
+        "pages_per_second": len(samples) / total_seconds if total_seconds else 0.0,
+        "mb_per_second": total_bytes / 1e6 / total_seconds if total_seconds else 0.0,
+        "p50_ms": statistics.median(samples),
+        "p95_ms": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+    }
+    if quality:
+        result["precision"] = statistics.mean(q[0] for q in quality)
+        result["recall"] = statistics.mean(q[1] for q in quality)
+        result["f1"] = statistics.mean(q[2] for q in quality)
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--corpus", help="Directory of saved .html pages (optional .txt expected text)")
+    parser.add_argument("--synthetic", type=int, default=200, help="Generated pages when no corpus is given")
+    parser.add_argument("--save-corpus", help="Write the generated pages and expected text here")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", default="benchmark_article_extraction.json")
+    args = parser.parse_args()
+
+    try:
+        if args.corpus:
+            pages = load_corpus(Path(args.corpus))
+            if not pages:
+                logger.error(f"No .html pages in {args.corpus}")
+                return 1
+        else:
+            rng = random.Random(args.seed)
+            pages = []
+            for i in range(args.synthetic):
+                html, expected = synthetic_page(rng)
+                pages.append((f"page_{i:04d}.html", html, expected))
+            if args.save_corpus:
+                out = Path(args.save_corpus)
+                out.mkdir(parents=True, exist_ok=True)
+                for name, html, expected in pages:
+                    (out / name).write_bytes(html)
+                    (out / name).with_suffix(".txt").write_text(expected, encoding="utf-8")
+
+        logger.info(f"Extractors: {', '.join(EXTRACTORS)}; {len(pages)} pages x {args.runs} runs")
+        results = {name: measure(extract, pages, args.runs, ARTICLE_MAX_CHARS) for name, extract in EXTRACTORS.items()}
+
+        print("\n" + "=" * 100)
+        print(f"ARTICLE EXTRACTION BENCHMARK ({len(pages)} pages, {args.runs} runs)")
+        print("=" * 100)
+        for name, r in results.items():
+            quality = (f"  P {r['precision']:.3f}  R {r['recall']:.3f}  F1 {r['f1']:.3f}"
+                       if "f1" in r else "")
+            print(f"{name:8s} {r['pages_per_second']:8.1f} pages/s  {r['mb_per_second']:6.2f} MB/s  "
+                  f"p50 {r['p50_ms']:7.2f} ms  p95 {r['p95_ms']:7.2f} ms{quality}")
+        if "soup" in results and len(results) > 1:
+            for name, r in results.items():
+                if name != "soup":
+                    print(f"{name} vs soup: {r['pages_per_second'] / results['soup']['pages_per_second']:.1f}x throughput")
+
+        with open(args.output, "w") as f:
+            json.dump({"pages": len(pages), "runs": args.runs, "results": results}, f, indent=2)
+        print(f"\nReport written to {args.output}")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Benchmark failed: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Replay - Replay an ingest log through exact fingerprint dedup
+and the news-feed near-duplicate index (services/news-feed/near_dup.py),
+and report how many reviewer calls each stage leaves.
+
+Usage:
+    # Recorded ingest log: one JSON object per line with title, summary, link,
+    # feed and optionally story (ground-truth story id for accuracy figures)
+    REDIS_URL=redis://localhost:6379/0 \
+        python Tests/Current/benchmark_near_duplicates.py --log ingest.jsonl
+
+    # Generated log of syndicated stories with edited titles and leads
+    REDIS_URL=redis://localhost:6379/0 \
+        python Tests/Current/benchmark_near_duplicates.py --stories 500 --copies 4
+
+The index lives under a scratch key prefix that is deleted afterwards.
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List
+
+import redis
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "services" / "news-feed"))
+
+from near_dup import NearDuplicateIndex, near_dup_text, NEAR_DUP_THRESHOLD  # noqa: E402
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+WORDS = (
+    "government announces plan cut emissions energy prices rise markets react central bank "
+    "interest rates inflation report shows growth slows company shares jump after earnings "
+    "beat expectations court rules appeal election results city council votes new housing "
+    "policy storm hits coast thousands without power scientists discover health study finds "
+    "tech firm launches product regulators investigate merger talks union strike ends deal"
+).split()
+SOURCES = ["Reuters", "AP", "AFP", "BBC", "Bloomberg"]
+
+
+def _edit(words: List[str], rng: random.Random, edits: int) -> List[str]:
+    words = list(words)
+    for _ in range(edits):
+        action = rng.random()
+        position = rng.randrange(len(words))
+        if action < 0.4 and len(words) > 4:
+            words.pop(position)
+        elif action < 0.7:
+            words.insert(position, rng.choice(WORDS))
+        else:
+            words[position] = rng.choice(WORDS)
+    return words
+
+
+def synthetic_log(stories: int, copies: int, repolls: float, seed: int) -> List[Dict[str, Any]]:
+    """Stories syndicated to several feeds with small title/lead edits, plus re-polled items."""
+    rng = random.Random(seed)
+    log = []
+    for story in range(stories):
+        title = [rng.choice(WORDS) for _ in range(rng.randint(7, 12))]
+        lead = [rng.choice(WORDS) for _ in range(rng.randint(30, 50))]
+        for copy in range(rng.randint(1, copies)):
+            edited_title = _edit(title, rng, rng.randint(0, 2))
+            if rng.random() < 0.3:
+                edited_title.append(f"- {rng.choice(SOURCES)}")
+            log.append({
+                "feed": f"feed-{rng.randint(1, 40)}",
+                "link": f"https://site-{copy}.example.com/{story}/{uuid.uuid4().hex[:8]}",
+                "title": " ".join(edited_title).capitalize(),
+                "summary": " ".join(_edit(lead, rng, rng.randint(0, 4))),
+                "story": story,
+            })
+    rng.shuffle(log)
+    # Items seen again on a later poll of the same feed
+    log.extend(dict(item) for item in rng.sample(log, int(len(log) * repolls)))
+    return log
+
+
+def replay(log: List[Dict[str, Any]], index: NearDuplicateIndex, batch_size: int) -> Dict[str, Any]:
+    seen_fingerprints = set()
+    exact_survivors = 0
+    representative_story: Dict[str, Any] = {}
+    clustered = wrong_merges = missed = 0
+    stories_with_rep = set()
+    elapsed = 0.0
+
+    for start in range(0, len(log), batch_size):
+        batch = []
+        for item in log[start:start + batch_size]:
+            fingerprint = hashlib.sha256(f"{item['link']}|{item['title']}|".encode()).hexdigest()
+            if fingerprint in seen_fingerprints:
+                continue
+            seen_fingerprints.add(fingerprint)
+            batch.append((str(uuid.uuid4()), item))
+        exact_survivors += len(batch)
+
+        started = time.perf_counter()
+        texts = [(article_id, near_dup_text(item)) for article_id, item in batch]
+        clusters = index.assign(texts)
+        # news-feed indexes representatives once their rows are committed
+        index.add_representatives([(article_id, text) for article_id, text in texts if clusters[article_id] is None])
+        elapsed += time.perf_counter() - started
+
+        for article_id, item in batch:
+            story = item.get("story")
+            representative = clusters[article_id]
+            if representative is None:
+                representative_story[article_id] = story
+                if story is not None and story in stories_with_rep:
+                    missed += 1
+                stories_with_rep.add(story)
+            else:
+                clustered += 1
+                if story is not None and representative_story.get(representative) != story:
+                    wrong_merges += 1
+
+    return {
+        "log_entries": len(log),
+        "reviewer_calls_exact_dedup": exact_survivors,
+        "reviewer_calls_near_dup": exact_survivors - clustered,
+        "reduction_pct": 100.0 * clustered / exact_survivors if exact_survivors else 0.0,
+        "wrong_merges": wrong_merges,
+        "missed_duplicates": missed,
+        "ms_per_article": 1000 * elapsed / exact_survivors if exact_survivors else 0.0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--log", help="JSONL ingest log to replay")
+    parser.add_argument("--stories", type=int, default=500)
+    parser.add_argument("--copies", type=int, default=4, help="Max syndicated copies per generated story")
+    parser.add_argument("--repolls", type=float, default=0.2, help="Share of generated items polled twice")
+    parser.add_argument("--batch-size", type=int, default=50, help="Entries per simulated feed poll")
+    parser.add_argument("--threshold", type=float, default=NEAR_DUP_THRESHOLD)
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--prefix", default="bench:near_dup")
+    parser.add_argument("--output", default="benchmark_near_duplicates.json")
+    args = parser.parse_args()
+
+    client = redis.Redis.from_url(REDIS_URL, decode_responses=True)
+    try:
+        if args.log:
+            with open(args.log) as f:
+                log = [json.loads(line) for line in f if line.strip()]
+        else:
+            log = synthetic_log(args.stories, args.copies, args.repolls, args.seed)
+
+        index = NearDuplicateIndex(client, prefix=args.prefix, threshold=args.threshold)
+        result = replay(log, index, args.batch_size)
+
+        print("\n" + "=" * 100)
+        print(f"NEAR-DUPLICATE REPLAY ({result['log_entries']:,} log entries, threshold {args.threshold})")
+        print("=" * 100)
+        print(f"Reviewer calls, exact fingerprint dedup only: {result['reviewer_calls_exact_dedup']:,}")
+        print(f"Reviewer calls, with near-duplicate clusters: {result['reviewer_calls_near_dup']:,} "
+              f"({result['reduction_pct']:.1f}% fewer)")
+        print(f"Wrong merges: {result['wrong_merges']}  Missed duplicates: {result['missed_duplicates']}")
+        print(f"Index cost: {result['ms_per_article']:.3f} ms per article")
+
+        with open(args.output, "w") as f:
+            json.dump({"threshold": args.threshold, "results": result}, f, indent=2)
+        print(f"\nReport written to {args.output}")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Replay failed: {e}")
+        return 1
+    finally:
+        keys = list(client.scan_iter(f"{args.prefix}:*"))
+        if keys:
+            client.delete(*keys)
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Review Batching Benchmark - Compare the light reviewer's single-item path
+(one Ollama call per article, /review) with the micro-batched path (one call
+per batch of articles, /review-batch) for tokens per article and articles
+per second.
+
+Usage:
+    # Local stub model: token counts from a simple tokenizer, latency from a
+    # per-call overhead plus prefill and decode cost per token
+    python Tests/Current/benchmark_review_batching.py --articles 200 --batch-size 8
+
+    # A real Ollama server (token counts are the model's own)
+    python Tests/Current/benchmark_review_batching.py --ollama-url http://localhost:11434
+
+The stub serves one request at a time, like a CPU Ollama instance with
+OLLAMA_NUM_PARALLEL=1. With --skip-rate it leaves out some batch answers so
+the per-item fallback is exercised.
+"""
+import argparse
+import asyncio
+import importlib.util
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+WORDS = (
+    "government announces plan cut emissions energy prices rise markets react central bank "
+    "interest rates inflation report shows growth slows company shares jump after earnings "
+    "beat expectations court rules appeal election results city council votes new housing "
+    "policy storm hits coast thousands without power scientists discover health study finds "
+    "tech firm launches product regulators investigate merger talks union strike ends deal"
+).split()
+
+_TOKEN = re.compile(r"\w+|[^\w\s]")
+_ARTICLE = re.compile(r"^\[(\d+)\]\nTitle: (.*)$", re.MULTILINE)
+_SINGLE_TITLE = re.compile(r"Now analyze this article:\nTitle: (.*)$", re.MULTILINE)
+
+
+def count_tokens(text: str) -> int:
+    return len(_TOKEN.findall(text))
+
+
+def stub_answer(title: str) -> str:
+    words = title.lower().split()
+    return f"TAGS: {', '.join(words[:3])}\nSUMMARY: {title}\nCONFIDENCE: 0.8"
+
+
+class StubModel:
+    """Answers /api/generate prompts of both light reviewer paths, one request at a time."""
+
+    def __init__(self, overhead_ms: float, prefill_ms: float, decode_ms: float, skip_rate: float, seed: int):
+        self.overhead_ms = overhead_ms
+        self.prefill_ms = prefill_ms
+        self.decode_ms = decode_ms
+        self.skip_rate = skip_rate
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def generate(self, prompt: str) -> Dict[str, Any]:
+        batch = _ARTICLE.findall(prompt)
+        if batch:
+            answers = [
+                f"[{number}]\n{stub_answer(title)}"
+                for number, title in batch if self.rng.random() >= self.skip_rate
+            ]
+            # The prompt already ends with "[1]"
+            response = "\n\n".join(answers)
+            if response.startswith("[1]\n"):
+                response = response[len("[1]\n"):]
+        else:
+            match = _SINGLE_TITLE.search(prompt)
+            response = stub_answer(match.group(1) if match else "")
+        prompt_tokens, completion_tokens = count_tokens(prompt), count_tokens(response)
+        with self.lock:
+            time.sleep((self.overhead_ms + self.prefill_ms * prompt_tokens + self.decode_ms * completion_tokens) / 1000.0)
+        return {"response": response, "prompt_eval_count": prompt_tokens, "eval_count": completion_tokens}
+
+
+def serve_stub(model: StubModel) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            payload = json.dumps(model.generate(body["prompt"])).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def load_light_reviewer(ollama_url: str):
+    """services/light-reviewer/main.py, pointed at ``ollama_url``."""
+    os.environ["OLLAMA_BASE_URL"] = ollama_url
+    spec = importlib.util.spec_from_file_location("light_reviewer_main", REPO_ROOT / "services" / "light-reviewer" / "main.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    logging.getLogger("light_reviewer_main").setLevel(logging.WARNING)
+    return module
+
+
+def synthetic_articles(count: int, seed: int) -> List[Dict[str, str]]:
+    rng = random.Random(seed)
+    articles = []
+    for i in range(count):
+        title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(7, 12))).capitalize()
+        content = ". ".join(
+            " ".join(rng.choice(WORDS) for _ in range(rng.randint(10, 20))).capitalize()
+            for _ in range(rng.randint(6, 12))
+        )
+        articles.append({
+            "feed_id": f"feed-{i % 20}",
+            "title": title,
+            "url": f"https://example.com/{i}",
+            "content": content,
+            "published": "",
+        })
+    return articles
+
+
+async def run_path(module, articles: List[Dict[str, str]], batch_size: int, concurrency: int) -> Dict[str, Any]:
+    reviewer = module.LightReviewer()
+    requests = [module.FeedReviewRequest(**article) for article in articles]
+    chunks = [requests[i:i + batch_size] for i in range(0, len(requests), batch_size)]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def review(chunk):
+        async with semaphore:
+            if batch_size == 1:
+                return [await reviewer.review_feed(chunk[0])]
+            return await reviewer.review_feed_batch(chunk)
+
+    started = time.perf_counter()
+    results = [result for chunk_results in await asyncio.gather(*(review(c) for c in chunks)) for result in chunk_results]
+    elapsed = time.perf_counter() - started
+    await reviewer.ollama_client.client.aclose()
+
+    tokens = {"calls": 0, "articles": 0, "prompt_tokens": 0, "completion_tokens": 0}
+    for stats in reviewer.token_stats.values():
+        for key in tokens:
+            tokens[key] += stats[key]
+    return {
+        "batch_size": batch_size,
+        "articles": len(results),
+        "ollama_calls": tokens["calls"],
+        "prompt_tokens_per_article": tokens["prompt_tokens"] / len(results),
+        "completion_tokens_per_article": tokens["completion_tokens"] / len(results),
+        "articles_per_second": len(results) / elapsed,
+        "missing_answers": reviewer.batch_stats["missing_items"],
+        "fallback_results": sum(1 for r in results if r.confidence == 0.0),
+        "summaries": [r.summary for r in results],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--ollama-url", help="Real Ollama server (default: local stub model)")
+    parser.add_argument("--articles", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=4, help="Calls in flight (reviewer REVIEW_CONCURRENCY)")
+    parser.add_argument("--overhead-ms", type=float, default=30.0, help="Stub: fixed cost per call")
+    parser.add_argument("--prefill-ms", type=float, default=0.5, help="Stub: cost per prompt token")
+    parser.add_argument("--decode-ms", type=float, default=8.0, help="Stub: cost per generated token")
+    parser.add_argument("--skip-rate", type=float, default=0.0, help="Stub: share of batch answers left out")
+    parser.add_argument("--seed", type=int, default=5)
+    parser.add_argument("--output", default="benchmark_review_batching.json")
+    args = parser.parse_args()
+
+    server = None
+    try:
+        if args.ollama_url:
+            ollama_url = args.ollama_url
+        else:
+            model = StubModel(args.overhead_ms, args.prefill_ms, args.decode_ms, args.skip_rate, args.seed)
+            server = serve_stub(model)
+            ollama_url = f"http://127.0.0.1:{server.server_address[1]}"
+        module = load_light_reviewer(ollama_url)
+        articles = synthetic_articles(args.articles, args.seed)
+
+        single = asyncio.run(run_path(module, articles, 1, args.concurrency))
+        batched = asyncio.run(run_path(module, articles, args.batch_size, args.concurrency))
+        matching = sum(1 for a, b in zip(single.pop("summaries"), batched.pop("summaries")) if a == b)
+
+        print("\n" + "=" * 100)
+        print(f"REVIEW BATCHING BENCHMARK ({args.articles} articles, {'Ollama' if args.ollama_url else 'stub model'}, "
+              f"concurrency {args.concurrency})")
+        print("=" * 100)
+        for name, r in (("single", single), (f"batch x{args.batch_size}", batched)):
+            print(f"{name:10s} {r['ollama_calls']:5d} calls  {r['prompt_tokens_per_article']:7.1f} prompt tok/article  "
+                  f"{r['completion_tokens_per_article']:5.1f} completion tok/article  "
+                  f"{r['articles_per_second']:7.2f} articles/s  fallbacks {r['fallback_results']}")
+        print(f"Prompt tokens per article: {1 - batched['prompt_tokens_per_article'] / single['prompt_tokens_per_article']:.1%} fewer; "
+              f"throughput x{batched['articles_per_second'] / single['articles_per_second']:.2f}")
+        print(f"Batch answers missing (reviewed singly): {batched['missing_answers']}; "
+              f"summaries matching the single path: {matching}/{args.articles}")
+
+        with open(args.output, "w") as f:
+            json.dump({"single": single, "batch": batched, "matching_summaries": matching}, f, indent=2)
+        print(f"\nReport written to {args.output}")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Benchmark failed: {e}")
+        return 1
+    finally:
+        if server is not None:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Content Cache Tests - canonical_url (services/news-feed/content_cache.py)
+must map the same page linked with different tracking tags to one key and
+keep pages that differ.
+
+Usage:
+    python -m pytest Tests/Current/test_content_cache.py -q
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "services" / "news-feed"))
+
+from content_cache import canonical_url  # noqa: E402
+
+
+@pytest.mark.parametrize("url", [
+    "https://example.com/story?id=7&page=2",
+    "HTTPS://Example.COM/story?page=2&id=7",
+    "https://example.com:443/story?id=7&page=2#comments",
+    "https://example.com/story?utm_source=rss&id=7&utm_medium=feed&page=2&fbclid=abc",
+    "  https://example.com/story?page=2&id=7&UTM_Campaign=x&ref=home&pk_kwd=y  ",
+])
+def test_tracking_variants_share_a_key(url):
+    assert canonical_url(url) == "https://example.com/story?id=7&page=2"
+
+
+def test_default_and_custom_ports():
+    assert canonical_url("http://example.com:80/a") == "http://example.com/a"
+    assert canonical_url("http://example.com:8080/a") == "http://example.com:8080/a"
+    assert canonical_url("https://example.com:80/a") == "https://example.com:80/a"
+
+
+def test_empty_path_becomes_root():
+    assert canonical_url("https://example.com") == "https://example.com/"
+
+
+def test_different_pages_stay_distinct():
+    assert canonical_url("https://example.com/a?id=1") != canonical_url("https://example.com/a?id=2")
+    assert canonical_url("https://example.com/a") != canonical_url("https://example.com/A")
+    assert canonical_url("https://example.com/a?flag=") == "https://example.com/a?flag="
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
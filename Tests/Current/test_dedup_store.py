@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Dedup Store Tests - Bucket keys of the fingerprint store
+(services/news-feed/dedup_store.py) must roll over with time, so a
+fingerprint stays visible for DEDUP_TTL and then ages out with its bucket.
+
+Usage:
+    python -m pytest Tests/Current/test_dedup_store.py -q
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "services" / "news-feed"))
+
+from dedup_store import FingerprintStore  # noqa: E402
+
+DAY = 86400
+
+
+def make_store(ttl_seconds: int = 3 * DAY, bucket_seconds: int = DAY, fingerprint_hex: int = 16) -> FingerprintStore:
+    return FingerprintStore(None, prefix="fp", ttl_seconds=ttl_seconds,
+                            bucket_seconds=bucket_seconds, fingerprint_hex=fingerprint_hex)
+
+
+def test_current_bucket_first_and_enough_buckets_for_ttl():
+    keys = make_store()._bucket_keys(10 * DAY + 5)
+    assert keys == ["fp:10", "fp:9", "fp:8", "fp:7"]
+
+
+def test_bucket_rolls_over_at_boundary():
+    store = make_store()
+    assert store._bucket_keys(11 * DAY - 1)[0] == "fp:10"
+    assert store._bucket_keys(11 * DAY)[0] == "fp:11"
+
+
+def test_bucket_stays_live_for_ttl_after_it_closes():
+    store = make_store()
+    # Written at the end of bucket 10, which closes at 11 * DAY and expires 3 days later
+    assert "fp:10" in store._bucket_keys(14 * DAY - 1)
+    assert "fp:10" not in store._bucket_keys(15 * DAY)
+
+
+def test_ttl_not_a_multiple_of_bucket_keeps_partial_bucket():
+    keys = make_store(ttl_seconds=DAY + DAY // 2)._bucket_keys(10 * DAY)
+    assert keys == ["fp:10", "fp:9", "fp:8"]
+
+
+def test_fingerprint_width_is_clamped_and_used_for_lookups():
+    assert make_store(fingerprint_hex=4).fingerprint_hex == 8
+    assert make_store(fingerprint_hex=128).fingerprint_hex == 64
+    assert make_store(fingerprint_hex=10)._short("0123456789abcdef") == "0123456789"
+
+
+def test_false_positive_rate_grows_with_entries_and_shrinks_with_width():
+    narrow, wide = make_store(fingerprint_hex=8), make_store(fingerprint_hex=16)
+    assert narrow.estimated_false_positive_rate(0) == 0.0
+    assert narrow.estimated_false_positive_rate(1_000_000) > narrow.estimated_false_positive_rate(1_000)
+    assert wide.estimated_false_positive_rate(20_000_000) < 1e-11
+    assert narrow.estimated_false_positive_rate(16 ** 8) == pytest.approx(1 - 1 / 2.718281828, rel=1e-6)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
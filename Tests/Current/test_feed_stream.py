@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Feed Stream Tests - The incremental parser (services/news-feed/feed_stream.py)
+must read the same entries as feedparser, and stop early only on
+newest-first feeds.
+
+Usage:
+    python -m pytest Tests/Current/test_feed_stream.py -q
+"""
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import feedparser
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "services" / "news-feed"))
+
+from feed_stream import ParseError, iter_feed_entries, parse_incremental  # noqa: E402
+
+RSS2 = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Example</title>
+<item><title>With link</title><link>https://example.com/a</link>
+  <guid>https://example.com/guid-a</guid><description>First item</description>
+  <pubDate>Tue, 10 Jun 2025 09:41:01 +0200</pubDate></item>
+<item><title>Guid only</title><guid>https://example.com/b</guid>
+  <description>Second item</description><pubDate>Mon, 09 Jun 2025 08:00:00 GMT</pubDate></item>
+<item><title>Guid not a permalink</title><guid isPermaLink="false">tag-c</guid>
+  <description>Third item</description></item>
+</channel></rss>"""
+
+RSS1 = b"""<?xml version="1.0"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" xmlns="http://purl.org/rss/1.0/"
+         xmlns:dc="http://purl.org/dc/elements/1.1/">
+<channel rdf:about="https://example.com/"><title>Example</title></channel>
+<item rdf:about="https://example.com/r1"><title>RDF one</title><link>https://example.com/r1</link>
+  <description>One</description><dc:date>2025-06-10T07:41:01Z</dc:date></item>
+</rdf:RDF>"""
+
+ATOM = b"""<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Example</title>
+<entry><title>Alternate link</title><link rel="self" href="https://example.com/self"/>
+  <link href="https://example.com/e1"/><id>urn:uuid:1</id><summary>Entry one</summary>
+  <updated>2025-06-10T07:41:01Z</updated></entry>
+<entry><title>Id only</title><id>https://example.com/e2</id><summary>Entry two</summary>
+  <published>2025-06-09T07:00:00+01:00</published></entry>
+</feed>"""
+
+
+def feedparser_entries(content: bytes):
+    """Entries as NewsFeedProcessor.parse_rss_content builds them from feedparser."""
+    entries = []
+    for entry in feedparser.parse(content).entries:
+        parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+        entries.append({
+            "title": entry.get("title", ""),
+            "link": entry.get("link") or "",
+            "summary": entry.get("summary", "") or entry.get("description", ""),
+            "publish_date": datetime(*parsed[:6]) if parsed else None,
+        })
+    return entries
+
+
+def incremental_entries(content: bytes):
+    entries, _ = parse_incremental(content, lambda links: set())
+    return [{key: entry[key] for key in ("title", "link", "summary", "publish_date")} for entry in entries]
+
+
+@pytest.mark.parametrize("document", [RSS2, RSS1, ATOM], ids=["rss2", "rss1", "atom"])
+def test_matches_feedparser(document):
+    assert incremental_entries(document) == feedparser_entries(document)
+
+
+def test_guid_permalink_is_the_link():
+    links = [entry["link"] for entry in iter_feed_entries(RSS2)]
+    assert links == ["https://example.com/a", "https://example.com/b", ""]
+
+
+def test_rss1_item_without_link_uses_rdf_about():
+    document = RSS1.replace(b"<link>https://example.com/r1</link>", b"")
+    assert [entry["link"] for entry in iter_feed_entries(document)] == ["https://example.com/r1"]
+
+
+def _numbered_feed(count: int, newest_first: bool = True) -> bytes:
+    days = range(count, 0, -1) if newest_first else range(1, count + 1)
+    items = "".join(
+        f"<item><title>Item {day}</title><link>https://example.com/{day}</link>"
+        f"<pubDate>{datetime(2025, 1, 1 + day % 28, day % 24).strftime('%a, %d %b %Y %H:%M:%S')} GMT</pubDate></item>"
+        for day in days
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>{items}</channel></rss>'.encode()
+
+
+def test_stops_after_run_of_known_entries():
+    document = _numbered_feed(100)
+    known = {f"https://example.com/{day}" for day in range(1, 98)}  # all but the 3 newest
+    entries, stats = parse_incremental(document, lambda links: known & set(links), stop_after=5, chunk_size=10)
+    assert stats["stopped_early"]
+    assert stats["parsed"] == 10
+    assert [entry["link"] for entry in entries[:3]] == [f"https://example.com/{day}" for day in (100, 99, 98)]
+
+
+def test_no_early_stop_on_oldest_first_feed():
+    document = _numbered_feed(30, newest_first=False)
+    known = {f"https://example.com/{day}" for day in range(1, 31)}
+    entries, stats = parse_incremental(document, lambda links: known & set(links), stop_after=5, chunk_size=10)
+    assert not stats["stopped_early"]
+    assert len(entries) == 30
+
+
+def test_malformed_document_raises_parse_error():
+    with pytest.raises(ParseError):
+        parse_incremental(b"<rss><channel><item></channel>", lambda links: set())
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Fetch Engine Tests - The concurrent feed sweep (services/news-feed/fetch_engine.py
+run_sweep) must report failed feeds as errors, whether the feed's fetch
+reports the failure or raises it. The per-host TokenBucket, CircuitBreaker
+and OutboundPolicy.guard must rate limit, open, probe and close as documented.
+
+Usage:
+    python -m pytest Tests/Current/test_fetch_engine.py -q
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "services" / "news-feed"))
+
+from fetch_engine import (  # noqa: E402
+    CircuitBreaker, CircuitOpenError, OutboundPolicy, TokenBucket, is_host_failure, run_sweep
+)
+
+FEEDS = [
+    {"id": "ok", "url": "https://good.example/rss"},
+    {"id": "unchanged", "url": "https://good.example/atom"},
+    {"id": "reported", "url": "https://down.example/rss"},
+    {"id": "raised", "url": "https://broken.example/feed"},
+]
+
+
+async def fetch_one(feed_id):
+    if feed_id == "ok":
+        return {"entries": 5, "new_articles": 2}
+    if feed_id == "unchanged":
+        return {"entries": 0, "new_articles": 0, "status": "not_modified"}
+    if feed_id == "reported":
+        return {"entries": 0, "new_articles": 0, "status": "error", "error": "503 Service Unavailable"}
+    raise RuntimeError("connection reset")
+
+
+@pytest.fixture(scope="module")
+def sweep():
+    return asyncio.run(run_sweep(FEEDS, fetch_one, concurrency=2, per_host=1))
+
+
+def test_summary_counts_failed_feeds(sweep):
+    summary = sweep["summary"]
+    assert (summary["feeds"], summary["ok"], summary["unchanged"], summary["errors"]) == (4, 1, 1, 2)
+    assert summary["error_hosts"] == ["broken.example", "down.example"]
+    assert summary["new_articles"] == 2
+
+
+def test_per_feed_results_carry_the_error(sweep):
+    by_id = {report["feed_id"]: report for report in sweep["feeds"]}
+    assert by_id["reported"]["status"] == "error"
+    assert by_id["reported"]["error"] == "503 Service Unavailable"
+    assert by_id["raised"]["status"] == "error"
+    assert by_id["raised"]["error"] == "connection reset"
+    assert by_id["ok"]["status"] == "ok"
+
+
+URL = "https://flaky.example/rss"
+
+
+def status_error(status):
+    request = httpx.Request("GET", URL)
+    return httpx.HTTPStatusError(str(status), request=request, response=httpx.Response(status, request=request))
+
+
+def expire(breaker):
+    """Pretend the breaker's reset period has passed."""
+    breaker.opened_at -= breaker.reset_seconds
+
+
+async def request(policy, error=None):
+    """One guarded request to URL that raises ``error``; returns the guard's own error, if any."""
+    try:
+        async with policy.guard(URL):
+            if error is not None:
+                raise error
+    except Exception as e:
+        return e
+    return None
+
+
+def test_breaker_opens_after_threshold_failures():
+    breaker = CircuitBreaker(failure_threshold=3, reset_seconds=60)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.opens == 1
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("flaky.example")
+
+
+def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=60)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_lets_one_probe_through():
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=60)
+    breaker.record_failure()
+    expire(breaker)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.before_request("flaky.example")
+    assert not breaker.allows_request()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("flaky.example")
+
+
+def test_failed_probe_reopens_and_successful_probe_closes():
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=60)
+    breaker.record_failure()
+    expire(breaker)
+    breaker.before_request("flaky.example")
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.opens == 2
+
+    expire(breaker)
+    breaker.before_request("flaky.example")
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allows_request()
+
+
+def test_host_failures_are_429_5xx_and_transport_errors():
+    assert not is_host_failure(status_error(404))
+    assert is_host_failure(status_error(429))
+    assert is_host_failure(status_error(503))
+    assert is_host_failure(httpx.ConnectError("connection refused"))
+
+
+def test_guard_counts_host_failures_only():
+    async def scenario():
+        policy = OutboundPolicy(rate=0, burst=1, failure_threshold=2, reset_seconds=60)
+        for _ in range(3):
+            await request(policy, status_error(404))
+        assert policy.host("flaky.example").breaker.state == CircuitBreaker.CLOSED
+
+        await request(policy, status_error(500))
+        await request(policy, httpx.ReadTimeout("timed out"))
+        assert policy.is_open(URL)
+        assert isinstance(await request(policy), CircuitOpenError)
+        return policy.totals()
+
+    totals = asyncio.run(scenario())
+    assert (totals["requests"], totals["failures"], totals["rejected"], totals["open"]) == (5, 2, 1, 1)
+
+
+def test_cancelled_probe_is_released():
+    async def scenario():
+        policy = OutboundPolicy(rate=0, burst=1, failure_threshold=1, reset_seconds=60)
+        await request(policy, status_error(502))
+        breaker = policy.host("flaky.example").breaker
+        expire(breaker)
+
+        entered = asyncio.Event()
+
+        async def hanging_probe():
+            async with policy.guard(URL):
+                entered.set()
+                await asyncio.Event().wait()
+
+        probe = asyncio.create_task(hanging_probe())
+        await entered.wait()
+        assert not breaker.allows_request()
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+        return breaker
+
+    breaker = asyncio.run(scenario())
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allows_request()
+
+
+def test_bucket_wait_grows_with_queued_acquirers():
+    async def scenario():
+        bucket = TokenBucket(rate=100, burst=1)
+        return await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+
+    waits = asyncio.run(scenario())
+    assert waits[0] == 0.0
+    assert waits[1] < waits[2] < waits[3]
+    assert waits[3] == pytest.approx(0.03, abs=0.005)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Tests - MinHash signatures and LSH cluster assignment
+(services/news-feed/near_dup.py): edited copies of a story join the first
+article's cluster, unrelated stories start their own.
+
+Usage:
+    python -m pytest Tests/Current/test_near_dup.py -q
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "services" / "news-feed"))
+
+from near_dup import (  # noqa: E402
+    BANDS, NUM_HASHES, NearDuplicateIndex, band_hashes, min_shared_bands, minhash, near_dup_text,
+)
+
+STORY = ("Central bank raises interest rates by half a point as inflation stays high. "
+         "The central bank raised its main interest rate by half a percentage point on Tuesday, "
+         "saying inflation remained well above its target and the labour market was still tight.")
+EDITED = ("Central bank raises interest rates by half a point as inflation stays high - Reuters. "
+          "The central bank raised its main interest rate by half a percentage point on Tuesday, "
+          "saying inflation remained well above its target and the labor market was still tight.")
+OTHER = ("Storm leaves thousands without power along the coast. Heavy winds brought down lines "
+         "overnight and crews expect repairs to take several days in the worst hit towns.")
+
+
+class EmptyIndex:
+    """Redis stand-in for an index with no stored representatives (pipelined reads only)."""
+
+    def pipeline(self, transaction=False):
+        return self
+
+    def zrangebyscore(self, key, low, high):
+        self.calls = getattr(self, "calls", 0) + 1
+
+    def execute(self):
+        return [[] for _ in range(self.calls)]
+
+
+def estimated_similarity(a: str, b: str) -> float:
+    return sum(x == y for x, y in zip(minhash(a), minhash(b))) / NUM_HASHES
+
+
+def test_signature_is_deterministic_and_full_length():
+    assert minhash(STORY) == minhash(STORY)
+    assert len(minhash(STORY)) == NUM_HASHES
+    assert len(band_hashes(minhash(STORY))) == BANDS
+
+
+def test_edited_copy_is_similar_and_other_story_is_not():
+    assert estimated_similarity(STORY, EDITED) >= 0.6
+    assert estimated_similarity(STORY, OTHER) < 0.2
+
+
+def test_min_shared_bands():
+    assert min_shared_bands(0.6) == round(BANDS * 0.6 ** 4)
+    assert min_shared_bands(0.01) == 1
+
+
+def test_near_dup_text_strips_markup_and_cuts_lead():
+    text = near_dup_text({"title": "Title", "summary": "<p>Lead <b>text</b></p>" + "x" * 1000})
+    assert text.startswith("Title  Lead  text ")
+    assert "<" not in text
+    assert len(text) <= len("Title ") + 400
+
+
+def test_assign_clusters_within_batch_against_first_article():
+    index = NearDuplicateIndex(EmptyIndex())
+    clusters = index.assign([("a", STORY), ("b", OTHER), ("c", EDITED)])
+    assert clusters == {"a": None, "b": None, "c": "a"}
+    assert index.stats == {"checked": 3, "near_duplicates": 1}
+
+
+def test_assign_with_nothing_to_check():
+    assert NearDuplicateIndex(EmptyIndex()).assign([]) == {}
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Pagination Tests - Keyset cursors (shared/pagination.py) must round-trip
+and page through every row exactly once, including rows without a
+created_at.
+
+Usage:
+    python -m pytest Tests/Current/test_pagination.py -q
+"""
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Column, DateTime, Uuid, create_engine, select
+from sqlalchemy.orm import Session, declarative_base
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from shared.pagination import decode_cursor, encode_cursor, keyset_after, keyset_order, next_cursor  # noqa: E402
+
+Base = declarative_base()
+
+
+class Row(Base):
+    __tablename__ = "rows"
+    id = Column(Uuid, primary_key=True)
+    created_at = Column(DateTime)
+
+
+@pytest.mark.parametrize("created_at", [
+    datetime(2025, 6, 10, 7, 41, 1, 123456, tzinfo=timezone.utc),
+    datetime(2025, 6, 10, 7, 41, 1),
+    None,
+], ids=["aware", "naive", "null"])
+def test_cursor_round_trip(created_at):
+    row_id = uuid.uuid4()
+    token = encode_cursor(created_at, row_id)
+    assert "=" not in token
+    assert decode_cursor(token) == (created_at, row_id)
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", encode_cursor(None, "x")[:-2]])
+def test_malformed_cursor_raises_value_error(token):
+    with pytest.raises(ValueError):
+        decode_cursor(token)
+
+
+def test_next_cursor_only_for_full_pages():
+    rows = [Row(id=uuid.uuid4(), created_at=datetime(2025, 1, 1)) for _ in range(3)]
+    assert next_cursor(rows, 4) is None
+    assert next_cursor([], 4) is None
+    assert decode_cursor(next_cursor(rows, 3)) == (rows[-1].created_at, rows[-1].id)
+
+
+def test_pages_cover_every_row_once():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    start = datetime(2025, 1, 1)
+    with Session(engine) as db:
+        # Repeated timestamps and some rows without one
+        db.add_all(
+            Row(id=uuid.uuid4(), created_at=None if i % 5 == 0 else start + timedelta(hours=i % 7))
+            for i in range(53)
+        )
+        db.commit()
+
+        paged, cursor = [], None
+        while True:
+            query = select(Row)
+            if cursor:
+                query = query.where(keyset_after(Row.created_at, Row.id, cursor))
+            page = db.execute(query.order_by(*keyset_order(Row.created_at, Row.id)).limit(4)).scalars().all()
+            paged.extend(row.id for row in page)
+            cursor = next_cursor(page, 4)
+            if not cursor:
+                break
+
+        ordered = db.execute(select(Row.id).order_by(*keyset_order(Row.created_at, Row.id))).scalars().all()
+    assert paged == ordered
+    assert len(set(paged)) == 53
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Poll Scheduler Tests - Per-feed poll intervals and due-time heap
+(services/news-feed/poll_scheduler.py).
+
+Usage:
+    python -m pytest Tests/Current/test_poll_scheduler.py -q
+"""
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "services" / "news-feed"))
+
+from poll_scheduler import (  # noqa: E402
+    POLL_DEFAULT_SECONDS, POLL_JITTER, POLL_MAX_SECONDS, POLL_MIN_SECONDS, POLL_UNCHANGED_BACKOFF,
+    PollScheduler, compute_interval, jittered, publish_gap_seconds, retry_interval, update_unchanged_ratio,
+)
+
+NOW = datetime(2025, 6, 10, 12, 0, tzinfo=timezone.utc)
+
+
+def hourly(count: int):
+    return [NOW - timedelta(hours=i) for i in range(count)]
+
+
+def test_publish_gap_needs_two_gaps():
+    assert publish_gap_seconds(hourly(2)) is None
+    assert publish_gap_seconds(hourly(3)) == 3600
+    assert publish_gap_seconds([NOW, NOW, None, NOW - timedelta(hours=2), NOW - timedelta(hours=3)]) == 3600 * 1.5
+
+
+def test_interval_is_half_the_publish_gap():
+    assert compute_interval(hourly(10), 0.0, 0, None) == 1800
+
+
+def test_interval_without_history_keeps_previous_or_default():
+    assert compute_interval([], 0.0, 0, None) == POLL_DEFAULT_SECONDS
+    assert compute_interval([], 0.0, 0, 1200) == 1200
+
+
+def test_unchanged_feeds_back_off():
+    assert compute_interval(hourly(10), 1.0, 0, None) == min(1800 * POLL_UNCHANGED_BACKOFF, POLL_MAX_SECONDS)
+
+
+def test_new_articles_do_not_lengthen_interval():
+    assert compute_interval(hourly(10), 1.0, 3, 1000) == max(1000, POLL_MIN_SECONDS)
+
+
+def test_interval_is_clamped():
+    busy = [NOW - timedelta(seconds=10 * i) for i in range(10)]
+    assert compute_interval(busy, 0.0, 0, None) == POLL_MIN_SECONDS
+    quiet = [NOW - timedelta(days=30 * i) for i in range(10)]
+    assert compute_interval(quiet, 0.0, 0, None) == POLL_MAX_SECONDS
+
+
+def test_unchanged_ratio_ewma():
+    assert update_unchanged_ratio(None, True) == 1.0
+    assert update_unchanged_ratio(None, False) == 0.0
+    assert 0.0 < update_unchanged_ratio(0.0, True) < update_unchanged_ratio(0.5, True) < 1.0
+
+
+def test_retry_interval_doubles_up_to_max():
+    assert retry_interval(1) == POLL_MIN_SECONDS
+    assert retry_interval(2) == 2 * POLL_MIN_SECONDS
+    assert retry_interval(1000) == POLL_MAX_SECONDS
+
+
+def test_jitter_stays_within_bounds():
+    for _ in range(200):
+        offset = (jittered(NOW, 1000) - NOW).total_seconds()
+        assert 1000 * (1 - POLL_JITTER) <= offset <= 1000 * (1 + POLL_JITTER)
+
+
+def test_scheduler_pops_due_feeds_earliest_first():
+    scheduler = PollScheduler()
+    scheduler.schedule("late", NOW + timedelta(minutes=5))
+    scheduler.schedule("b", NOW - timedelta(minutes=1))
+    scheduler.schedule("a", NOW - timedelta(minutes=2))
+    assert scheduler.pop_due(NOW) == ["a", "b"]
+    assert "a" not in scheduler and "late" in scheduler
+    assert scheduler.next_due() == NOW + timedelta(minutes=5)
+
+
+def test_rescheduling_supersedes_earlier_entry():
+    scheduler = PollScheduler()
+    scheduler.schedule("a", NOW - timedelta(minutes=1))
+    scheduler.schedule("a", NOW + timedelta(minutes=1))
+    scheduler.remove("gone")
+    assert scheduler.pop_due(NOW) == []
+    assert len(scheduler) == 1
+    scheduler.remove("a")
+    assert scheduler.next_due() is None
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Review Queue Tests - A failed queue item (services/reviewer/main.py
+ReviewQueue) waits in the retry set until the promote script puts it back
+on the stream, goes to the dead-letter stream after REVIEW_MAX_ATTEMPTS,
+items left pending by a stalled consumer are reclaimed as failed
+attempts, and an article already enqueued is not queued twice. Runs
+against fakeredis (with Lua support for the promote script).
+
+Usage:
+    pip install "fakeredis[lua]"
+    python -m pytest Tests/Current/test_review_queue.py -q
+"""
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from services.reviewer import main as reviewer  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    """Three attempts, retries due at once, and any pending entry counts as stale."""
+    monkeypatch.setattr(reviewer, "REVIEW_MAX_ATTEMPTS", 3)
+    monkeypatch.setattr(reviewer, "retry_delay_seconds", lambda attempts: 0.0)
+    monkeypatch.setattr(reviewer, "REVIEW_CLAIM_IDLE_SECONDS", 0.0)
+
+
+async def new_queue(client=None, consumer="worker-1"):
+    client = client or fakeredis.FakeAsyncRedis(decode_responses=True)
+    queue = reviewer.ReviewQueue(client, key="test:queue", group="reviewers", consumer=consumer)
+    await queue.ensure_group()
+    return queue
+
+
+def test_failed_item_waits_for_promotion_then_is_redelivered():
+    async def run():
+        queue = await new_queue()
+        await queue.add([{"article_id": "article-1"}])
+        [(entry_id, payload)] = await queue.read()
+        outcome = await queue.fail(entry_id, payload, "light reviewer timed out")
+        after_fail = await queue.counts()
+        moved = await queue.promote_due_retries()
+        [(_, retried)] = await queue.read()
+        return outcome, after_fail, moved, json.loads(retried), await queue.counts()
+
+    outcome, after_fail, moved, item, after_promote = asyncio.run(run())
+    assert outcome == "retry"
+    assert after_fail == {"length": 0, "pending": 0, "retrying": 1, "dead": 0}
+    assert moved == 1
+    assert item == {"article_id": "article-1", "attempts": 1, "last_error": "light reviewer timed out"}
+    assert after_promote == {"length": 1, "pending": 1, "retrying": 0, "dead": 0}
+
+
+def test_item_is_dead_lettered_after_max_attempts():
+    async def run():
+        queue = await new_queue()
+        await queue.add([{"article_id": "article-1"}])
+        outcomes = []
+        for _ in range(3):
+            [(entry_id, payload)] = await queue.read()
+            outcomes.append(await queue.fail(entry_id, payload, "light reviewer returned 500"))
+            await queue.promote_due_retries()
+        dead = await queue.redis.xrange(queue.dead_key)
+        return outcomes, dead, await queue.counts(), queue.stats
+
+    outcomes, dead, counts, stats = asyncio.run(run())
+    assert outcomes == ["retry", "retry", "dead"]
+    assert counts == {"length": 0, "pending": 0, "retrying": 0, "dead": 1}
+    [(_, fields)] = dead
+    assert fields["attempts"] == "3"
+    assert fields["error"] == "light reviewer returned 500"
+    assert json.loads(fields["payload"])["article_id"] == "article-1"
+    assert (stats["retried"], stats["dead_lettered"]) == (2, 1)
+
+
+def test_unparseable_payload_is_dead_lettered_at_once():
+    async def run():
+        queue = await new_queue()
+        await queue.redis.xadd(queue.key, {"payload": "not json"})
+        [(entry_id, payload)] = await queue.read()
+        return await queue.fail(entry_id, payload, "bad payload"), await queue.counts()
+
+    outcome, counts = asyncio.run(run())
+    assert outcome == "dead"
+    assert counts == {"length": 0, "pending": 0, "retrying": 0, "dead": 1}
+
+
+def test_stale_pending_items_are_reclaimed_as_failed_attempts():
+    async def run():
+        client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        stalled = await new_queue(client, consumer="worker-1")
+        await stalled.add([{"article_id": "article-1"}, {"article_id": "article-2"}])
+        await stalled.read(count=2)
+
+        survivor = await new_queue(client, consumer="worker-2")
+        reclaimed = await survivor.reclaim_stale()
+        retries = await client.zrange(survivor.retry_key, 0, -1)
+        return reclaimed, [json.loads(r) for r in retries], await survivor.counts(), survivor.stats
+
+    reclaimed, retries, counts, stats = asyncio.run(run())
+    assert reclaimed == 2
+    assert sorted(item["article_id"] for item in retries) == ["article-1", "article-2"]
+    assert all(item["attempts"] == 1 for item in retries)
+    assert all("worker-1" in item["last_error"] for item in retries)
+    assert counts == {"length": 0, "pending": 0, "retrying": 2, "dead": 0}
+    assert stats["reclaimed"] == 2
+
+
+def test_articles_already_dispatched_are_not_queued_again():
+    async def run():
+        queue = await new_queue()
+        first = await queue.add_undispatched([{"article_id": "article-1"}, {"article_id": "article-2"}])
+        again = await queue.add_undispatched([{"article_id": "article-2"}, {"article_id": "article-3"}])
+        return first, again
+
+    first, again = asyncio.run(run())
+    assert first == (2, 2)
+    assert again == (1, 3)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
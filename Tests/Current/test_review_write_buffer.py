@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Review Write Buffer Tests - Queue review results (services/reviewer/main.py
+ReviewWriteBuffer) are stored in batches, and their stream entries are
+acked only after the batch is written, or failed when the write fails.
+
+Usage:
+    python -m pytest Tests/Current/test_review_write_buffer.py -q
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from services.reviewer import main as reviewer  # noqa: E402
+
+
+class RecordingQueue:
+    """Records acks and failures instead of touching the Redis stream."""
+
+    def __init__(self):
+        self.acked = []
+        self.failed = []
+
+    async def ack(self, entry_ids):
+        self.acked.extend(entry_ids)
+
+    async def fail(self, entry_id, payload, error):
+        self.failed.append(entry_id)
+
+
+@pytest.fixture
+def queue(monkeypatch):
+    recording = RecordingQueue()
+    monkeypatch.setattr(reviewer, "review_queue", recording)
+    return recording
+
+
+async def buffer_results(buffer, count):
+    """Add results one at a time, as queue workers do between reviews."""
+    for i in range(count):
+        buffer.add({"id": f"article-{i}"}, f"entry-{i}", "{}")
+        await asyncio.sleep(0)
+
+
+def test_results_are_written_in_batches_then_acked(monkeypatch, queue):
+    writes = []
+    monkeypatch.setattr(reviewer, "write_reviews", lambda rows: writes.append(len(rows)) or len(rows))
+
+    async def run():
+        buffer = reviewer.ReviewWriteBuffer(batch_size=8, interval_ms=10_000)
+        await buffer_results(buffer, 21)
+        await buffer.close()
+        return buffer
+
+    buffer = asyncio.run(run())
+    assert writes == [8, 8, 5]
+    assert queue.acked == [f"entry-{i}" for i in range(21)]
+    assert buffer.stats["flushes"] == 3 and buffer.stats["rows"] == 21
+
+
+def test_partial_batch_is_written_after_interval(monkeypatch, queue):
+    writes = []
+    monkeypatch.setattr(reviewer, "write_reviews", lambda rows: writes.append(len(rows)) or len(rows))
+
+    async def run():
+        buffer = reviewer.ReviewWriteBuffer(batch_size=8, interval_ms=20)
+        await buffer_results(buffer, 3)
+        await asyncio.sleep(0.1)
+        return len(buffer)
+
+    assert asyncio.run(run()) == 0
+    assert writes == [3]
+    assert len(queue.acked) == 3
+
+
+def test_failed_write_fails_every_entry_without_ack(monkeypatch, queue):
+    def broken(rows):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(reviewer, "write_reviews", broken)
+
+    async def run():
+        buffer = reviewer.ReviewWriteBuffer(batch_size=4, interval_ms=10_000)
+        await buffer_results(buffer, 4)
+        await buffer.close()
+        return buffer
+
+    buffer = asyncio.run(run())
+    assert queue.acked == []
+    assert queue.failed == [f"entry-{i}" for i in range(4)]
+    assert buffer.stats["failed_flushes"] == 1
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -55,4 +55,12 @@ celery.conf.beat_schedule = {
         "task": "app.tasks.send_articles_to_reviewer",
         "schedule": REVIEW_DISPATCH_INTERVAL_MINUTES * 60.0,
     },
+    "maintain-article-partitions": {
+        "task": "app.tasks.maintain_article_partitions",
+        "schedule": 6 * 60 * 60.0,  # Every 6 hours (no-op unless ARTICLES_PARTITIONING_ENABLED)
+    },
+    "reconcile-stats-rollup": {
+        "task": "app.tasks.reconcile_stats_rollup",
+        "schedule": 24 * 60 * 60.0,  # Daily; the triggers keep it current in between
+    },
 }
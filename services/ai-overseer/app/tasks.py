@@ -30,6 +30,7 @@ CADENCE_BUCKETS: List[Tuple[str, int]] = [
 ]
 
 MIN_FEEDS_THRESHOLD_DEFAULT = int(os.getenv("MIN_FEEDS_THRESHOLD", "3"))
+REVIEWER_SERVICE_URL = os.getenv("REVIEWER_SERVICE_URL", "http://reviewer:8008")
 
 def _get_ready_collections() -> List[Dict[str, Any]]:
     """Fetch ready collections from Collections Service.
@@ -269,36 +270,25 @@ def check_scheduled_groups():
 
 @celery.task
 def fetch_all_news_feeds():
-    """Fetch articles from all active news feeds."""
+    """Fetch articles from all due news feeds in one concurrent sweep on the News Feed service."""
     try:
         logger.info("Fetching news from all active feeds")
         
-        db = get_db_session()
-        try:
-            # Get all active news feeds
-            active_feeds = db.query(NewsFeed).filter(
-                NewsFeed.is_active == True
-            ).all()
-            
-            # Trigger fetch for each feed
-            for feed in active_feeds:
-                try:
-                    # Call news feed service to fetch articles
-                    async def fetch_feed():
-                        async with httpx.AsyncClient() as client:
-                            response = await client.post(
-                                f"http://news-feed:8001/feeds/{feed.id}/fetch"
-                            )
-                            response.raise_for_status()
-                    
-                    import asyncio
-                    asyncio.run(fetch_feed())
-                    
-                except Exception as e:
-                    logger.error(f"Error fetching feed {feed.id}: {e}")
-                    
-        finally:
-            db.close()
+        # The sweep runs to completion server-side; allow for slow hosts
+        timeout = float(os.getenv("FEED_SWEEP_TIMEOUT_SECONDS", "900"))
+        response = httpx.post("http://news-feed:8001/feeds/fetch-all", timeout=timeout)
+        if response.status_code == 409:
+            logger.info("Feed sweep already running, skipping")
+            return {"skipped": True}
+        response.raise_for_status()
+        
+        summary = response.json().get("summary", {})
+        logger.info(
+            f"Feed sweep finished: {summary.get('feeds', 0)} feeds, "
+            f"{summary.get('new_articles', 0)} new articles, {summary.get('errors', 0)} errors "
+            f"in {summary.get('elapsed_seconds', 0):.1f}s"
+        )
+        return summary
             
     except Exception as e:
         logger.error(f"Error in fetch_all_news_feeds task: {e}")
@@ -437,10 +427,13 @@ def send_articles_to_reviewer():
         
         db = get_db_session()
         try:
-            # Get unreviewed articles (limit to 50 per run)
+            # Get the newest unreviewed articles (limit to 50 per run). Newest first
+            # (ix_articles_unreviewed_created_at), so articles the reviewer skips as
+            # already queued, retrying or dead-lettered don't crowd out fresh ones.
             unreviewed_articles = db.query(Article).filter(
-                Article.reviewer_type.is_(None)  # Not yet reviewed
-            ).limit(50).all()
+                Article.reviewer_type.is_(None),  # Not yet reviewed
+                Article.near_duplicate_of.is_(None)  # Near-duplicates follow their representative
+            ).order_by(Article.created_at.desc()).limit(50).all()
             
             if not unreviewed_articles:
                 logger.info("No unreviewed articles found")
@@ -448,33 +441,31 @@ def send_articles_to_reviewer():
             
             logger.info(f"Found {len(unreviewed_articles)} unreviewed articles")
             
-            # Send articles to reviewer service
-            async def send_to_reviewer():
-                async with httpx.AsyncClient() as client:
-                    for article in unreviewed_articles:
-                        try:
-                            review_data = {
-                                "feed_id": str(article.feed_id),
-                                "title": article.title,
-                                "url": article.link,
-                                "content": article.content or article.summary or "",
-                                "published": article.publish_date.isoformat() if article.publish_date else None
-                            }
-                            
-                            response = await client.post(
-                                "http://reviewer:8008/review",
-                                json=review_data,
-                                timeout=180.0
-                            )
-                            response.raise_for_status()
-                            
-                            logger.info(f"Sent article {article.id} to reviewer")
-                            
-                        except Exception as e:
-                            logger.error(f"Error sending article {article.id} to reviewer: {e}")
+            review_data = [
+                {
+                    "feed_id": str(article.feed_id),
+                    "article_id": str(article.id),
+                    "title": article.title,
+                    "url": article.link,
+                    "content": article.content or article.summary or "",
+                    "published": article.publish_date.isoformat() if article.publish_date else None
+                }
+                for article in unreviewed_articles
+            ]
             
-            import asyncio
-            asyncio.run(send_to_reviewer())
+            # One /enqueue-batch call for the whole run; the reviewer skips
+            # articles already queued by news-feed or an earlier run
+            try:
+                response = httpx.post(
+                    f"{REVIEWER_SERVICE_URL}/enqueue-batch",
+                    json=review_data,
+                    timeout=30.0
+                )
+                response.raise_for_status()
+                result = response.json()
+                logger.info(f"Enqueued {result.get('enqueued')} articles for review ({result.get('skipped')} already queued)")
+            except Exception as e:
+                logger.error(f"Error enqueuing {len(unreviewed_articles)} articles for review: {e}")
             
         finally:
             db.close()
@@ -560,6 +551,54 @@ def cleanup_old_episodes():
         logger.error(f"Error in cleanup_old_episodes task: {e}")
 
 
+@celery.task
+def maintain_article_partitions():
+    """Extend the monthly article partitions and apply the retention policy.
+
+    The one-off conversion is not done here (it locks and copies the whole
+    table); run ``make db-partition-articles`` in a maintenance window.
+    """
+    try:
+        from shared.database import engine
+        from shared.partitioning import (
+            ARTICLES_PARTITIONING_ENABLED,
+            ensure_article_partitions,
+            apply_article_retention,
+        )
+
+        if not ARTICLES_PARTITIONING_ENABLED:
+            return {"enabled": False}
+
+        created = ensure_article_partitions(engine)
+        retention = apply_article_retention(engine)
+        logger.info(f"Article partition maintenance: created={created}, retention={retention}")
+        return {"enabled": True, "created": created, "retention": retention}
+
+    except Exception as e:
+        logger.error(f"Error in maintain_article_partitions task: {e}")
+        return {"error": str(e)}
+
+
+@celery.task
+def reconcile_stats_rollup():
+    """Recount the stats rollup from the base tables (catches TRUNCATEs and manual edits)."""
+    try:
+        from shared.stats import rebuild_counters
+
+        db = get_db_session()
+        try:
+            if db.get_bind().dialect.name != "postgresql":
+                return {"rebuilt": False}
+            rebuild_counters(db)
+            return {"rebuilt": True}
+        finally:
+            db.close()
+
+    except Exception as e:
+        logger.error(f"Error in reconcile_stats_rollup task: {e}")
+        return {"error": str(e)}
+
+
 @celery.task
 def health_check_services():
     """Check health of all services."""
@@ -16,6 +16,7 @@ sys.path.append('/app/shared')
 
 from database import get_db, create_tables
 from models import PodcastGroup, Episode, EpisodeStatus, Presenter, Writer, NewsFeed
+from stats import read_counters, episode_counts_by_status
 from schemas import (
     PodcastGroup as PodcastGroupSchema,
     Episode as EpisodeSchema,
@@ -255,16 +256,10 @@ async def get_task_status(task_id: str):
 async def get_system_stats(db: Session = Depends(get_db)):
     """Get system statistics."""
     try:
-        # Count episodes by status
-        episode_counts = {}
-        for status in EpisodeStatus:
-            count = db.query(Episode).filter(Episode.status == status).count()
-            episode_counts[status.value] = count
-        
-        # Count active podcast groups
-        active_groups = db.query(PodcastGroup).filter(
-            PodcastGroup.status == "active"
-        ).count()
+        # Episode and group counts come from the precomputed rollup
+        counters = read_counters(db)
+        episode_counts = episode_counts_by_status(counters)
+        active_groups = counters.get("podcast_groups_by_status:ACTIVE", 0)
         
         # Get recent episode activity
         recent_episodes = db.query(Episode).order_by(
@@ -298,24 +293,19 @@ async def get_prometheus_metrics(db: Session = Depends(get_db)):
         from fastapi.responses import PlainTextResponse
         from datetime import timedelta
         
-        # Episode counts by status
-        episode_counts = {}
-        total_episodes = 0
-        for status in EpisodeStatus:
-            count = db.query(Episode).filter(Episode.status == status).count()
-            episode_counts[status.value] = count
-            total_episodes += count
+        # Episode counts by status (precomputed rollup)
+        counters = read_counters(db)
+        episode_counts = episode_counts_by_status(counters)
+        total_episodes = counters.get("episodes_total", 0)
         
-        # Recent episode generation stats (last 24 hours)
+        # Recent episode generation stats (last 24 hours, range scan on ix_episodes_created_at_id)
         yesterday = datetime.utcnow() - timedelta(hours=24)
         recent_generations = db.query(Episode).filter(
             Episode.created_at >= yesterday
         ).count()
         
         # Active groups
-        active_groups = db.query(PodcastGroup).filter(
-            PodcastGroup.status == "active"
-        ).count()
+        active_groups = counters.get("podcast_groups_by_status:ACTIVE", 0)
         
         # Calculate average generation duration (placeholder - would need tracking)
         avg_duration = 300  # 5 minutes default
@@ -10,15 +10,20 @@ import httpx
 import os
 import jwt
 from datetime import datetime, timedelta
-from fastapi import FastAPI, HTTPException, Depends, Request, BackgroundTasks, Header
+from fastapi import FastAPI, HTTPException, Depends, Request, Response, BackgroundTasks, Header
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from sqlalchemy import text, func
-
-from shared.database import get_db, create_tables
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import text, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.database import get_db, get_async_db, create_tables, get_pool_prometheus_lines
+from shared.stats import read_counters, episode_counts_by_status
+from shared.pagination import (
+    COUNT_MODES, keyset_after, keyset_order, next_cursor, estimated_count, estimated_count_async
+)
 from shared.models import PodcastGroup, Episode, Presenter, Writer, NewsFeed, Article, Collection, User, EpisodeMetadata, EpisodeStatus
 from shared.schemas import (
     PodcastGroup as PodcastGroupSchema,
@@ -423,19 +428,17 @@ async def get_prometheus_metrics(db: Session = Depends(get_db)):
     from fastapi.responses import PlainTextResponse
     
     try:
-        # Count episodes by status
-        episode_counts = {}
-        for status in ["pending", "generating", "completed", "failed"]:
-            count = db.query(Episode).filter(Episode.status == status).count()
-            episode_counts[status] = count
+        # All counts come from the precomputed rollup (one small read per scrape)
+        counters = read_counters(db)
+        episode_counts = episode_counts_by_status(counters)
         
         # Count total entities
-        total_groups = db.query(PodcastGroup).count()
-        total_presenters = db.query(Presenter).count()
-        total_writers = db.query(Writer).count()
-        total_feeds = db.query(NewsFeed).filter(NewsFeed.is_active == True).count()
-        total_articles = db.query(Article).count()
-        total_collections = db.query(Collection).count()
+        total_groups = counters.get("podcast_groups_total", 0)
+        total_presenters = counters.get("presenters_total", 0)
+        total_writers = counters.get("writers_total", 0)
+        total_feeds = counters.get("news_feeds_active", 0)
+        total_articles = counters.get("articles_total", 0)
+        total_collections = counters.get("collections_total", 0)
         
         # Generate Prometheus format
         metrics = []
@@ -468,7 +471,8 @@ async def get_prometheus_metrics(db: Session = Depends(get_db)):
             "# HELP api_gateway_collections_total Total collections",
             "# TYPE api_gateway_collections_total gauge",
             "",
-            *metrics
+            *metrics,
+            *get_pool_prometheus_lines("api_gateway")
         ])
         
         return PlainTextResponse(prometheus_output, media_type="text/plain")
@@ -870,26 +874,59 @@ async def generate_episode(
 
 @app.get("/api/episodes", response_model=List[EpisodeSchema])
 async def list_episodes(
+    response: Response,
     group_id: Optional[UUID] = None,
     status: Optional[str] = None,
     limit: int = 50,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    count: str = "none",
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """List episodes."""
-    query = db.query(Episode)
+    """List episodes, newest first.
+    
+    Pass the ``X-Next-Cursor`` response header back as ``cursor`` for the next
+    page. ``count=exact|estimated`` adds an ``X-Total-Count`` header.
+    """
+    if count not in COUNT_MODES:
+        raise HTTPException(status_code=400, detail=f"Invalid count mode: {count}")
+    
+    query = select(Episode).options(
+        selectinload(Episode.episode_metadata),
+        selectinload(Episode.audio_file),
+        selectinload(Episode.articles),
+    )
     
     if group_id:
-        query = query.filter(Episode.group_id == group_id)
+        query = query.where(Episode.group_id == group_id)
     
     if status:
         try:
             from shared.models import EpisodeStatus
             episode_status = EpisodeStatus(status)
-            query = query.filter(Episode.status == episode_status)
+            query = query.where(Episode.status == episode_status)
         except ValueError:
             raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
     
-    return query.order_by(Episode.created_at.desc()).limit(limit).all()
+    if count == "exact":
+        total = await db.scalar(select(func.count()).select_from(query.subquery()))
+        response.headers["X-Total-Count"] = str(total)
+    elif count == "estimated":
+        response.headers["X-Total-Count"] = str(await estimated_count_async(db, query))
+    
+    if cursor:
+        try:
+            query = query.where(keyset_after(Episode.created_at, Episode.id, cursor))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    result = await db.execute(
+        query.order_by(*keyset_order(Episode.created_at, Episode.id)).limit(limit)
+    )
+    episodes = result.scalars().all()
+    following = next_cursor(episodes, limit)
+    if following:
+        response.headers["X-Next-Cursor"] = following
+    return episodes
 
 
 @app.get("/api/episodes-simple")
@@ -1179,9 +1216,18 @@ async def get_writer_scripts(
     writer_id: str,
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
+    count: str = "exact",
     db: Session = Depends(get_db)
 ):
-    """Get scripts created by a specific writer (via their assigned groups)."""
+    """Get scripts created by a specific writer (via their assigned groups).
+    
+    Pass ``next_cursor`` back as ``cursor`` to page without OFFSET;
+    ``count=estimated|none`` skips the exact total.
+    """
+    if count not in COUNT_MODES:
+        raise HTTPException(status_code=400, detail=f"Invalid count mode: {count}")
+    
     writer = db.query(Writer).filter(Writer.id == writer_id).first()
     if not writer:
         raise HTTPException(status_code=404, detail="Writer not found")
@@ -1191,15 +1237,27 @@ async def get_writer_scripts(
     group_ids = [g.id for g in groups]
     
     if not group_ids:
-        return {"total": 0, "scripts": []}
+        return {"total": 0, "scripts": [], "next_cursor": None}
     
-    # Get total count
-    total = db.query(Episode).filter(Episode.group_id.in_(group_ids)).count()
+    query = select(Episode).where(Episode.group_id.in_(group_ids))
     
-    # Get episodes with pagination
-    episodes = db.query(Episode).filter(
-        Episode.group_id.in_(group_ids)
-    ).order_by(Episode.created_at.desc()).limit(limit).offset(offset).all()
+    # Get total count
+    total = None
+    if count == "exact":
+        total = db.scalar(select(func.count()).select_from(query.subquery()))
+    elif count == "estimated":
+        total = estimated_count(db, query)
+    
+    # Get episodes with pagination (keyset when a cursor is given)
+    if cursor:
+        try:
+            query = query.where(keyset_after(Episode.created_at, Episode.id, cursor))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        offset = 0
+    episodes = db.execute(
+        query.order_by(*keyset_order(Episode.created_at, Episode.id)).limit(limit).offset(offset)
+    ).scalars().all()
     
     # Build response
     scripts = []
@@ -1225,8 +1283,10 @@ async def get_writer_scripts(
     
     return {
         "total": total,
+        "total_is_estimate": count == "estimated",
         "limit": limit,
         "offset": offset,
+        "next_cursor": next_cursor(episodes, limit),
         "scripts": scripts
     }
 
@@ -1545,92 +1605,153 @@ async def list_all_articles(
     search: Optional[str] = None,
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    count: str = "exact",
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get paginated list of articles with filtering options."""
-    from shared.models import Article, NewsFeed, Collection
+    """Get paginated list of articles with filtering options.
+    
+    ``search`` is a full-text query (web search syntax: quoted phrases, ``or``,
+    ``-term``) matched against the indexed ``search_vector``; results are then
+    ranked by relevance and carry a highlighted ``highlight`` snippet.
+    
+    Without ``search``, pass ``next_cursor`` back as ``cursor`` to fetch the
+    next page by keyset instead of OFFSET. Ranked search results page by
+    ``offset``; a ``cursor`` with ``search`` is rejected. ``count=estimated`` returns the planner's row estimate and
+    ``count=none`` skips counting.
+    """
+    if count not in COUNT_MODES:
+        raise HTTPException(status_code=400, detail=f"Invalid count mode: {count}")
+    if cursor and search and search.strip():
+        raise HTTPException(status_code=400, detail="cursor cannot be combined with search; page ranked results with offset")
+    
+    from shared.models import Article, NewsFeed, Collection, ARTICLE_SEARCH_CONFIG
     from datetime import datetime
     
-    # Build query
-    query = db.query(Article).join(NewsFeed, Article.feed_id == NewsFeed.id)
+    # Collect filters (shared by the count and the page query)
+    filters = []
+    rank = None
+    highlight = None
     
     # Apply filters
     if feed_id:
         try:
-            query = query.filter(Article.feed_id == UUID(feed_id))
+            filters.append(Article.feed_id == UUID(feed_id))
         except ValueError:
             pass
     
     if reviewer_type:
         if reviewer_type == "unreviewed":
-            query = query.filter(Article.reviewer_type.is_(None))
+            filters.append(Article.reviewer_type.is_(None))
         else:
-            query = query.filter(Article.reviewer_type == reviewer_type)
+            filters.append(Article.reviewer_type == reviewer_type)
     
     if has_collection is not None:
         if has_collection:
-            query = query.filter(Article.collection_id.isnot(None))
+            filters.append(Article.collection_id.isnot(None))
         else:
-            query = query.filter(Article.collection_id.is_(None))
-    
-    if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            Article.title.ilike(search_term) | 
-            Article.summary.ilike(search_term) |
-            Article.content.ilike(search_term)
+            filters.append(Article.collection_id.is_(None))
+    
+    if search and search.strip():
+        ts_query = func.websearch_to_tsquery(ARTICLE_SEARCH_CONFIG, search)
+        filters.append(Article.search_vector.op("@@")(ts_query))
+        rank = func.ts_rank_cd(Article.search_vector, ts_query)
+        # ts_headline is costly, but Postgres only evaluates it for the rows left after LIMIT
+        highlight = func.ts_headline(
+            ARTICLE_SEARCH_CONFIG,
+            func.coalesce(func.nullif(Article.summary, ""), func.left(Article.content, 5000), ""),
+            ts_query,
+            "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2"
         )
     
     if date_from:
         try:
             from_date = datetime.fromisoformat(date_from.replace('Z', '+00:00'))
-            query = query.filter(Article.created_at >= from_date)
+            filters.append(Article.created_at >= from_date)
         except ValueError:
             pass
     
     if date_to:
         try:
             to_date = datetime.fromisoformat(date_to.replace('Z', '+00:00'))
-            query = query.filter(Article.created_at <= to_date)
+            filters.append(Article.created_at <= to_date)
         except ValueError:
             pass
     
-    # Get total count before pagination
-    total_count = query.count()
+    # Get total count before pagination (feed_id is a NOT NULL foreign key, so no join needed)
+    total_count = None
+    if count == "exact":
+        total_count = await db.scalar(select(func.count()).select_from(Article).where(*filters))
+    elif count == "estimated":
+        total_count = await estimated_count_async(db, select(Article.id).where(*filters))
+    
+    # One joined query returning only the listed columns as plain rows
+    query = (
+        select(
+            Article.id,
+            Article.title,
+            Article.link,
+            Article.summary,
+            Article.publish_date,
+            Article.created_at,
+            Article.feed_id,
+            NewsFeed.name.label("feed_name"),
+            Article.reviewer_type,
+            Article.review_tags,
+            Article.confidence,
+            Article.collection_id,
+            Collection.name.label("collection_name"),
+        )
+        .join(NewsFeed, Article.feed_id == NewsFeed.id)
+        .outerjoin(Collection, Article.collection_id == Collection.id)
+        .where(*filters)
+    )
     
-    # Apply ordering and pagination
-    articles = query.order_by(Article.created_at.desc()).offset(offset).limit(limit).all()
+    # Apply ordering and pagination (most relevant first when searching)
+    if rank is not None:
+        query = query.add_columns(rank.label("rank"), highlight.label("highlight")).order_by(
+            rank.desc(), Article.created_at.desc()
+        ).offset(offset)
+    else:
+        if cursor:
+            try:
+                query = query.where(keyset_after(Article.created_at, Article.id, cursor))
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+        else:
+            query = query.offset(offset)
+        query = query.order_by(*keyset_order(Article.created_at, Article.id))
+    rows = (await db.execute(query.limit(limit))).all()
     
     # Build result
     result = []
-    for article in articles:
-        feed = db.query(NewsFeed).filter(NewsFeed.id == article.feed_id).first()
-        collection_name = None
-        if article.collection_id:
-            collection = db.query(Collection).filter(Collection.id == article.collection_id).first()
-            if collection:
-                collection_name = collection.name
-        
-        result.append({
-            "id": str(article.id),
-            "title": article.title,
-            "link": article.link,
-            "summary": article.summary,
-            "publish_date": article.publish_date.isoformat() if article.publish_date else None,
-            "created_at": article.created_at.isoformat() if article.created_at else None,
-            "feed_id": str(article.feed_id),
-            "feed_name": feed.name if feed else "Unknown Feed",
-            "reviewer_type": article.reviewer_type,
-            "review_tags": article.review_tags or [],
-            "confidence": article.confidence,
-            "collection_id": str(article.collection_id) if article.collection_id else None,
-            "collection_name": collection_name
-        })
+    for row in rows:
+        item = {
+            "id": str(row.id),
+            "title": row.title,
+            "link": row.link,
+            "summary": row.summary,
+            "publish_date": row.publish_date.isoformat() if row.publish_date else None,
+            "created_at": row.created_at.isoformat() if row.created_at else None,
+            "feed_id": str(row.feed_id),
+            "feed_name": row.feed_name or "Unknown Feed",
+            "reviewer_type": row.reviewer_type,
+            "review_tags": row.review_tags or [],
+            "confidence": row.confidence,
+            "collection_id": str(row.collection_id) if row.collection_id else None,
+            "collection_name": row.collection_name
+        }
+        if rank is not None:
+            item["rank"] = float(row.rank or 0.0)
+            item["highlight"] = row.highlight
+        result.append(item)
     
     return {
         "total": total_count,
+        "total_is_estimate": count == "estimated",
         "offset": offset,
         "limit": limit,
+        "next_cursor": next_cursor(rows, limit) if rank is None else None,
         "articles": result
     }
 
@@ -1638,55 +1759,86 @@ async def list_all_articles(
 @app.get("/api/news-feed/articles/{article_id}")
 async def get_article_details(article_id: UUID, db: Session = Depends(get_db)):
     """Get detailed information about a specific article."""
-    from shared.models import Article, NewsFeed, Collection, Episode
+    from shared.models import Article, NewsFeed, Collection, Episode, episode_article_link
+    
+    # Linked episodes folded into a JSON array so the whole page is one round trip
+    linked_episodes = (
+        select(func.coalesce(
+            func.json_agg(func.json_build_object(
+                "id", Episode.id,
+                "status", Episode.status,
+                "created_at", Episode.created_at,
+                "group_name", PodcastGroup.name,
+            )),
+            text("'[]'::json")
+        ))
+        .select_from(episode_article_link)
+        .join(Episode, Episode.id == episode_article_link.c.episode_id)
+        .outerjoin(PodcastGroup, PodcastGroup.id == Episode.group_id)
+        .where(episode_article_link.c.article_id == Article.id)
+        .scalar_subquery()
+    )
     
-    article = db.query(Article).filter(Article.id == article_id).first()
-    if not article:
+    row = db.execute(
+        select(
+            Article.id,
+            Article.title,
+            Article.link,
+            Article.summary,
+            Article.content,
+            Article.publish_date,
+            Article.created_at,
+            Article.feed_id,
+            NewsFeed.name.label("feed_name"),
+            NewsFeed.source_url.label("feed_url"),
+            Article.collection_id,
+            Collection.name.label("collection_name"),
+            Article.reviewer_type,
+            Article.review_tags,
+            Article.review_summary,
+            Article.confidence,
+            Article.processed_at,
+            Article.review_metadata,
+            linked_episodes.label("linked_episodes"),
+        )
+        .outerjoin(NewsFeed, Article.feed_id == NewsFeed.id)
+        .outerjoin(Collection, Article.collection_id == Collection.id)
+        .where(Article.id == article_id)
+    ).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Article not found")
     
-    # Get feed information
-    feed = db.query(NewsFeed).filter(NewsFeed.id == article.feed_id).first()
-    
-    # Get collection information
-    collection = None
-    collection_name = None
-    if article.collection_id:
-        collection = db.query(Collection).filter(Collection.id == article.collection_id).first()
-        if collection:
-            collection_name = collection.name
-    
-    # Get linked episodes
-    linked_episodes = []
-    if article.episodes:
-        for episode in article.episodes:
-            group = db.query(PodcastGroup).filter(PodcastGroup.id == episode.group_id).first()
-            linked_episodes.append({
-                "id": str(episode.id),
-                "status": episode.status.value if episode.status else "unknown",
-                "created_at": episode.created_at.isoformat() if episode.created_at else None,
-                "group_name": group.name if group else "Unknown Group"
-            })
+    # Episode.status is stored by enum name; report the value like the other endpoints
+    linked = []
+    for episode in row.linked_episodes or []:
+        status = episode.get("status")
+        linked.append({
+            "id": episode.get("id"),
+            "status": EpisodeStatus[status].value if status in EpisodeStatus.__members__ else (status or "unknown"),
+            "created_at": episode.get("created_at"),
+            "group_name": episode.get("group_name") or "Unknown Group"
+        })
     
     return {
-        "id": str(article.id),
-        "title": article.title,
-        "link": article.link,
-        "summary": article.summary,
-        "content": article.content,
-        "publish_date": article.publish_date.isoformat() if article.publish_date else None,
-        "created_at": article.created_at.isoformat() if article.created_at else None,
-        "feed_id": str(article.feed_id),
-        "feed_name": feed.name if feed else "Unknown Feed",
-        "feed_url": feed.source_url if feed else None,
-        "collection_id": str(article.collection_id) if article.collection_id else None,
-        "collection_name": collection_name,
-        "reviewer_type": article.reviewer_type,
-        "review_tags": article.review_tags or [],
-        "review_summary": article.review_summary,
-        "confidence": article.confidence,
-        "processed_at": article.processed_at.isoformat() if article.processed_at else None,
-        "review_metadata": article.review_metadata,
-        "linked_episodes": linked_episodes
+        "id": str(row.id),
+        "title": row.title,
+        "link": row.link,
+        "summary": row.summary,
+        "content": row.content,
+        "publish_date": row.publish_date.isoformat() if row.publish_date else None,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+        "feed_id": str(row.feed_id),
+        "feed_name": row.feed_name or "Unknown Feed",
+        "feed_url": row.feed_url,
+        "collection_id": str(row.collection_id) if row.collection_id else None,
+        "collection_name": row.collection_name,
+        "reviewer_type": row.reviewer_type,
+        "review_tags": row.review_tags or [],
+        "review_summary": row.review_summary,
+        "confidence": row.confidence,
+        "processed_at": row.processed_at.isoformat() if row.processed_at else None,
+        "review_metadata": row.review_metadata,
+        "linked_episodes": linked
     }
 
 
@@ -11,9 +11,11 @@ from uuid import UUID, uuid4
 import httpx
 from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
 from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
-from shared.database import get_db, get_db_session, create_tables
+from shared.database import get_db, get_async_db, get_db_session, create_tables, get_pool_prometheus_lines
 from shared.models import Article, NewsFeed, PodcastGroup, Collection as DBCollection
 
 # Configure logging
@@ -471,7 +473,7 @@ class CollectionsManager:
         """Get all collections for a specific group."""
         return [c for c in self.collections.values() if group_id in c.group_ids]
     
-    def get_active_collection_for_group(self, group_id: str, db: Session) -> Optional[str]:
+    async def get_active_collection_for_group(self, group_id: str, db: AsyncSession) -> Optional[str]:
         """Get the active collection for a group - prioritize ready over building, create one if none exists."""
         # Check in-memory collections first - prioritize ready over building
         ready_collection = None
@@ -491,9 +493,15 @@ class CollectionsManager:
         if building_collection:
             return building_collection
         
-        # Check database for ready or building collections
+        # Check database for ready or building collections (relationships are
+        # loaded eagerly; async sessions cannot lazy-load)
         from uuid import UUID
-        group = db.query(PodcastGroup).filter(PodcastGroup.id == UUID(group_id)).first()
+        result = await db.execute(
+            select(PodcastGroup)
+            .options(selectinload(PodcastGroup.collections).selectinload(DBCollection.podcast_groups))
+            .where(PodcastGroup.id == UUID(group_id))
+        )
+        group = result.scalar_one_or_none()
         if not group:
             logger.error(f"Group {group_id} not found")
             return None
@@ -501,14 +509,14 @@ class CollectionsManager:
         # Find ready collection first, then building collection for this group
         for collection in group.collections:
             if collection.status == "ready":
-                self._load_collection_into_memory(collection, db)
+                await self._load_collection_into_memory(collection, db)
                 logger.info(f"Found ready collection {collection.id} in DB for group {group_id}")
                 return str(collection.id)
         
         for collection in group.collections:
             if collection.status == "building":
                 # Load it into memory
-                self._load_collection_into_memory(collection, db)
+                await self._load_collection_into_memory(collection, db)
                 return str(collection.id)
         
         # No building collection found, create one
@@ -518,26 +526,29 @@ class CollectionsManager:
             description=f"Active collection for {group.name}",
             status="building"
         )
-        db.add(new_collection)
-        db.flush()
         
         # Assign to group
         new_collection.podcast_groups.append(group)
-        db.commit()
-        db.refresh(new_collection)
+        db.add(new_collection)
+        await db.commit()
+        await db.refresh(new_collection, attribute_names=["created_at", "updated_at"])
         
         # Load into memory
-        self._load_collection_into_memory(new_collection, db)
+        await self._load_collection_into_memory(new_collection, db)
         
         logger.info(f"Created new building collection {new_collection.id} for group {group_id}")
         return str(new_collection.id)
     
-    def _load_collection_into_memory(self, db_collection: DBCollection, db: Session):
+    async def _load_collection_into_memory(self, db_collection: DBCollection, db: AsyncSession):
         """Load a collection from database into memory."""
-        articles = db.query(Article).filter(Article.collection_id == db_collection.id).all()
+        result = await db.execute(
+            select(Article, NewsFeed.name)
+            .outerjoin(NewsFeed, NewsFeed.id == Article.feed_id)
+            .where(Article.collection_id == db_collection.id)
+        )
         
         items = []
-        for article in articles:
+        for article, feed_name in result.all():
             feed_item = CollectionItem(
                 item_id=str(article.id),
                 item_type="feed",
@@ -547,7 +558,7 @@ class CollectionsManager:
                     "summary": article.summary,
                     "content": article.content,
                     "publish_date": article.publish_date.isoformat() if article.publish_date else None,
-                    "source": article.news_feed.name if article.news_feed else "Unknown"
+                    "source": feed_name or "Unknown"
                 },
                 created_at=article.created_at,
                 metadata={
@@ -572,7 +583,6 @@ class CollectionsManager:
         
         self.collections[str(db_collection.id)] = collection_dto
 
-
 # Initialize collections manager
 collections_manager = CollectionsManager()
 
@@ -634,7 +644,8 @@ async def get_prometheus_metrics(db: Session = Depends(get_db)):
             "# HELP collections_active_total Total active collections in memory",
             "# TYPE collections_active_total gauge",
             "",
-            *metrics
+            *metrics,
+            *get_pool_prometheus_lines("collections")
         ])
         
         return PlainTextResponse(prometheus_output, media_type="text/plain")
@@ -827,10 +838,10 @@ async def create_collection_snapshot(
 @app.get("/collections/group/{group_id}/active")
 async def get_active_collection_for_group(
     group_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get or create the active building collection for a group."""
-    collection_id = collections_manager.get_active_collection_for_group(group_id, db)
+    collection_id = await collections_manager.get_active_collection_for_group(group_id, db)
     
     if not collection_id:
         raise HTTPException(status_code=404, detail="Failed to get or create active collection")
@@ -5,8 +5,9 @@ Optimized for high throughput with low latency (~250ms per feed).
 import logging
 import os
 import asyncio
+import re
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from uuid import UUID
 
 import httpx
@@ -23,6 +24,24 @@ app = FastAPI(title="Light Reviewer Service", version="1.0.0")
 OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
 MODEL_NAME = os.getenv("MODEL_NAME", "qwen2:0.5b")
 PORT = int(os.getenv("PORT", "8000"))
+OLLAMA_TIMEOUT = float(os.getenv("OLLAMA_TIMEOUT", "30"))
+
+# Micro-batched reviews (/review-batch): articles per prompt, context window and answer budget per article
+LIGHT_BATCH_MAX = int(os.getenv("LIGHT_BATCH_MAX", "8"))
+LIGHT_BATCH_NUM_CTX = int(os.getenv("LIGHT_BATCH_NUM_CTX", "8192"))
+LIGHT_BATCH_TOKENS_PER_ITEM = int(os.getenv("LIGHT_BATCH_TOKENS_PER_ITEM", "100"))
+# Extra Ollama timeout per article in a batch, on top of OLLAMA_TIMEOUT (answers grow with the batch)
+LIGHT_BATCH_TIMEOUT_PER_ITEM = float(os.getenv("LIGHT_BATCH_TIMEOUT_PER_ITEM", "10"))
+
+FEW_SHOT_EXAMPLE = """Example:
+Title: Apple announces new AI features for iPhone
+Content: Apple Inc. today announced significant updates to its iPhone lineup, focusing heavily on artificial intelligence integration.
+
+Response:
+TAGS: technology, ai, innovation
+SUMMARY: Apple announces new AI features for iPhone
+CONFIDENCE: 0.85
+"""
 
 
 class FeedReviewRequest(BaseModel):
@@ -54,59 +73,111 @@ class OllamaClient:
     
     def __init__(self, base_url: str = OLLAMA_BASE_URL):
         self.base_url = base_url
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = httpx.AsyncClient(timeout=OLLAMA_TIMEOUT)
     
-    async def generate_review(self, prompt: str) -> str:
-        """Generate review using Ollama."""
+    async def generate(self, prompt: str, num_predict: int = 200, num_ctx: Optional[int] = None,
+                       timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Raw Ollama result: ``response`` plus token counts (``prompt_eval_count``, ``eval_count``).
+        
+        ``timeout`` overrides the client's default for this call.
+        """
         try:
+            options = {
+                "temperature": 0.1,
+                "top_p": 0.9,
+                "num_predict": num_predict
+            }
+            if num_ctx:
+                options["num_ctx"] = num_ctx
             payload = {
                 "model": MODEL_NAME,
                 "prompt": prompt,
                 "stream": False,
-                "options": {
-                    "temperature": 0.1,
-                    "top_p": 0.9,
-                    "num_predict": 200
-                }
+                "options": options
             }
             
             response = await self.client.post(
                 f"{self.base_url}/api/generate",
-                json=payload
+                json=payload,
+                timeout=timeout or self.client.timeout
             )
             response.raise_for_status()
-            result = response.json()
-            return result["response"]
+            return response.json()
         except Exception as e:
             logger.error(f"Ollama API error: {e}")
             raise
             raise HTTPException(status_code=500, detail=f"Review generation failed: {str(e)}")
+    
+    async def generate_review(self, prompt: str) -> str:
+        """Generate review using Ollama."""
+        result = await self.generate(prompt)
+        return result["response"]
 
 
 class LightReviewer:
     """Light reviewer for fast article categorization."""
     
+    _ANSWER_MARKER = re.compile(r"^\s*\[(\d+)\]\s*$", re.MULTILINE)
+    
     def __init__(self):
         self.ollama_client = OllamaClient()
         self.latency_history = []
+        # Ollama token counts per path (exported by /metrics/prometheus)
+        self.token_stats = {
+            path: {"calls": 0, "articles": 0, "prompt_tokens": 0, "completion_tokens": 0}
+            for path in ("single", "batch")
+        }
+        self.batch_stats = {"batches": 0, "missing_items": 0, "failed_batches": 0}
     
     def create_review_prompt(self, request: FeedReviewRequest) -> str:
         """Create optimized prompt for light review."""
-        return f"""Example:
-Title: Apple announces new AI features for iPhone
-Content: Apple Inc. today announced significant updates to its iPhone lineup, focusing heavily on artificial intelligence integration.
-
-Response:
-TAGS: technology, ai, innovation
-SUMMARY: Apple announces new AI features for iPhone
-CONFIDENCE: 0.85
-
+        return f"""{FEW_SHOT_EXAMPLE}
 Now analyze this article:
 Title: {request.title}
 Content: {request.content[:1000]}
 
 Response:"""
     
+    def create_batch_prompt(self, requests: List[FeedReviewRequest]) -> str:
+        """One prompt for several articles: the example once, then numbered articles and answers."""
+        articles = "\n\n".join(
+            f"[{number}]\nTitle: {request.title}\nContent: {request.content[:1000]}"
+            for number, request in enumerate(requests, start=1)
+        )
+        # The prompt ends with the first answer marker so the model starts answering [1] right away
+        return f"""{FEW_SHOT_EXAMPLE}
+Now analyze each of these {len(requests)} articles. Answer every article in order, in the format
+of the example, starting each answer with the article's number in brackets on its own line.
+
+{articles}
+
+Response:
+[1]
+"""
+    
+    def parse_batch_response(self, response: str, count: int) -> List[Optional[Dict[str, Any]]]:
+        """Per-article results of a batch answer, in request order (None where an answer is missing)."""
+        # The prompt already wrote the first marker
+        parts = self._ANSWER_MARKER.split("[1]\n" + response)
+        results: List[Optional[Dict[str, Any]]] = [None] * count
+        for number, block in zip(parts[1::2], parts[2::2]):
+            index = int(number) - 1
+            if 0 <= index < count and results[index] is None and ("TAGS:" in block or "SUMMARY:" in block):
+                results[index] = self.parse_review_response(block)
+        return results
+    
+    def _record_tokens(self, path: str, result: Dict[str, Any], articles: int) -> None:
+        stats = self.token_stats[path]
+        stats["calls"] += 1
+        stats["articles"] += articles
+        stats["prompt_tokens"] += result.get("prompt_eval_count", 0) or 0
+        stats["completion_tokens"] += result.get("eval_count", 0) or 0
+    
+    def _record_latency(self, latency_ms: float) -> None:
+        self.latency_history.append(latency_ms)
+        if len(self.latency_history) > 100:
+            self.latency_history.pop(0)
+    
     def parse_review_response(self, response: str) -> Dict[str, Any]:
         """Parse the vLLM response into structured data."""
         try:
@@ -166,14 +237,13 @@ Response:"""
         
         try:
             prompt = self.create_review_prompt(request)
-            response = await self.ollama_client.generate_review(prompt)
-            result = self.parse_review_response(response)
+            generated = await self.ollama_client.generate(prompt)
+            self._record_tokens("single", generated, 1)
+            result = self.parse_review_response(generated["response"])
             
             # Record latency
             latency_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
-            self.latency_history.append(latency_ms)
-            if len(self.latency_history) > 100:
-                self.latency_history.pop(0)
+            self._record_latency(latency_ms)
             
             return ReviewResponse(
                 tags=result["tags"],
@@ -193,6 +263,59 @@ Response:"""
             )
 
 
+    async def review_feed_batch(self, requests: List[FeedReviewRequest]) -> List[ReviewResponse]:
+        """Review several feed items with one Ollama call; results are in request order.
+        
+        Articles the model skipped or answered unparseably are reviewed
+        again one by one. If the batch call itself fails this raises a 502
+        rather than answering with fallbacks, so the caller can retry the
+        articles through ``/review``.
+        """
+        if len(requests) == 1:
+            return [await self.review_feed(requests[0])]
+        start_time = datetime.utcnow()
+        
+        try:
+            generated = await self.ollama_client.generate(
+                self.create_batch_prompt(requests),
+                num_predict=LIGHT_BATCH_TOKENS_PER_ITEM * len(requests),
+                num_ctx=LIGHT_BATCH_NUM_CTX,
+                timeout=OLLAMA_TIMEOUT + LIGHT_BATCH_TIMEOUT_PER_ITEM * len(requests),
+            )
+            self._record_tokens("batch", generated, len(requests))
+            results = self.parse_batch_response(generated["response"], len(requests))
+            self.batch_stats["batches"] += 1
+        except Exception as e:
+            logger.error(f"Error reviewing batch of {len(requests)} feeds: {e}")
+            self.batch_stats["failed_batches"] += 1
+            raise HTTPException(status_code=502, detail=f"Batch review generation failed: {str(e)}")
+        
+        # Per-article share of the batch latency
+        latency_ms = (datetime.utcnow() - start_time).total_seconds() * 1000 / len(requests)
+        for result in results:
+            if result is not None:
+                self._record_latency(latency_ms)
+        
+        missing = [index for index, result in enumerate(results) if result is None]
+        if missing:
+            logger.warning(f"Batch answer missing {len(missing)} of {len(requests)} articles; reviewing them singly")
+            self.batch_stats["missing_items"] += len(missing)
+            singles = await asyncio.gather(*(self.review_feed(requests[index]) for index in missing))
+        else:
+            singles = []
+        responses = {index: response for index, response in zip(missing, singles)}
+        
+        return [
+            responses.get(index) or ReviewResponse(
+                tags=result["tags"],
+                summary=result["summary"],
+                confidence=result["confidence"],
+                model=MODEL_NAME
+            )
+            for index, result in enumerate(results)
+        ]
+
+
 # Initialize reviewer
 light_reviewer = LightReviewer()
 
@@ -240,6 +363,15 @@ async def get_prometheus_metrics():
         metrics.append(f"light_reviewer_reviews_total {total_reviews}")
         metrics.append(f"light_reviewer_reviews_per_hour {reviews_last_hour}")
         
+        # Ollama tokens and articles by path (single /review vs micro-batched /review-batch)
+        for path, stats in light_reviewer.token_stats.items():
+            metrics.append(f'light_reviewer_ollama_calls_total{{path="{path}"}} {stats["calls"]}')
+            metrics.append(f'light_reviewer_articles_total{{path="{path}"}} {stats["articles"]}')
+            metrics.append(f'light_reviewer_prompt_tokens_total{{path="{path}"}} {stats["prompt_tokens"]}')
+            metrics.append(f'light_reviewer_completion_tokens_total{{path="{path}"}} {stats["completion_tokens"]}')
+        metrics.append(f"light_reviewer_batch_missing_items_total {light_reviewer.batch_stats['missing_items']}")
+        metrics.append(f"light_reviewer_batch_failures_total {light_reviewer.batch_stats['failed_batches']}")
+        
         prometheus_output = "\n".join([
             "# HELP light_reviewer_workers_active Number of active workers",
             "# TYPE light_reviewer_workers_active gauge",
@@ -249,6 +381,18 @@ async def get_prometheus_metrics():
             "# TYPE light_reviewer_reviews_total counter",
             "# HELP light_reviewer_reviews_per_hour Reviews processed in the last hour",
             "# TYPE light_reviewer_reviews_per_hour gauge",
+            "# HELP light_reviewer_ollama_calls_total Ollama generate calls by path",
+            "# TYPE light_reviewer_ollama_calls_total counter",
+            "# HELP light_reviewer_articles_total Articles reviewed by Ollama calls, by path",
+            "# TYPE light_reviewer_articles_total counter",
+            "# HELP light_reviewer_prompt_tokens_total Prompt tokens evaluated by Ollama, by path",
+            "# TYPE light_reviewer_prompt_tokens_total counter",
+            "# HELP light_reviewer_completion_tokens_total Tokens generated by Ollama, by path",
+            "# TYPE light_reviewer_completion_tokens_total counter",
+            "# HELP light_reviewer_batch_missing_items_total Batched articles without a usable answer (reviewed singly)",
+            "# TYPE light_reviewer_batch_missing_items_total counter",
+            "# HELP light_reviewer_batch_failures_total Batched Ollama calls that failed",
+            "# TYPE light_reviewer_batch_failures_total counter",
             "",
             *metrics
         ])
@@ -270,6 +414,24 @@ async def review_feed(request: FeedReviewRequest):
     return result
 
 
+@app.post("/review-batch", response_model=List[ReviewResponse])
+async def review_feed_batch(requests: List[FeedReviewRequest]):
+    """Review up to LIGHT_BATCH_MAX feed items with one model call; results are in request order."""
+    if len(requests) > LIGHT_BATCH_MAX:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch of {len(requests)} items exceeds the limit of {LIGHT_BATCH_MAX}"
+        )
+    if not requests:
+        return []
+    logger.info(f"Light reviewing batch of {len(requests)} feeds")
+    
+    results = await light_reviewer.review_feed_batch(requests)
+    
+    logger.info(f"Light batch review completed: confidences={[round(r.confidence, 2) for r in results]}")
+    return results
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -0,0 +1,126 @@
+"""
+Redis cache of extracted full-article text, keyed by canonical URL.
+
+The same story is linked from several feeds and re-listed on every poll, so
+enrichment checks here before downloading and parsing a page. Entries expire
+after ARTICLE_CACHE_TTL seconds, and a sorted set of last-access times keeps
+the cache at ARTICLE_CACHE_MAX_ENTRIES by evicting the least recently used
+pages first.
+"""
+import hashlib
+import logging
+import os
+import time
+from typing import Dict, List
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+ARTICLE_CACHE_ENABLED = os.getenv("ARTICLE_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+ARTICLE_CACHE_TTL = int(os.getenv("ARTICLE_CACHE_TTL", "604800"))
+ARTICLE_CACHE_MAX_ENTRIES = int(os.getenv("ARTICLE_CACHE_MAX_ENTRIES", "50000"))
+
+# Query parameters that only identify the referrer or campaign
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "_ga", "_gl", "ref", "ref_src", "ref_url", "cmpid", "ocid", "smid", "sr_share",
+    "spm", "at_medium", "at_campaign", "cmp",
+}
+TRACKING_PREFIXES = ("utm_", "pk_", "mtm_", "hsa_")
+
+
+def canonical_url(url: str) -> str:
+    """Normalise ``url`` so the same page linked with different tracking tags maps to one key.
+
+    Lowercases scheme and host, drops default ports, fragments and tracking
+    parameters, and sorts the remaining query parameters.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and not ((scheme == "http" and parts.port == 80) or (scheme == "https" and parts.port == 443)):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+
+class ArticleContentCache:
+    """Extracted article text in Redis with TTL and LRU eviction.
+
+    ``redis_client`` is a ``redis.asyncio`` client. Redis errors are logged
+    and treated as misses, so enrichment keeps working without the cache.
+    """
+
+    def __init__(self, redis_client, ttl_seconds: int = ARTICLE_CACHE_TTL,
+                 max_entries: int = ARTICLE_CACHE_MAX_ENTRIES, prefix: str = "news_feed:article_content"):
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.prefix = prefix
+        self.lru_key = f"{prefix}:lru"
+        # Process-local counters (exported by /metrics/prometheus)
+        self.stats = {"hits": 0, "misses": 0, "bytes_saved": 0, "errors": 0}
+
+    def _key(self, url: str) -> str:
+        return f"{self.prefix}:{hashlib.sha1(canonical_url(url).encode()).hexdigest()}"
+
+    async def get_many(self, urls: List[str]) -> Dict[str, str]:
+        """Cached text for each of ``urls`` that is present; touches the hits for LRU."""
+        if not urls:
+            return {}
+        keys = [self._key(url) for url in urls]
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.hmget(key, "text", "bytes")
+                values = await pipe.execute()
+
+            found: Dict[str, str] = {}
+            touched: Dict[str, float] = {}
+            now = time.time()
+            for url, key, (text, size) in zip(urls, keys, values):
+                if text is None:
+                    continue
+                found[url] = text
+                touched[key] = now
+                self.stats["bytes_saved"] += int(size or 0)
+            if touched:
+                await self.redis.zadd(self.lru_key, touched)
+        except Exception as e:
+            logger.warning(f"Article cache lookup failed: {e}")
+            self.stats["errors"] += 1
+            found = {}
+
+        self.stats["hits"] += len(found)
+        self.stats["misses"] += len(urls) - len(found)
+        return found
+
+    async def put(self, url: str, text: str, download_bytes: int) -> None:
+        """Store the extracted ``text`` of a page that took ``download_bytes`` to fetch."""
+        if not text:
+            return
+        key = self._key(url)
+        now = time.time()
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.hset(key, mapping={"text": text, "bytes": download_bytes, "url": canonical_url(url)})
+                pipe.expire(key, self.ttl_seconds)
+                pipe.zadd(self.lru_key, {key: now})
+                # Forget LRU entries whose keys have already expired
+                pipe.zremrangebyscore(self.lru_key, 0, now - self.ttl_seconds)
+                pipe.zcard(self.lru_key)
+                size = (await pipe.execute())[-1]
+            if size > self.max_entries:
+                evicted = await self.redis.zpopmin(self.lru_key, size - self.max_entries)
+                if evicted:
+                    await self.redis.delete(*[member for member, _ in evicted])
+        except Exception as e:
+            logger.warning(f"Article cache store failed for {url}: {e}")
+            self.stats["errors"] += 1
+
+    def hit_ratio(self) -> float:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / lookups if lookups else 0.0
@@ -0,0 +1,114 @@
+"""
+Fingerprint store for cross-poll deduplication.
+
+Fingerprints live in time-bucketed Redis sets ``<prefix>:<bucket>`` (one
+per DEDUP_BUCKET_SECONDS). Each bucket expires DEDUP_TTL after it closes, so
+entries age out bucket by bucket instead of one ever-growing set whose TTL
+is refreshed on every insert.
+
+A feed batch is checked with one pipelined round trip: SMISMEMBER against
+every live bucket. The new fingerprints are then added to the current
+bucket in a second pipeline. Memory is tuned with the TTL and with
+DEDUP_FINGERPRINT_HEX, the number of hex digits kept per fingerprint. The
+false-positive rate that truncation causes is estimated from the live entry
+count (``estimated_false_positive_rate``).
+"""
+import logging
+import math
+import os
+import time
+from typing import List, Sequence, Set
+
+logger = logging.getLogger(__name__)
+
+DEDUP_TTL = int(os.getenv("DEDUP_TTL", "2592000"))
+DEDUP_BUCKET_SECONDS = int(os.getenv("DEDUP_BUCKET_SECONDS", "86400"))
+# 16 hex digits = 64-bit fingerprints: about 1e-12 false positives per lookup at 20M entries
+DEDUP_FINGERPRINT_HEX = int(os.getenv("DEDUP_FINGERPRINT_HEX", "16"))
+
+DUPLICATE_EVENTS_KEY = "reviewer:duplicates:events"
+
+
+class FingerprintStore:
+    """Time-bucketed Redis sets of (truncated) fingerprints with per-bucket expiry."""
+
+    def __init__(self, redis_client, prefix: str = "reviewer:fingerprints", ttl_seconds: int = DEDUP_TTL,
+                 bucket_seconds: int = DEDUP_BUCKET_SECONDS, fingerprint_hex: int = DEDUP_FINGERPRINT_HEX):
+        self.redis = redis_client
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+        self.bucket_seconds = max(1, bucket_seconds)
+        self.fingerprint_hex = max(8, min(64, fingerprint_hex))
+        # Process-local counters (exported by /metrics/prometheus)
+        self.stats = {"checked": 0, "duplicates": 0, "round_trips": 0}
+
+    def _bucket_keys(self, now: float) -> List[str]:
+        """Live bucket keys, current bucket first."""
+        current = int(now // self.bucket_seconds)
+        count = math.ceil(self.ttl_seconds / self.bucket_seconds) + 1
+        return [f"{self.prefix}:{bucket}" for bucket in range(current, current - count, -1)]
+
+    def _short(self, fingerprint: str) -> str:
+        return fingerprint[:self.fingerprint_hex]
+
+    def find_duplicates(self, fingerprints: Sequence[str]) -> Set[str]:
+        """Fingerprints already seen (in the store or earlier in this batch); records the rest.
+
+        Duplicates are also pushed to ``reviewer:duplicates:events`` for the
+        overseer's duplicate-rate endpoint.
+        """
+        if not fingerprints:
+            return set()
+        now = time.time()
+        keys = self._bucket_keys(now)
+        short = [self._short(fp) for fp in fingerprints]
+        unique = list(dict.fromkeys(short))
+
+        pipe = self.redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.smismember(key, unique)
+        seen_short = {
+            member
+            for flags in pipe.execute()
+            for member, flag in zip(unique, flags) if flag
+        }
+        self.stats["round_trips"] += 1
+
+        duplicates: Set[str] = set()
+        new_short: List[str] = []
+        batch_seen: Set[str] = set()
+        for fp, fp_short in zip(fingerprints, short):
+            if fp_short in seen_short or fp_short in batch_seen:
+                duplicates.add(fp)
+            else:
+                new_short.append(fp_short)
+            batch_seen.add(fp_short)
+
+        pipe = self.redis.pipeline(transaction=False)
+        if new_short:
+            pipe.sadd(keys[0], *new_short)
+            # The bucket stays until DEDUP_TTL after it closes
+            bucket_end = (int(now // self.bucket_seconds) + 1) * self.bucket_seconds
+            pipe.expireat(keys[0], int(bucket_end + self.ttl_seconds))
+        if duplicates:
+            stamp = str(int(now))
+            pipe.lpush(DUPLICATE_EVENTS_KEY, *([stamp] * (len(fingerprints) - len(new_short))))
+            pipe.ltrim(DUPLICATE_EVENTS_KEY, 0, 99999)
+        if new_short or duplicates:
+            pipe.execute()
+            self.stats["round_trips"] += 1
+
+        self.stats["checked"] += len(fingerprints)
+        self.stats["duplicates"] += len(fingerprints) - len(new_short)
+        return duplicates
+
+    def entry_count(self) -> int:
+        """Fingerprints currently held across live buckets."""
+        pipe = self.redis.pipeline(transaction=False)
+        for key in self._bucket_keys(time.time()):
+            pipe.scard(key)
+        return sum(pipe.execute())
+
+    def estimated_false_positive_rate(self, entries: int) -> float:
+        """Chance that a new fingerprint collides with one of ``entries`` stored truncated fingerprints."""
+        return -math.expm1(-entries / 16 ** self.fingerprint_hex)
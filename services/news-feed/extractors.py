@@ -0,0 +1,183 @@
+"""
+Main-text extraction for full-article enrichment.
+
+Two backends are available, chosen with ARTICLE_EXTRACTOR:
+
+- ``lxml`` (default when lxml is installed): the page is parsed with lxml's C
+  parser and paragraphs are scored readability-style. Every paragraph adds
+  points to its parent and grandparent for its length and commas. Containers
+  get a bonus or penalty from their class/id, and the score is discounted by
+  link density. The best-scoring container's paragraphs form the text.
+- ``soup``: the original BeautifulSoup ``html.parser`` walk over a list of
+  CSS selectors. It is kept for comparison and as a fallback.
+
+``Tests/Current/benchmark_article_extraction.py`` compares the two.
+"""
+import logging
+import os
+import re
+from typing import Callable, Dict, Optional
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml.html
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+ARTICLE_EXTRACTOR = os.getenv("ARTICLE_EXTRACTOR", "lxml" if LXML_AVAILABLE else "soup")
+# Extracted text is cut to this many characters
+ARTICLE_MAX_CHARS = int(os.getenv("ARTICLE_MAX_CHARS", "10000"))
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Elements that never hold article text
+BOILERPLATE_TAGS = ["script", "style", "nav", "footer", "aside", "header"]
+
+# Common selectors for article content (soup backend)
+CONTENT_SELECTORS = [
+    'article',
+    '.article-content',
+    '.post-content',
+    '.entry-content',
+    '.content',
+    '.story-content',
+    '.article-body',
+    '.post-body',
+    '[role="main"]',
+    'main',
+    '.main-content'
+]
+
+# Class/id hints used to weight candidate containers (lxml backend)
+POSITIVE_HINTS = re.compile(r"article|body|content|entry|main|page|post|story|text|blog", re.I)
+NEGATIVE_HINTS = re.compile(
+    r"comment|footer|footnote|sidebar|widget|nav|menu|promo|related|share|social|"
+    r"sponsor|advert|ad-|banner|subscribe|newsletter|cookie|popup|masthead|meta|tags",
+    re.I,
+)
+PARAGRAPH_TAGS = ("p", "pre", "blockquote", "li", "td")
+MIN_PARAGRAPH_CHARS = 25
+
+
+def _finish(text: str) -> str:
+    text = _WHITESPACE.sub(" ", text).strip()
+    # Limit content length to prevent extremely long articles
+    if len(text) > ARTICLE_MAX_CHARS:
+        text = text[:ARTICLE_MAX_CHARS] + "..."
+    return text
+
+
+def extract_text_soup(html: bytes) -> str:
+    """Original extractor: BeautifulSoup with ``html.parser`` and a selector list."""
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # Remove script and style elements
+    for script in soup(BOILERPLATE_TAGS):
+        script.decompose()
+
+    # Try to find the main article content
+    article_content = ""
+    for selector in CONTENT_SELECTORS:
+        content_elem = soup.select_one(selector)
+        if content_elem:
+            article_content = content_elem.get_text(separator=' ', strip=True)
+            break
+
+    # If no specific content found, try to get body text
+    if not article_content:
+        body = soup.find('body')
+        if body:
+            article_content = body.get_text(separator=' ', strip=True)
+
+    return _finish(article_content) if article_content else ""
+
+
+def _class_weight(element) -> int:
+    weight = 0
+    for hint in (element.get("class"), element.get("id")):
+        if hint:
+            if NEGATIVE_HINTS.search(hint):
+                weight -= 25
+            if POSITIVE_HINTS.search(hint):
+                weight += 25
+    return weight
+
+
+def _link_density(element) -> float:
+    text_length = len(element.text_content())
+    if not text_length:
+        return 1.0
+    link_length = sum(len(link.text_content()) for link in element.iter("a"))
+    return link_length / text_length
+
+
+def extract_text_lxml(html: bytes) -> str:
+    """Readability-style extraction on lxml's parser."""
+    if not html or not html.strip():
+        return ""
+    try:
+        doc = lxml.html.document_fromstring(html)
+    except (etree.ParserError, ValueError):
+        return ""
+
+    # Not "form": ASP.NET WebForms pages wrap the whole body in one
+    etree.strip_elements(doc, *BOILERPLATE_TAGS, "noscript", "iframe", "svg", etree.Comment, with_tail=False)
+
+    scores: Dict[object, float] = {}
+    for paragraph in doc.iter(*PARAGRAPH_TAGS):
+        text = paragraph.text_content()
+        if len(text) < MIN_PARAGRAPH_CHARS:
+            continue
+        points = 1 + text.count(",") + min(len(text) // 100, 3)
+        parent = paragraph.getparent()
+        if parent is None:
+            continue
+        grandparent = parent.getparent()
+        for node, share in ((parent, 1.0), (grandparent, 0.5)):
+            if node is None:
+                continue
+            if node not in scores:
+                scores[node] = _class_weight(node)
+            scores[node] += points * share
+
+    best = None
+    best_score = 0.0
+    for node, score in scores.items():
+        score *= 1 - _link_density(node)
+        if score > best_score:
+            best, best_score = node, score
+
+    if best is None:
+        body = doc.find("body")
+        return _finish(body.text_content()) if body is not None else ""
+
+    # A paragraph inside one already taken (a <p> in a <blockquote> or <li>) is part of its text
+    paragraphs = []
+    collected = set()
+    for p in best.iter(*PARAGRAPH_TAGS):
+        if collected and any(ancestor in collected for ancestor in p.iterancestors(*PARAGRAPH_TAGS)):
+            continue
+        text = p.text_content()
+        if len(text) >= MIN_PARAGRAPH_CHARS and _link_density(p) < 0.5:
+            collected.add(p)
+            paragraphs.append(text)
+    return _finish(" ".join(paragraphs) if paragraphs else best.text_content())
+
+
+EXTRACTORS: Dict[str, Callable[[bytes], str]] = {"soup": extract_text_soup}
+if LXML_AVAILABLE:
+    EXTRACTORS["lxml"] = extract_text_lxml
+
+
+def get_extractor(name: Optional[str] = None) -> Callable[[bytes], str]:
+    """Extractor by name (default ARTICLE_EXTRACTOR); unknown or unavailable names fall back to soup."""
+    name = name or ARTICLE_EXTRACTOR
+    if name not in EXTRACTORS:
+        logger.warning(f"Article extractor '{name}' unavailable; using soup")
+        return extract_text_soup
+    return EXTRACTORS[name]
@@ -0,0 +1,154 @@
+"""
+Incremental RSS/Atom parsing that stops at already-known entries.
+
+Most polls of a large (archive-style) feed add a handful of items at the
+top. ``parse_incremental`` walks entries in document order with
+``iterparse``, freeing each element as it goes. Every FEED_PARSE_CHUNK
+entries it asks ``known_links`` (one lookup per chunk) which links are
+already stored, and it stops once FEED_EARLY_STOP_RUN consecutive entries
+are known. Parse time and memory then follow the number of new entries,
+not the size of the feed.
+
+Early stopping assumes newest-first order. It is switched off for a parse
+whose first chunk is dated oldest-first. Documents that are not well-formed
+XML raise ``ParseError`` so the caller can fall back to feedparser.
+"""
+import io
+import os
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+from xml.etree.ElementTree import ParseError, iterparse
+
+FEED_INCREMENTAL_PARSE = os.getenv("FEED_INCREMENTAL_PARSE", "true").lower() in ("1", "true", "yes")
+FEED_EARLY_STOP_RUN = int(os.getenv("FEED_EARLY_STOP_RUN", "5"))
+FEED_PARSE_CHUNK = int(os.getenv("FEED_PARSE_CHUNK", "20"))
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+RSS1 = "{http://purl.org/rss/1.0/}"
+CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+RDF_ABOUT = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about"
+ENTRY_TAGS = {"item", f"{RSS1}item", f"{ATOM}entry"}
+
+__all__ = ["ParseError", "iter_feed_entries", "parse_incremental", "FEED_INCREMENTAL_PARSE"]
+
+
+def _text(element, *tags: str) -> str:
+    for tag in tags:
+        child = element.find(tag)
+        if child is not None and (child.text or "").strip():
+            return child.text.strip()
+    return ""
+
+
+def _atom_link(entry) -> str:
+    fallback = ""
+    for link in entry.findall(f"{ATOM}link"):
+        rel = link.get("rel", "alternate")
+        if rel == "alternate":
+            return link.get("href", "")
+        fallback = fallback or link.get("href", "")
+    # Like feedparser, an entry without links is identified by its id
+    return fallback or _text(entry, f"{ATOM}id")
+
+
+def _rss_link(item) -> str:
+    """``<link>``, else a permalink ``<guid>`` (RSS 2.0) or ``rdf:about`` (RSS 1.0)."""
+    link = _text(item, "link", f"{RSS1}link")
+    if link:
+        return link
+    guid = item.find("guid")
+    if guid is not None and guid.get("isPermaLink", "true").lower() != "false":
+        link = (guid.text or "").strip()
+    return link or (item.get(RDF_ABOUT) or "").strip()
+
+
+def _parse_date(value: str) -> Optional[datetime]:
+    """RFC 822 or ISO 8601 date as naive UTC (the shape feedparser's *_parsed gives)."""
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _entry(element) -> Dict:
+    if element.tag == f"{ATOM}entry":
+        return {
+            "title": _text(element, f"{ATOM}title"),
+            "link": _atom_link(element),
+            "summary": _text(element, f"{ATOM}summary"),
+            "content": _text(element, f"{ATOM}content"),
+            "publish_date": _parse_date(_text(element, f"{ATOM}published", f"{ATOM}updated")),
+        }
+    return {
+        "title": _text(element, "title", f"{RSS1}title"),
+        "link": _rss_link(element),
+        "summary": _text(element, "description", f"{RSS1}description"),
+        "content": _text(element, CONTENT_ENCODED),
+        "publish_date": _parse_date(_text(element, "pubDate", DC_DATE)),
+    }
+
+
+def iter_feed_entries(content: bytes) -> Iterator[Dict]:
+    """Entries of an RSS 2.0, RSS 1.0 or Atom document in document order."""
+    open_elements = []
+    for event, element in iterparse(io.BytesIO(content), events=("start", "end")):
+        if event == "start":
+            open_elements.append(element)
+            continue
+        open_elements.pop()
+        if element.tag in ENTRY_TAGS:
+            yield _entry(element)
+            # Drop the entry from the tree so memory stays flat
+            if open_elements:
+                open_elements[-1].remove(element)
+
+
+def parse_incremental(
+    content: bytes,
+    known_links: Callable[[List[str]], Set[str]],
+    stop_after: int = FEED_EARLY_STOP_RUN,
+    chunk_size: int = FEED_PARSE_CHUNK,
+) -> Tuple[List[Dict], Dict]:
+    """Parse entries until ``stop_after`` consecutive links are known.
+
+    ``known_links(links)`` returns the subset of ``links`` already stored.
+    Returns the parsed entries (known ones included) and parse stats.
+    """
+    entries: List[Dict] = []
+    chunk: List[Dict] = []
+    known_run = 0
+    newest_first: Optional[bool] = None
+    stopped_early = False
+
+    def check(batch: List[Dict]) -> bool:
+        nonlocal known_run, newest_first
+        if newest_first is None:
+            dates = [e["publish_date"] for e in batch if e["publish_date"]]
+            newest_first = len(dates) < 2 or dates[0] >= dates[-1]
+        known = known_links([e["link"] for e in batch if e["link"]])
+        for entry in batch:
+            known_run = known_run + 1 if entry["link"] in known else 0
+            if newest_first and known_run >= stop_after:
+                return True
+        return False
+
+    for entry in iter_feed_entries(content):
+        entries.append(entry)
+        chunk.append(entry)
+        if len(chunk) >= chunk_size:
+            if check(chunk):
+                stopped_early = True
+                break
+            chunk = []
+
+    return entries, {"parsed": len(entries), "stopped_early": stopped_early}
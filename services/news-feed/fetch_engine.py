@@ -0,0 +1,404 @@
+"""
+Concurrent, bounded feed sweep used by ``POST /feeds/fetch-all``.
+
+Every feed in a sweep goes through one pooled ``httpx.AsyncClient``. A global
+semaphore caps how many feeds are in flight and a per-host semaphore keeps a
+single publisher from receiving more than a few requests at once, so a sweep
+takes roughly as long as its slowest hosts instead of the sum of all feeds.
+The same client and the same kind of limits are used for full-article
+enrichment downloads.
+
+Every outbound request also passes an ``OutboundPolicy``: a token bucket per
+host (HOST_RATE_PER_SECOND, HOST_BURST) and a circuit breaker per host that
+opens after BREAKER_FAILURE_THRESHOLD consecutive failures (transport errors,
+HTTP 429 and 5xx). While a breaker is open, requests to that host fail at
+once with ``CircuitOpenError`` instead of waiting out a timeout. After
+BREAKER_RESET_SECONDS a single probe request is let through, and it closes
+or re-opens the breaker.
+"""
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+FEED_FETCH_CONCURRENCY = int(os.getenv("FEED_FETCH_CONCURRENCY", "20"))
+FEED_FETCH_PER_HOST = int(os.getenv("FEED_FETCH_PER_HOST", "2"))
+FEED_FETCH_TIMEOUT = float(os.getenv("FEED_FETCH_TIMEOUT", "30"))
+FEED_FETCH_MAX_CONNECTIONS = int(os.getenv("FEED_FETCH_MAX_CONNECTIONS", "100"))
+FEED_FETCH_USER_AGENT = os.getenv("FEED_FETCH_USER_AGENT", "PodcastAI-NewsFeed/1.0")
+
+# Full-article downloads in flight across the whole process, and per article host
+ENRICH_CONCURRENCY = int(os.getenv("ENRICH_CONCURRENCY", "16"))
+ENRICH_PER_HOST = int(os.getenv("ENRICH_PER_HOST", "4"))
+# Article pages get a shorter budget than feeds; a slow page is not worth 30 seconds
+ARTICLE_FETCH_TIMEOUT = float(os.getenv("ARTICLE_FETCH_TIMEOUT", "10"))
+
+# Per-host politeness and circuit breaking for every outbound request (0 disables the rate limit)
+HOST_RATE_PER_SECOND = float(os.getenv("HOST_RATE_PER_SECOND", "2"))
+HOST_BURST = int(os.getenv("HOST_BURST", "5"))
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RESET_SECONDS = float(os.getenv("BREAKER_RESET_SECONDS", "60"))
+# Hosts whose state is kept; the least recently used idle host is forgotten first
+HOST_STATE_MAX = int(os.getenv("HOST_STATE_MAX", "5000"))
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Shared client for feed and article downloads: keep-alive pooling across every feed and sweep.
+
+    HTTP/2 is negotiated where the server supports it, so requests to one
+    publisher are multiplexed over a single connection.
+    """
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=httpx.Timeout(FEED_FETCH_TIMEOUT, connect=10.0),
+        limits=httpx.Limits(
+            max_connections=FEED_FETCH_MAX_CONNECTIONS,
+            max_keepalive_connections=FEED_FETCH_MAX_CONNECTIONS,
+            keepalive_expiry=60.0,
+        ),
+        headers={"User-Agent": FEED_FETCH_USER_AGENT},
+        follow_redirects=True,
+    )
+
+
+def host_of(url: str) -> str:
+    return (urlparse(url).hostname or "").lower()
+
+
+class HostLimiter:
+    """Lazily created semaphore per host."""
+
+    def __init__(self, per_host: int):
+        self.per_host = max(1, per_host)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def for_host(self, host: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self.per_host)
+        return semaphore
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to a host whose circuit breaker is open."""
+
+
+def is_host_failure(error: Exception) -> bool:
+    """Whether an error says the host is unhealthy (as opposed to e.g. a 404)."""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate`` per second up to ``burst``; waiters are served in arrival order."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+
+    async def acquire(self) -> float:
+        """Take a token, sleeping until it is available. Returns the seconds waited."""
+        if self.rate <= 0:
+            return 0.0
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        # Reserve the token now; a negative balance is the queue of earlier waiters
+        self.tokens -= 1
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class CircuitBreaker:
+    """Closed -> open after ``failure_threshold`` consecutive failures -> half-open after ``reset_seconds``."""
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.opens = 0
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self.opened_at >= self.reset_seconds:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allows_request(self) -> bool:
+        state = self.state
+        return state == self.CLOSED or (state == self.HALF_OPEN and not self._probing)
+
+    def before_request(self, host: str) -> None:
+        """Raise CircuitOpenError unless a request may go out; a half-open breaker lets one probe through."""
+        if not self.allows_request():
+            raise CircuitOpenError(f"Circuit open for {host}")
+        if self.state == self.HALF_OPEN:
+            self._probing = True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._probing or self.failures >= self.failure_threshold:
+            if self.opened_at is None or self._probing:
+                self.opens += 1
+            self.opened_at = time.monotonic()
+        self._probing = False
+
+    def release(self) -> None:
+        """Forget an in-flight probe that ended without an outcome (e.g. cancelled)."""
+        self._probing = False
+
+
+class HostState:
+    """Rate limit, breaker and latency counters of one host."""
+
+    # Weight of the latest request in the latency EWMA
+    LATENCY_EWMA_WEIGHT = 0.2
+
+    def __init__(self, rate: float, burst: int, failure_threshold: int, reset_seconds: float):
+        self.bucket = TokenBucket(rate, burst)
+        self.breaker = CircuitBreaker(failure_threshold, reset_seconds)
+        self.requests = 0
+        self.failures = 0
+        self.rejected = 0
+        self.latency_ewma: Optional[float] = None
+        self.latency_total = 0.0
+        self.throttled_seconds = 0.0
+
+    def record(self, ok: bool, seconds: float) -> None:
+        self.requests += 1
+        self.latency_total += seconds
+        if self.latency_ewma is None:
+            self.latency_ewma = seconds
+        else:
+            self.latency_ewma += self.LATENCY_EWMA_WEIGHT * (seconds - self.latency_ewma)
+        if ok:
+            self.breaker.record_success()
+        else:
+            self.failures += 1
+            self.breaker.record_failure()
+
+
+class OutboundPolicy:
+    """Per-host token bucket, circuit breaker and latency stats shared by every outbound request."""
+
+    def __init__(
+        self,
+        rate: float = HOST_RATE_PER_SECOND,
+        burst: int = HOST_BURST,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_seconds: float = BREAKER_RESET_SECONDS,
+        max_hosts: int = HOST_STATE_MAX,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.max_hosts = max(1, max_hosts)
+        self._hosts: "OrderedDict[str, HostState]" = OrderedDict()
+
+    def host(self, host: str) -> HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = HostState(self.rate, self.burst, self.failure_threshold, self.reset_seconds)
+            if len(self._hosts) > self.max_hosts:
+                self._forget_idle_host(keep=host)
+        self._hosts.move_to_end(host)
+        return state
+
+    def _forget_idle_host(self, keep: str) -> None:
+        for host, state in self._hosts.items():
+            if host != keep and state.breaker.state == CircuitBreaker.CLOSED:
+                del self._hosts[host]
+                return
+
+    def is_open(self, url: str) -> bool:
+        """Whether a request to ``url`` would be rejected right now."""
+        state = self._hosts.get(host_of(url))
+        return state is not None and not state.breaker.allows_request()
+
+    async def throttle(self, url: str) -> None:
+        """Wait for a rate-limit token of ``url``'s host ahead of ``guard(url, throttled=True)``.
+
+        Lets a caller wait out the host's rate limit before it takes a
+        concurrency slot that other hosts are waiting for.
+        """
+        state = self.host(host_of(url))
+        state.throttled_seconds += await state.bucket.acquire()
+
+    @asynccontextmanager
+    async def guard(self, url: str, throttled: bool = False):
+        """Wrap one request to ``url``: breaker check, rate limit, then outcome and latency bookkeeping.
+
+        Errors raised in the block are classified with ``is_host_failure``, so
+        callers should call ``raise_for_status()`` inside it. ``throttled``
+        skips the rate limit for a caller that already called ``throttle``.
+        """
+        host = host_of(url)
+        state = self.host(host)
+        try:
+            state.breaker.before_request(host)
+        except CircuitOpenError:
+            state.rejected += 1
+            raise
+        if not throttled:
+            state.throttled_seconds += await state.bucket.acquire()
+        started = time.perf_counter()
+        try:
+            yield
+        except asyncio.CancelledError:
+            state.breaker.release()
+            raise
+        except Exception as e:
+            state.record(not is_host_failure(e), time.perf_counter() - started)
+            raise
+        else:
+            state.record(True, time.perf_counter() - started)
+
+    def totals(self) -> Dict[str, Any]:
+        """Process-wide counters across the hosts currently tracked."""
+        states = list(self._hosts.values())
+        return {
+            "hosts": len(states),
+            "requests": sum(s.requests for s in states),
+            "failures": sum(s.failures for s in states),
+            "rejected": sum(s.rejected for s in states),
+            "throttled_seconds": sum(s.throttled_seconds for s in states),
+            "open": sum(1 for s in states if s.breaker.state == CircuitBreaker.OPEN),
+            "half_open": sum(1 for s in states if s.breaker.state == CircuitBreaker.HALF_OPEN),
+        }
+
+    def snapshot(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Per-host stats: every host whose breaker is not closed, plus the busiest ``limit`` hosts."""
+        busiest = sorted(self._hosts.items(), key=lambda item: -item[1].requests)[:limit]
+        chosen = dict(busiest)
+        chosen.update(
+            (host, state) for host, state in self._hosts.items()
+            if state.breaker.state != CircuitBreaker.CLOSED
+        )
+        return [
+            {
+                "host": host,
+                "state": state.breaker.state,
+                "requests": state.requests,
+                "failures": state.failures,
+                "rejected": state.rejected,
+                "opens": state.breaker.opens,
+                "latency_ewma_seconds": round(state.latency_ewma or 0.0, 4),
+                "latency_avg_seconds": round(state.latency_total / state.requests, 4) if state.requests else 0.0,
+                "throttled_seconds": round(state.throttled_seconds, 4),
+            }
+            for host, state in chosen.items()
+        ]
+
+
+class RequestLimiter:
+    """Global plus per-host concurrency cap, shared by every caller in the process."""
+
+    def __init__(self, concurrency: int, per_host: int):
+        self.global_limit = asyncio.Semaphore(max(1, concurrency))
+        self.hosts = HostLimiter(per_host)
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        async with self.hosts.for_host(host_of(url)):
+            async with self.global_limit:
+                yield
+
+
+async def run_sweep(
+    feeds: List[Dict[str, Any]],
+    fetch_one: Callable[[Any], Awaitable[Dict[str, Any]]],
+    concurrency: int = FEED_FETCH_CONCURRENCY,
+    per_host: int = FEED_FETCH_PER_HOST,
+) -> Dict[str, Any]:
+    """Fetch ``feeds`` (dicts with ``id`` and ``url``) concurrently and report per-feed timings.
+
+    ``fetch_one(feed_id)`` does the download and ingest for one feed and
+    returns a dict of counters (e.g. ``entries``, ``new_articles``) that is
+    merged into that feed's report. A feed whose result has ``status`` "error",
+    or whose ``fetch_one`` raises, is counted in ``errors`` and its host is
+    listed in ``error_hosts``.
+    """
+    global_limit = asyncio.Semaphore(max(1, concurrency))
+    hosts = HostLimiter(per_host)
+    sweep_start = time.perf_counter()
+
+    async def run_one(feed: Dict[str, Any]) -> Dict[str, Any]:
+        host = host_of(feed["url"])
+        report: Dict[str, Any] = {"feed_id": str(feed["id"]), "url": feed["url"], "host": host}
+        queued_at = time.perf_counter()
+        async with hosts.for_host(host):
+            async with global_limit:
+                started_at = time.perf_counter()
+                report["queued_seconds"] = round(started_at - queued_at, 4)
+                try:
+                    report.update(await fetch_one(feed["id"]) or {})
+                    report.setdefault("status", "ok")
+                except Exception as e:
+                    logger.error(f"Feed {feed['id']} failed during sweep: {e}")
+                    report["status"] = "error"
+                    report["error"] = str(e)
+                report["fetch_seconds"] = round(time.perf_counter() - started_at, 4)
+        return report
+
+    reports = await asyncio.gather(*(run_one(feed) for feed in feeds))
+    elapsed = time.perf_counter() - sweep_start
+
+    failed = [r for r in reports if r.get("status") == "error"]
+    fetch_total = sum(r["fetch_seconds"] for r in reports)
+    slowest: Optional[Dict[str, Any]] = max(reports, key=lambda r: r["fetch_seconds"], default=None)
+    summary = {
+        "feeds": len(reports),
+        "ok": sum(1 for r in reports if r.get("status") == "ok"),
+        "errors": len(failed),
+        "error_hosts": sorted({r["host"] for r in failed}),
+        # Feeds skipped by conditional GET (HTTP 304 or identical body)
+        "unchanged": sum(1 for r in reports if r.get("status") in ("not_modified", "unchanged")),
+        "new_articles": sum(r.get("new_articles", 0) for r in reports),
+        "hosts": len({r["host"] for r in reports}),
+        "concurrency": concurrency,
+        "per_host": per_host,
+        "elapsed_seconds": round(elapsed, 4),
+        # What a one-at-a-time sweep would have spent fetching
+        "sequential_seconds": round(fetch_total, 4),
+        "slowest_feed_seconds": slowest["fetch_seconds"] if slowest else 0.0,
+    }
+    logger.info(
+        f"Feed sweep: {summary['feeds']} feeds over {summary['hosts']} hosts in "
+        f"{summary['elapsed_seconds']:.1f}s (sequential {summary['sequential_seconds']:.1f}s), "
+        f"{summary['new_articles']} new articles, {summary['errors']} errors"
+        + (f" (hosts: {', '.join(summary['error_hosts'])})" if failed else "")
+    )
+    return {"summary": summary, "feeds": sorted(reports, key=lambda r: -r["fetch_seconds"])}
@@ -4,244 +4,468 @@ Enhanced with Redis-backed deduplication fingerprints to reduce reviewer load.
 """
 import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import List, Optional
-from uuid import UUID
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from uuid import UUID, uuid4
 
 import feedparser
 import httpx
 from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 import os
 import hashlib
 import redis
-import re
-from bs4 import BeautifulSoup
+import redis.asyncio as aioredis
 
 from shared.database import get_db, create_tables
 from shared.models import NewsFeed, Article, FeedType
+from shared.stats import read_counters, article_counts_by_reviewer
+from shared.clusters import copy_cluster_reviews
 from shared.schemas import NewsFeedCreate, NewsFeedUpdate, NewsFeed as NewsFeedSchema, Article as ArticleSchema
 
+try:
+    from .fetch_engine import (
+        create_http_client, run_sweep, RequestLimiter, OutboundPolicy, CircuitOpenError,
+        ENRICH_CONCURRENCY, ENRICH_PER_HOST, ARTICLE_FETCH_TIMEOUT
+    )
+    from .content_cache import ArticleContentCache, ARTICLE_CACHE_ENABLED
+    from .extractors import get_extractor
+    from .dedup_store import FingerprintStore, DEDUP_TTL
+    from .near_dup import NearDuplicateIndex, near_dup_text, NEAR_DUP_ENABLED
+    from .poll_scheduler import PollScheduler, compute_interval, update_unchanged_ratio, jittered, retry_interval
+    from .poll_scheduler import POLL_DEFAULT_SECONDS, POLL_HISTORY_SIZE
+    from .feed_stream import ParseError, parse_incremental, FEED_INCREMENTAL_PARSE
+except ImportError:
+    from fetch_engine import (
+        create_http_client, run_sweep, RequestLimiter, OutboundPolicy, CircuitOpenError,
+        ENRICH_CONCURRENCY, ENRICH_PER_HOST, ARTICLE_FETCH_TIMEOUT
+    )
+    from content_cache import ArticleContentCache, ARTICLE_CACHE_ENABLED
+    from extractors import get_extractor
+    from dedup_store import FingerprintStore, DEDUP_TTL
+    from near_dup import NearDuplicateIndex, near_dup_text, NEAR_DUP_ENABLED
+    from poll_scheduler import PollScheduler, compute_interval, update_unchanged_ratio, jittered, retry_interval
+    from poll_scheduler import POLL_DEFAULT_SECONDS, POLL_HISTORY_SIZE
+    from feed_stream import ParseError, parse_incremental, FEED_INCREMENTAL_PARSE
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 app = FastAPI(title="News Feed Service", version="1.0.0")
 
+# Shared pooled client for feed downloads (created on startup)
+http_client: Optional[httpx.AsyncClient] = None
+
+# Entries with less content than this get the full article downloaded
+ENRICH_MIN_CONTENT_CHARS = int(os.getenv("ENRICH_MIN_CONTENT_CHARS", "500"))
+enrichment_limiter = RequestLimiter(ENRICH_CONCURRENCY, ENRICH_PER_HOST)
+# Per-host rate limit, circuit breaker and latency for every feed and article download
+outbound_policy = OutboundPolicy()
+# Article pages are read up to this many bytes
+ARTICLE_MAX_BYTES = int(os.getenv("ARTICLE_MAX_BYTES", str(2 * 1024 * 1024)))
+article_extractor = get_extractor()
+# Cross-poll fingerprint dedup (created on startup)
+fingerprint_store: Optional[FingerprintStore] = None
+# Near-duplicate clusters across feeds (created on startup when enabled)
+near_dup_index: Optional[NearDuplicateIndex] = None
+# Extracted article text by canonical URL (created on startup when enabled)
+article_cache: Optional[ArticleContentCache] = None
+
+# Feeds fetched more recently than this are not due in a /feeds/fetch-all sweep
+# (only applies to feeds the adaptive scheduler has not planned yet)
+FEED_MIN_REFETCH_MINUTES = float(os.getenv("FEED_MIN_REFETCH_MINUTES", "5"))
+
+# Adaptive per-feed polling loop (see poll_scheduler.py)
+FEED_SCHEDULER_ENABLED = os.getenv("FEED_SCHEDULER_ENABLED", "true").lower() in ("1", "true", "yes")
+# How often the in-memory schedule is reloaded to pick up feed changes
+POLL_RELOAD_SECONDS = float(os.getenv("POLL_RELOAD_SECONDS", "300"))
+poll_scheduler = PollScheduler()
+poll_stats = {"dispatched": 0, "deferred": 0, "failed": 0}
+# Consecutive failed fetches per feed id; a failure is retried with backoff instead of counting as "unchanged"
+poll_failures: Dict[str, int] = {}
+_scheduler_task: Optional[asyncio.Task] = None
+
+# Replay ETag/Last-Modified and compare body hashes so unchanged feeds are not re-parsed
+FEED_CONDITIONAL_GET = os.getenv("FEED_CONDITIONAL_GET", "true").lower() in ("1", "true", "yes")
+
+# Process-local conditional GET counters (exported by /metrics/prometheus)
+conditional_fetch_stats = {"fetched": 0, "not_modified": 0, "unchanged": 0,
+                           "bytes_downloaded": 0, "bytes_saved": 0}
+# Size of the last full body per feed URL, used to estimate bytes saved by a 304
+_last_body_size: Dict[str, int] = {}
+
+
+def record_conditional_fetch(feed_url: str, result: str, size: int) -> None:
+    """Count one feed download by outcome: fetched, not_modified or unchanged."""
+    conditional_fetch_stats[result] += 1
+    conditional_fetch_stats["bytes_downloaded"] += size
+    if result == "not_modified":
+        conditional_fetch_stats["bytes_saved"] += _last_body_size.get(feed_url, 0)
+    else:
+        _last_body_size[feed_url] = size
+
+
+# Process-local feed parsing counters (exported by /metrics/prometheus)
+parse_stats = {"incremental": 0, "stopped_early": 0, "entries_parsed": 0, "fallbacks": 0}
+
 # Create tables on startup
 @app.on_event("startup")
 async def startup_event():
     create_tables()
+    global http_client
+    http_client = create_http_client()
     logger.info("News Feed Service started")
     # Initialize Redis for deduplication metrics
-    global redis_client
+    global redis_client, fingerprint_store, near_dup_index
     try:
         redis_client = redis.Redis.from_url(os.getenv("REDIS_URL", "redis://redis:6379/0"), decode_responses=True)
+        # Time-bucketed sets under reviewer:fingerprints:<bucket>, see dedup_store.py
+        fingerprint_store = FingerprintStore(redis_client, prefix="reviewer:fingerprints", ttl_seconds=DEDUP_TTL)
+        if NEAR_DUP_ENABLED:
+            near_dup_index = NearDuplicateIndex(redis_client)
     except Exception as e:
         redis_client = None
+        fingerprint_store = None
+        near_dup_index = None
         logger.warning(f"Redis unavailable for dedup: {e}")
+    global article_cache
+    if ARTICLE_CACHE_ENABLED:
+        article_cache = ArticleContentCache(
+            aioredis.Redis.from_url(os.getenv("REDIS_URL", "redis://redis:6379/0"), decode_responses=True)
+        )
+    global _scheduler_task
+    if FEED_SCHEDULER_ENABLED:
+        _scheduler_task = asyncio.create_task(_scheduler_loop())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    if _scheduler_task is not None:
+        _scheduler_task.cancel()
+    if http_client is not None:
+        await http_client.aclose()
+    if article_cache is not None:
+        await article_cache.redis.aclose()
 
 
 class NewsFeedProcessor:
     """Handles RSS feed processing and article extraction."""
     
     @staticmethod
-    async def fetch_full_article_content(article_url: str) -> str:
-        """Fetch full article content from the article URL."""
+    async def fetch_full_article_content(
+        article_url: str,
+        client: Optional[httpx.AsyncClient] = None,
+        throttled: bool = False
+    ) -> str:
+        """Fetch full article content from the article URL (through ``client`` when given).
+        
+        ``throttled`` means the caller already took the host's rate-limit token.
+        """
+        if client is None:
+            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as own_client:
+                return await NewsFeedProcessor.fetch_full_article_content(article_url, own_client, throttled)
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                # Add headers to appear as a regular browser
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                    'Accept-Encoding': 'gzip, deflate',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                }
-                
-                response = await client.get(article_url, headers=headers)
-                response.raise_for_status()
-                
-                # Parse HTML content
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Remove script and style elements
-                for script in soup(["script", "style", "nav", "footer", "aside", "header"]):
-                    script.decompose()
-                
-                # Try to find the main article content
-                article_content = ""
-                
-                # Common selectors for article content
-                content_selectors = [
-                    'article',
-                    '.article-content',
-                    '.post-content',
-                    '.entry-content',
-                    '.content',
-                    '.story-content',
-                    '.article-body',
-                    '.post-body',
-                    '[role="main"]',
-                    'main',
-                    '.main-content'
-                ]
-                
-                for selector in content_selectors:
-                    content_elem = soup.select_one(selector)
-                    if content_elem:
-                        article_content = content_elem.get_text(separator=' ', strip=True)
-                        break
-                
-                # If no specific content found, try to get body text
-                if not article_content:
-                    body = soup.find('body')
-                    if body:
-                        article_content = body.get_text(separator=' ', strip=True)
-                
-                # Clean up the content
-                if article_content:
-                    # Remove extra whitespace
-                    article_content = re.sub(r'\s+', ' ', article_content)
-                    # Limit content length to prevent extremely long articles
-                    if len(article_content) > 10000:
-                        article_content = article_content[:10000] + "..."
-                
-                return article_content
-                
+            # Add headers to appear as a regular browser
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.5',
+                'Upgrade-Insecure-Requests': '1',
+            }
+            
+            # Stream the page and stop at ARTICLE_MAX_BYTES; the article text
+            # is near the top and some pages are many megabytes of markup
+            async with outbound_policy.guard(article_url, throttled=throttled):
+                async with client.stream("GET", article_url, headers=headers, timeout=ARTICLE_FETCH_TIMEOUT) as response:
+                    response.raise_for_status()
+                    content_type = response.headers.get("Content-Type", "")
+                    if content_type and "html" not in content_type:
+                        logger.info(f"Skipping non-HTML article {article_url} ({content_type})")
+                        return ""
+                    chunks = []
+                    size = 0
+                    async for chunk in response.aiter_bytes():
+                        chunks.append(chunk)
+                        size += len(chunk)
+                        if size >= ARTICLE_MAX_BYTES:
+                            break
+            html = b"".join(chunks)[:ARTICLE_MAX_BYTES]
+            
+            # HTML parsing is CPU-bound; keep it off the event loop
+            article_content = await asyncio.to_thread(NewsFeedProcessor.extract_article_text, html)
+            if article_cache is not None:
+                await article_cache.put(article_url, article_content, len(html))
+            return article_content
+            
+        except CircuitOpenError as e:
+            logger.debug(f"Skipping full content for {article_url}: {e}")
+            return ""
         except Exception as e:
             logger.warning(f"Error fetching full content from {article_url}: {e}")
             return ""
     
     @staticmethod
-    async def fetch_rss_feed(feed_url: str) -> List[dict]:
-        """Fetch and parse RSS feed."""
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(feed_url)
+    def extract_article_text(html: bytes) -> str:
+        """Main text of an article page (backend chosen by ARTICLE_EXTRACTOR)."""
+        return article_extractor(html)
+    
+    @staticmethod
+    async def enrich_articles(articles: List[dict], client: Optional[httpx.AsyncClient] = None) -> int:
+        """Replace short entry content with the full article text, concurrently.
+        
+        Pages already in the article cache are not downloaded again. Downloads
+        share ``client`` and are bounded process-wide by ENRICH_CONCURRENCY and
+        per article host by ENRICH_PER_HOST. Returns the number of articles
+        whose content was replaced. Articles on hosts whose circuit breaker is
+        open keep their feed content.
+        """
+        client = client or http_client
+        
+        targets = [
+            article for article in articles
+            if article.get("link") and len(article.get("content") or "") < ENRICH_MIN_CONTENT_CHARS
+        ]
+        cached = await article_cache.get_many([a["link"] for a in targets]) if article_cache else {}
+        
+        async def enrich(article: dict) -> bool:
+            full_content = cached.get(article["link"])
+            if full_content is None:
+                if outbound_policy.is_open(article["link"]):
+                    return False
+                # Wait out the host's rate limit before holding a global download slot
+                await outbound_policy.throttle(article["link"])
+                async with enrichment_limiter.slot(article["link"]):
+                    full_content = await NewsFeedProcessor.fetch_full_article_content(
+                        article["link"], client, throttled=True
+                    )
+            if full_content and len(full_content) > len(article["content"] or ""):
+                logger.info(f"Fetched full content for {article['title'][:50]}... ({len(full_content)} chars)")
+                article["content"] = full_content
+                return True
+            return False
+        
+        results = await asyncio.gather(*(enrich(article) for article in targets))
+        return sum(results)
+    
+    @staticmethod
+    async def conditional_get(
+        client: httpx.AsyncClient,
+        feed_url: str,
+        validators: Optional[dict] = None
+    ) -> Optional[httpx.Response]:
+        """GET a feed, replaying stored validators. Returns None when the feed is unchanged.
+        
+        ``validators`` (etag, last_modified, body_hash) is updated in place from
+        the response, and ``validators["result"]`` is set to ``fetched``,
+        ``not_modified`` (HTTP 304) or ``unchanged`` (200 with an identical body).
+        """
+        headers = {}
+        if validators:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+        
+        async with outbound_policy.guard(feed_url):
+            response = await client.get(feed_url, headers=headers)
+            if response.status_code != 304:
                 response.raise_for_status()
-                
-                # Parse RSS feed
-                parsed = feedparser.parse(response.content)
-                
-                articles = []
-                for entry in parsed.entries:
-                    # Get basic article info
-                    title = entry.get("title", "")
-                    link = entry.get("link", "")
-                    summary = entry.get("summary", "") or entry.get("description", "")
-                    rss_content = entry.get("content", [{}])[0].get("value", "") if entry.get("content") else ""
-                    
-                    # If we have a link but limited content, try to fetch full content
-                    full_content = rss_content
-                    if link and (not rss_content or len(rss_content) < 500):
-                        try:
-                            full_content = await NewsFeedProcessor.fetch_full_article_content(link)
-                            if full_content and len(full_content) > len(rss_content):
-                                logger.info(f"Fetched full content for {title[:50]}... ({len(full_content)} chars)")
-                        except Exception as e:
-                            logger.warning(f"Failed to fetch full content for {link}: {e}")
-                            full_content = rss_content
-                    
-                    article = {
-                        "title": title,
-                        "link": link,
-                        "summary": summary,
-                        "content": full_content,
-                        "publish_date": None
-                    }
-                    
-                    # Parse publish date
-                    if hasattr(entry, "published_parsed") and entry.published_parsed:
-                        article["publish_date"] = datetime(*entry.published_parsed[:6])
-                    elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
-                        article["publish_date"] = datetime(*entry.updated_parsed[:6])
-                    
-                    articles.append(article)
-                
-                return articles
-                
+        if response.status_code == 304:
+            if validators is not None:
+                validators["etag"] = response.headers.get("ETag") or validators.get("etag")
+                validators["last_modified"] = response.headers.get("Last-Modified") or validators.get("last_modified")
+                validators["result"] = "not_modified"
+            record_conditional_fetch(feed_url, "not_modified", 0)
+            return None
+        
+        body_hash = hashlib.sha256(response.content).hexdigest()
+        unchanged = bool(validators) and validators.get("body_hash") == body_hash
+        if validators is not None:
+            validators.update({
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "body_hash": body_hash,
+                "result": "unchanged" if unchanged else "fetched",
+            })
+        record_conditional_fetch(feed_url, "unchanged" if unchanged else "fetched", len(response.content))
+        return None if unchanged else response
+    
+    @staticmethod
+    async def fetch_rss_feed(
+        feed_url: str,
+        client: Optional[httpx.AsyncClient] = None,
+        validators: Optional[dict] = None,
+        known_links=None
+    ) -> List[dict]:
+        """Fetch and parse RSS feed (through ``client`` when given, e.g. the shared pool).
+        
+        With ``validators`` the download is conditional (see ``conditional_get``)
+        and an unchanged feed returns no entries without being parsed. With
+        ``known_links`` parsing stops early at already-stored entries (see
+        ``parse_rss_content``). Download and parse errors are raised, so a
+        failed poll is not mistaken for an empty feed.
+        """
+        if client is None:
+            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as own_client:
+                return await NewsFeedProcessor.fetch_rss_feed(feed_url, own_client, validators, known_links)
+        try:
+            response = await NewsFeedProcessor.conditional_get(client, feed_url, validators)
+            if response is None:
+                return []
+            return await NewsFeedProcessor.parse_rss_content(response.content, known_links)
+            
         except Exception as e:
             logger.error(f"Error fetching RSS feed {feed_url}: {e}")
-            return []
+            if validators is not None:
+                validators["result"] = "error"
+            raise
     
     @staticmethod
-    async def fetch_mcp_feed(feed_url: str) -> List[dict]:
-        """Fetch and parse MCP feed."""
+    async def parse_rss_content(content: bytes, known_links=None) -> List[dict]:
+        """Parse an RSS/Atom document into article dicts.
+        
+        ``known_links(links)`` returns the links already stored for the feed.
+        When given, the document is parsed incrementally and parsing stops
+        after a run of known entries (see feed_stream.parse_incremental).
+        Documents the incremental parser rejects go through feedparser.
+        """
+        if known_links is not None and FEED_INCREMENTAL_PARSE:
+            try:
+                articles, stats = await asyncio.to_thread(parse_incremental, content, known_links)
+                parse_stats["incremental"] += 1
+                parse_stats["entries_parsed"] += stats["parsed"]
+                if stats["stopped_early"]:
+                    parse_stats["stopped_early"] += 1
+                return articles
+            except ParseError as e:
+                logger.debug(f"Incremental parse failed, falling back to feedparser: {e}")
+                parse_stats["fallbacks"] += 1
+        
+        parsed = await asyncio.to_thread(feedparser.parse, content)
+        parse_stats["entries_parsed"] += len(parsed.entries)
+        
+        articles = []
+        for entry in parsed.entries:
+            # Get basic article info
+            title = entry.get("title", "")
+            link = entry.get("link", "")
+            summary = entry.get("summary", "") or entry.get("description", "")
+            rss_content = entry.get("content", [{}])[0].get("value", "") if entry.get("content") else ""
+            
+            # Short content is replaced with the full article later, once the
+            # entry has passed dedup (see enrich_articles)
+            article = {
+                "title": title,
+                "link": link,
+                "summary": summary,
+                "content": rss_content,
+                "publish_date": None
+            }
+            
+            # Parse publish date
+            if hasattr(entry, "published_parsed") and entry.published_parsed:
+                article["publish_date"] = datetime(*entry.published_parsed[:6])
+            elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
+                article["publish_date"] = datetime(*entry.updated_parsed[:6])
+            
+            articles.append(article)
+        
+        return articles
+    
+    @staticmethod
+    async def fetch_mcp_feed(
+        feed_url: str,
+        client: Optional[httpx.AsyncClient] = None,
+        validators: Optional[dict] = None,
+        known_links=None
+    ) -> List[dict]:
+        """Fetch and parse MCP feed (through ``client`` when given, e.g. the shared pool).
+        
+        With ``validators`` the download is conditional, as for RSS feeds.
+        ``known_links`` is used when the body turns out to be RSS. Download
+        errors are raised.
+        """
+        if client is None:
+            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as own_client:
+                return await NewsFeedProcessor.fetch_mcp_feed(feed_url, own_client, validators, known_links)
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(feed_url)
-                response.raise_for_status()
+            response = await NewsFeedProcessor.conditional_get(client, feed_url, validators)
+            if response is None:
+                return []
+            
+            # Parse MCP feed (Model Context Protocol)
+            # MCP feeds typically return JSON with structured data
+            try:
+                mcp_data = response.json()
+                articles = []
                 
-                # Parse MCP feed (Model Context Protocol)
-                # MCP feeds typically return JSON with structured data
-                try:
-                    mcp_data = response.json()
-                    articles = []
-                    
-                    # Handle different MCP feed formats
-                    if isinstance(mcp_data, dict):
-                        # Check for common MCP feed structures
-                        if "items" in mcp_data:
-                            items = mcp_data["items"]
-                        elif "articles" in mcp_data:
-                            items = mcp_data["articles"]
-                        elif "data" in mcp_data:
-                            items = mcp_data["data"]
-                        else:
-                            # Try to extract articles from the root object
-                            items = [mcp_data] if mcp_data else []
-                    elif isinstance(mcp_data, list):
-                        items = mcp_data
+                # Handle different MCP feed formats
+                if isinstance(mcp_data, dict):
+                    # Check for common MCP feed structures
+                    if "items" in mcp_data:
+                        items = mcp_data["items"]
+                    elif "articles" in mcp_data:
+                        items = mcp_data["articles"]
+                    elif "data" in mcp_data:
+                        items = mcp_data["data"]
                     else:
-                        logger.warning(f"Unexpected MCP feed format: {type(mcp_data)}")
-                        return []
-                    
-                    for item in items:
-                        if not isinstance(item, dict):
-                            continue
-                            
-                        article = {
-                            "title": item.get("title", item.get("headline", "")),
-                            "link": item.get("url", item.get("link", "")),
-                            "summary": item.get("summary", item.get("description", item.get("excerpt", ""))),
-                            "content": item.get("content", item.get("body", "")),
-                            "publish_date": None
-                        }
-                        
-                        # Parse publish date from various formats
-                        pub_date = item.get("published_at", item.get("date", item.get("created_at")))
-                        if pub_date:
-                            try:
-                                from datetime import datetime
-                                if isinstance(pub_date, str):
-                                    # Try different date formats
-                                    for fmt in ["%Y-%m-%dT%H:%M:%S", "%Y-%m-%d", "%Y-%m-%d %H:%M:%S"]:
-                                        try:
-                                            article["publish_date"] = datetime.strptime(pub_date, fmt)
-                                            break
-                                        except ValueError:
-                                            continue
-                                elif isinstance(pub_date, (int, float)):
-                                    # Unix timestamp
-                                    article["publish_date"] = datetime.fromtimestamp(pub_date)
-                            except Exception as e:
-                                logger.warning(f"Could not parse date {pub_date}: {e}")
+                        # Try to extract articles from the root object
+                        items = [mcp_data] if mcp_data else []
+                elif isinstance(mcp_data, list):
+                    items = mcp_data
+                else:
+                    logger.warning(f"Unexpected MCP feed format: {type(mcp_data)}")
+                    return []
+                
+                for item in items:
+                    if not isinstance(item, dict):
+                        continue
                         
-                        articles.append(article)
+                    article = {
+                        "title": item.get("title", item.get("headline", "")),
+                        "link": item.get("url", item.get("link", "")),
+                        "summary": item.get("summary", item.get("description", item.get("excerpt", ""))),
+                        "content": item.get("content", item.get("body", "")),
+                        "publish_date": None
+                    }
                     
-                    return articles
+                    # Parse publish date from various formats
+                    pub_date = item.get("published_at", item.get("date", item.get("created_at")))
+                    if pub_date:
+                        try:
+                            from datetime import datetime
+                            if isinstance(pub_date, str):
+                                # Try different date formats
+                                for fmt in ["%Y-%m-%dT%H:%M:%S", "%Y-%m-%d", "%Y-%m-%d %H:%M:%S"]:
+                                    try:
+                                        article["publish_date"] = datetime.strptime(pub_date, fmt)
+                                        break
+                                    except ValueError:
+                                        continue
+                            elif isinstance(pub_date, (int, float)):
+                                # Unix timestamp
+                                article["publish_date"] = datetime.fromtimestamp(pub_date)
+                        except Exception as e:
+                            logger.warning(f"Could not parse date {pub_date}: {e}")
                     
-                except ValueError as e:
-                    logger.error(f"Error parsing MCP JSON feed {feed_url}: {e}")
-                    # Fallback to RSS parsing
-                    return await NewsFeedProcessor.fetch_rss_feed(feed_url)
+                    articles.append(article)
                 
+                return articles
+                
+            except ValueError as e:
+                logger.error(f"Error parsing MCP JSON feed {feed_url}: {e}")
+                # Fallback to RSS parsing of the body we already have
+                return await NewsFeedProcessor.parse_rss_content(response.content, known_links)
+            
         except Exception as e:
             logger.error(f"Error fetching MCP feed {feed_url}: {e}")
-            return []
+            if validators is not None:
+                validators["result"] = "error"
+            raise
 
 
 # API Endpoints
@@ -261,17 +485,19 @@ async def get_prometheus_metrics(db: Session = Depends(get_db)):
         # Get worker count from environment or default to 1
         workers_active = int(os.getenv("WORKERS_ACTIVE", "1"))
         
-        # Count feeds and articles
-        total_feeds = db.query(NewsFeed).count()
-        active_feeds = db.query(NewsFeed).filter(NewsFeed.is_active == True).count()
-        total_articles = db.query(Article).count()
+        # Feed and article counts (precomputed rollup)
+        counters = read_counters(db)
+        total_feeds = counters.get("news_feeds_total", 0)
+        active_feeds = counters.get("news_feeds_active", 0)
+        total_articles = counters.get("articles_total", 0)
         
         # Count articles by reviewer type
-        light_reviewed = db.query(Article).filter(Article.reviewer_type == "light").count()
-        heavy_reviewed = db.query(Article).filter(Article.reviewer_type == "heavy").count()
-        unreviewed = db.query(Article).filter(Article.reviewer_type == None).count()
+        by_reviewer = article_counts_by_reviewer(counters)
+        light_reviewed = by_reviewer["light"]
+        heavy_reviewed = by_reviewer["heavy"]
+        unreviewed = by_reviewer["unreviewed"]
         
-        # Calculate articles per hour (last 1 hour)
+        # Calculate articles per hour (last 1 hour, range scan on ix_articles_created_at_id)
         one_hour_ago = datetime.utcnow() - timedelta(hours=1)
         articles_last_hour = db.query(Article).filter(Article.created_at >= one_hour_ago).count()
         
@@ -286,6 +512,77 @@ async def get_prometheus_metrics(db: Session = Depends(get_db)):
         metrics.append(f'news_feed_articles_by_reviewer{{type="heavy"}} {heavy_reviewed}')
         metrics.append(f'news_feed_articles_by_reviewer{{type="unreviewed"}} {unreviewed}')
         
+        # Last concurrent sweep
+        sweep = (last_sweep or {}).get("summary", {})
+        metrics.append(f"news_feed_sweep_feeds {sweep.get('feeds', 0)}")
+        metrics.append(f"news_feed_sweep_errors {sweep.get('errors', 0)}")
+        metrics.append(f"news_feed_sweep_duration_seconds {sweep.get('elapsed_seconds', 0.0)}")
+        metrics.append(f"news_feed_sweep_sequential_seconds {sweep.get('sequential_seconds', 0.0)}")
+        
+        # Conditional GET outcomes since process start
+        for result in ("fetched", "not_modified", "unchanged"):
+            metrics.append(f'news_feed_conditional_requests_total{{result="{result}"}} {conditional_fetch_stats[result]}')
+        metrics.append(f"news_feed_download_bytes_total {conditional_fetch_stats['bytes_downloaded']}")
+        metrics.append(f"news_feed_download_bytes_saved_total {conditional_fetch_stats['bytes_saved']}")
+        
+        # Outbound requests per host (busiest hosts plus any with an open breaker)
+        outbound = outbound_policy.totals()
+        metrics.append(f"news_feed_outbound_hosts {outbound['hosts']}")
+        metrics.append(f'news_feed_outbound_requests_total{{result="ok"}} {outbound["requests"] - outbound["failures"]}')
+        metrics.append(f'news_feed_outbound_requests_total{{result="failure"}} {outbound["failures"]}')
+        metrics.append(f'news_feed_outbound_requests_total{{result="rejected"}} {outbound["rejected"]}')
+        metrics.append(f"news_feed_outbound_throttled_seconds_total {outbound['throttled_seconds']:.3f}")
+        metrics.append(f'news_feed_breakers{{state="open"}} {outbound["open"]}')
+        metrics.append(f'news_feed_breakers{{state="half_open"}} {outbound["half_open"]}')
+        breaker_states = {"closed": 0, "half_open": 1, "open": 2}
+        for host in outbound_policy.snapshot():
+            label = f'host="{host["host"]}"'
+            metrics.append(f"news_feed_host_breaker_state{{{label}}} {breaker_states[host['state']]}")
+            metrics.append(f"news_feed_host_breaker_opens_total{{{label}}} {host['opens']}")
+            metrics.append(f"news_feed_host_requests_total{{{label}}} {host['requests']}")
+            metrics.append(f"news_feed_host_failures_total{{{label}}} {host['failures']}")
+            metrics.append(f"news_feed_host_latency_seconds{{{label}}} {host['latency_ewma_seconds']}")
+        
+        # Feed parsing (incremental parses that hit known entries stop early)
+        metrics.append(f"news_feed_parse_incremental_total {parse_stats['incremental']}")
+        metrics.append(f"news_feed_parse_stopped_early_total {parse_stats['stopped_early']}")
+        metrics.append(f"news_feed_parse_fallbacks_total {parse_stats['fallbacks']}")
+        metrics.append(f"news_feed_parse_entries_total {parse_stats['entries_parsed']}")
+        
+        # Adaptive polling
+        next_due = poll_scheduler.next_due()
+        metrics.append(f"news_feed_poll_scheduled_feeds {len(poll_scheduler)}")
+        metrics.append(f"news_feed_poll_dispatched_total {poll_stats['dispatched']}")
+        metrics.append(f"news_feed_poll_deferred_total {poll_stats['deferred']}")
+        metrics.append(f"news_feed_poll_failed_total {poll_stats['failed']}")
+        metrics.append(f"news_feed_poll_failing_feeds {len(poll_failures)}")
+        if next_due is not None:
+            metrics.append(f"news_feed_poll_next_due_seconds {max((next_due - datetime.now(timezone.utc)).total_seconds(), 0):.1f}")
+        
+        # Fingerprint dedup store
+        if fingerprint_store is not None:
+            metrics.append(f"news_feed_dedup_checked_total {fingerprint_store.stats['checked']}")
+            metrics.append(f"news_feed_dedup_duplicates_total {fingerprint_store.stats['duplicates']}")
+            metrics.append(f"news_feed_dedup_round_trips_total {fingerprint_store.stats['round_trips']}")
+            try:
+                entries = await asyncio.to_thread(fingerprint_store.entry_count)
+                metrics.append(f"news_feed_dedup_fingerprints {entries}")
+                metrics.append(f"news_feed_dedup_false_positive_rate {fingerprint_store.estimated_false_positive_rate(entries):.3e}")
+            except Exception as e:
+                logger.warning(f"Could not read dedup store size: {e}")
+        
+        # Near-duplicate clustering
+        if near_dup_index is not None:
+            metrics.append(f"news_feed_near_dup_checked_total {near_dup_index.stats['checked']}")
+            metrics.append(f"news_feed_near_dup_clustered_total {near_dup_index.stats['near_duplicates']}")
+        
+        # Full-article content cache
+        if article_cache is not None:
+            metrics.append(f'news_feed_article_cache_requests_total{{result="hit"}} {article_cache.stats["hits"]}')
+            metrics.append(f'news_feed_article_cache_requests_total{{result="miss"}} {article_cache.stats["misses"]}')
+            metrics.append(f"news_feed_article_cache_hit_ratio {article_cache.hit_ratio():.4f}")
+            metrics.append(f"news_feed_article_cache_bytes_saved_total {article_cache.stats['bytes_saved']}")
+        
         prometheus_output = "\n".join([
             "# HELP news_feed_workers_active Number of active workers",
             "# TYPE news_feed_workers_active gauge",
@@ -299,6 +596,48 @@ async def get_prometheus_metrics(db: Session = Depends(get_db)):
             "# TYPE news_feed_articles_per_hour gauge",
             "# HELP news_feed_articles_by_reviewer Articles by reviewer type",
             "# TYPE news_feed_articles_by_reviewer gauge",
+            "# HELP news_feed_sweep_feeds Feeds fetched in the last /feeds/fetch-all sweep",
+            "# TYPE news_feed_sweep_feeds gauge",
+            "# HELP news_feed_sweep_errors Feeds that failed in the last sweep",
+            "# TYPE news_feed_sweep_errors gauge",
+            "# HELP news_feed_sweep_duration_seconds Wall time of the last sweep",
+            "# TYPE news_feed_sweep_duration_seconds gauge",
+            "# HELP news_feed_sweep_sequential_seconds Sum of per-feed fetch times in the last sweep",
+            "# TYPE news_feed_sweep_sequential_seconds gauge",
+            "# HELP news_feed_conditional_requests_total Feed downloads by outcome (fetched, 304 not_modified, identical-body unchanged)",
+            "# TYPE news_feed_conditional_requests_total counter",
+            "# HELP news_feed_download_bytes_total Feed body bytes downloaded",
+            "# TYPE news_feed_download_bytes_total counter",
+            "# HELP news_feed_download_bytes_saved_total Estimated feed bytes not downloaded thanks to 304 responses",
+            "# TYPE news_feed_download_bytes_saved_total counter",
+            "# HELP news_feed_poll_scheduled_feeds Feeds in the adaptive poll schedule",
+            "# TYPE news_feed_poll_scheduled_feeds gauge",
+            "# HELP news_feed_poll_dispatched_total Feed fetches started by the adaptive scheduler",
+            "# TYPE news_feed_poll_dispatched_total counter",
+            "# HELP news_feed_poll_deferred_total Due feeds deferred because a sweep was running",
+            "# TYPE news_feed_poll_deferred_total counter",
+            "# HELP news_feed_poll_next_due_seconds Seconds until the next feed is due",
+            "# TYPE news_feed_poll_next_due_seconds gauge",
+            "# HELP news_feed_dedup_checked_total Fingerprints checked against the dedup store",
+            "# TYPE news_feed_dedup_checked_total counter",
+            "# HELP news_feed_dedup_duplicates_total Entries dropped as fingerprint duplicates",
+            "# TYPE news_feed_dedup_duplicates_total counter",
+            "# HELP news_feed_dedup_round_trips_total Redis round trips made by the dedup store",
+            "# TYPE news_feed_dedup_round_trips_total counter",
+            "# HELP news_feed_dedup_fingerprints Fingerprints held in live dedup buckets",
+            "# TYPE news_feed_dedup_fingerprints gauge",
+            "# HELP news_feed_dedup_false_positive_rate Estimated chance a new article collides with a stored truncated fingerprint",
+            "# TYPE news_feed_dedup_false_positive_rate gauge",
+            "# HELP news_feed_near_dup_checked_total New articles checked for near-duplicates",
+            "# TYPE news_feed_near_dup_checked_total counter",
+            "# HELP news_feed_near_dup_clustered_total Articles clustered under a representative (not sent for review)",
+            "# TYPE news_feed_near_dup_clustered_total counter",
+            "# HELP news_feed_article_cache_requests_total Full-article cache lookups by result",
+            "# TYPE news_feed_article_cache_requests_total counter",
+            "# HELP news_feed_article_cache_hit_ratio Share of full-article lookups served from cache",
+            "# TYPE news_feed_article_cache_hit_ratio gauge",
+            "# HELP news_feed_article_cache_bytes_saved_total Page bytes not downloaded thanks to cache hits",
+            "# TYPE news_feed_article_cache_bytes_saved_total counter",
             "",
             *metrics
         ])
@@ -373,6 +712,8 @@ async def update_news_feed(
     
     db.commit()
     db.refresh(feed)
+    if not feed.is_active:
+        poll_scheduler.remove(feed_id)
     return feed
 
 
@@ -388,9 +729,48 @@ async def delete_news_feed(
     
     db.delete(feed)
     db.commit()
+    poll_scheduler.remove(feed_id)
     return {"message": "News feed deleted successfully"}
 
 
+# Only one sweep at a time; the last report is kept for /feeds/fetch-all/last and metrics
+_sweep_lock = asyncio.Lock()
+last_sweep: Optional[dict] = None
+
+
+@app.post("/feeds/fetch-all")
+async def fetch_all_feeds(force: bool = False):
+    """Fetch every due feed concurrently and return per-feed timings.
+    
+    Concurrency is bounded globally (FEED_FETCH_CONCURRENCY) and per host
+    (FEED_FETCH_PER_HOST); all downloads share one pooled HTTP client.
+    """
+    global last_sweep
+    if _sweep_lock.locked():
+        raise HTTPException(status_code=409, detail="A feed sweep is already running")
+    
+    async with _sweep_lock:
+        feeds = await asyncio.to_thread(_list_due_feeds, force)
+        report = await run_sweep(feeds, lambda feed_id: fetch_feed_articles(feed_id, http_client))
+        report["finished_at"] = datetime.utcnow().isoformat()
+        last_sweep = report
+    return report
+
+
+@app.get("/feeds/fetch-all/last")
+async def get_last_sweep():
+    """Report of the most recent /feeds/fetch-all sweep."""
+    if last_sweep is None:
+        raise HTTPException(status_code=404, detail="No feed sweep has run yet")
+    return last_sweep
+
+
+@app.get("/feeds/fetch-all/hosts")
+async def get_outbound_hosts(limit: int = 50):
+    """Circuit breaker state, request counts and latency of the busiest hosts (and every unhealthy one)."""
+    return {"totals": outbound_policy.totals(), "hosts": outbound_policy.snapshot(limit)}
+
+
 @app.post("/feeds/{feed_id}/fetch")
 async def trigger_feed_fetch(
     feed_id: UUID,
@@ -458,19 +838,12 @@ async def send_unreviewed_articles_to_reviewer(
     """Send unreviewed articles to the reviewer service."""
     # Find articles that haven't been reviewed yet (no review_tags or confidence)
     unreviewed_articles = db.query(Article).filter(
-        Article.review_tags.is_(None)
+        Article.review_tags.is_(None),
+        Article.near_duplicate_of.is_(None)
     ).order_by(Article.created_at.desc()).limit(limit).all()
     
-    sent_count = 0
-    failed_count = 0
-    
-    for article in unreviewed_articles:
-        try:
-            await send_article_to_reviewer(article)
-            sent_count += 1
-        except Exception as e:
-            logger.error(f"Failed to send article {article.id} to reviewer: {e}")
-            failed_count += 1
+    sent_count = await send_articles_to_reviewer(unreviewed_articles)
+    failed_count = len(unreviewed_articles) - sent_count
     
     return {
         "message": f"Sent {sent_count} articles to reviewer, {failed_count} failed",
@@ -480,134 +853,625 @@ async def send_unreviewed_articles_to_reviewer(
     }
 
 
-async def send_article_to_reviewer(article: Article):
-    """Send a new article to the reviewer service for processing."""
+REVIEWER_SERVICE_URL = os.getenv("REVIEWER_SERVICE_URL", "http://reviewer:8008")
+# Review requests per /enqueue-batch call
+REVIEWER_ENQUEUE_BATCH_SIZE = int(os.getenv("REVIEWER_ENQUEUE_BATCH_SIZE", "100"))
+
+
+def reviewer_payload(article: Article) -> dict:
+    """Review request body for an article (reviewer FeedReviewRequest)."""
+    return {
+        "feed_id": str(article.feed_id),
+        "article_id": str(article.id),
+        "title": article.title,
+        "url": article.link,
+        "content": article.content or article.summary or "",
+        "published": article.publish_date.isoformat() if article.publish_date else datetime.utcnow().isoformat()
+    }
+
+
+async def send_articles_to_reviewer(articles: List[Article]) -> int:
+    """Enqueue articles with the reviewer, REVIEWER_ENQUEUE_BATCH_SIZE per /enqueue-batch call.
+    
+    A batch too large for the reviewer (413) is sent article by article (see
+    ``send_article_to_reviewer``). Other failures, including an unreachable
+    reviewer, are not resent here: the reviewer may have queued the batch
+    already, and articles left unreviewed are picked up by the overseer's
+    periodic send_articles_to_reviewer run. The reviewer skips articles
+    already queued by either path. Returns the number of articles sent.
+    """
+    sent = 0
+    client = http_client
+    own_client = None
+    if client is None:
+        client = own_client = httpx.AsyncClient(timeout=30.0)
     try:
-        reviewer_url = os.getenv("REVIEWER_SERVICE_URL", "http://reviewer:8008")
-        
-        # Prepare article data for reviewer
-        article_data = {
-            "feed_id": str(article.feed_id),
-            "title": article.title,
-            "url": article.link,
-            "content": article.content or article.summary or "",
-            "published": article.publish_date.isoformat() if article.publish_date else datetime.utcnow().isoformat()
-        }
-        
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Use the queue-based endpoint if available, otherwise direct review
+        for start in range(0, len(articles), REVIEWER_ENQUEUE_BATCH_SIZE):
+            batch = articles[start:start + REVIEWER_ENQUEUE_BATCH_SIZE]
             try:
-                response = await client.post(f"{reviewer_url}/enqueue", json=article_data)
-                response.raise_for_status()
-                logger.info(f"✅ Enqueued article for review: {article.title[:50]}...")
-            except Exception as queue_error:
-                logger.warning(f"Queue failed, trying direct review: {queue_error}")
-                # Fallback to direct review endpoint
-                response = await client.post(f"{reviewer_url}/review", json=article_data)
+                response = await client.post(
+                    f"{REVIEWER_SERVICE_URL}/enqueue-batch",
+                    json=[reviewer_payload(article) for article in batch],
+                    timeout=30.0
+                )
                 response.raise_for_status()
-                logger.info(f"✅ Directly reviewed article: {article.title[:50]}...")
+                sent += len(batch)
+                logger.info(f"✅ Enqueued {len(batch)} articles for review")
+            except httpx.HTTPStatusError as batch_error:
+                if batch_error.response.status_code != 413:
+                    logger.error(f"Batch enqueue of {len(batch)} articles failed, leaving them for the overseer: {batch_error}")
+                    continue
+                logger.warning(f"Batch of {len(batch)} articles too large for the reviewer, sending them one by one")
+                for article in batch:
+                    if await send_article_to_reviewer(article, client):
+                        sent += 1
+            except Exception as batch_error:
+                # An unreachable reviewer fails every later batch too; stop here
+                logger.error(
+                    f"Reviewer unreachable, leaving {len(articles) - start} articles for the overseer: {batch_error}"
+                )
+                break
+    finally:
+        if own_client is not None:
+            await own_client.aclose()
+    return sent
+
+
+async def send_article_to_reviewer(article: Article, client: Optional[httpx.AsyncClient] = None) -> bool:
+    """Enqueue one article with the reviewer through ``client`` (the shared client by default)."""
+    try:
+        response = await (client or http_client).post(
+            f"{REVIEWER_SERVICE_URL}/enqueue", json=reviewer_payload(article), timeout=30.0
+        )
+        response.raise_for_status()
+        logger.info(f"✅ Enqueued article for review: {article.title[:50]}...")
+        return True
         
     except Exception as e:
         logger.error(f"❌ Failed to send article to reviewer: {e}")
         # Don't fail the entire process if reviewer is down
+        return False
 
 
-async def fetch_feed_articles(feed_id: UUID):
-    """Background task to fetch articles from a feed."""
+def compute_fingerprint(article_data: dict) -> str:
+    """SHA-256 of link|title|published used for cross-poll deduplication."""
+    try:
+        pub_iso = article_data.get("publish_date").isoformat() if article_data.get("publish_date") else ""
+    except Exception:
+        pub_iso = ""
+    fp_src = f"{article_data['link']}|{article_data['title']}|{pub_iso}"
+    return hashlib.sha256(fp_src.encode("utf-8", errors="ignore")).hexdigest()
+
+
+DEDUP_ENABLED = os.getenv("DEDUP_ENABLED", "true").lower() in ("1", "true", "yes")
+
+
+def find_duplicate_fingerprints(fingerprints: List[str]) -> set:
+    """Fingerprints seen in an earlier poll (one Redis round trip per batch); records the new ones."""
+    if not (DEDUP_ENABLED and fingerprint_store):
+        return set()
+    try:
+        return fingerprint_store.find_duplicates(fingerprints)
+    except Exception as e:
+        logger.warning(f"Dedup check failed; proceeding: {e}")
+        return set()
+
+
+def assign_near_duplicates(entries: List[dict]) -> int:
+    """Give each entry an ``id`` and set ``near_duplicate_of`` to its cluster representative (or None).
+    
+    Nothing is indexed yet: new representatives join the index in
+    ``index_representatives`` once they are committed. Returns the number of
+    near-duplicates found.
+    """
+    for entry in entries:
+        entry["id"] = uuid4()
+        entry["near_duplicate_of"] = None
+        entry["near_dup_text"] = near_dup_text(entry)
+    if not (near_dup_index and entries):
+        return 0
+    try:
+        clusters = near_dup_index.assign([(str(entry["id"]), entry["near_dup_text"]) for entry in entries])
+    except Exception as e:
+        logger.warning(f"Near-duplicate check failed; proceeding: {e}")
+        return 0
+    found = 0
+    for entry in entries:
+        representative = clusters.get(str(entry["id"]))
+        if representative:
+            entry["near_duplicate_of"] = UUID(representative)
+            found += 1
+            logger.info(f"Near-duplicate of {representative}: {entry['link']}")
+    return found
+
+
+def index_representatives(entries: List[dict], stored_ids: set) -> None:
+    """Add the stored cluster representatives among ``entries`` to the near-duplicate index."""
+    if not near_dup_index:
+        return
+    try:
+        near_dup_index.add_representatives([
+            (str(entry["id"]), entry["near_dup_text"])
+            for entry in entries
+            if not entry["near_duplicate_of"] and entry["id"] in stored_ids
+        ])
+    except Exception as e:
+        logger.warning(f"Could not index cluster representatives: {e}")
+
+
+BULK_INGEST_ENABLED = os.getenv("BULK_INGEST_ENABLED", "true").lower() in ("1", "true", "yes")
+# Rows per INSERT statement; keeps bind parameters well under PostgreSQL's 65535 limit
+BULK_INGEST_CHUNK_SIZE = int(os.getenv("BULK_INGEST_CHUNK_SIZE", "1000"))
+# First key of the per-feed ingest advisory lock (the second is hashtext(feed_id))
+FEED_INGEST_LOCK_NAMESPACE = 7_351_010
+
+
+def select_new_entries(db: Session, feed_id: UUID, articles_data: List[dict]) -> List[dict]:
+    """Entries worth storing: first occurrence of each link, not yet stored for this feed, unseen fingerprint.
+
+    Runs before enrichment, so full-article downloads are only spent on
+    entries that will be inserted. Each returned dict carries its ``fingerprint``.
+    Links already stored are filtered with one lookup before the fingerprint
+    check, so re-polled items are not counted as duplicates.
+    """
+    # Keep the first occurrence of each link within the batch
+    batch = {}
+    for article_data in articles_data:
+        if article_data.get("link") and article_data["link"] not in batch:
+            batch[article_data["link"]] = article_data
+    if not batch:
+        return []
+
+    existing_links = set(db.execute(
+        select(Article.link).where(
+            Article.feed_id == feed_id,
+            Article.link.in_(list(batch.keys()))
+        )
+    ).scalars())
+
+    entries = [
+        {**article_data, "fingerprint": compute_fingerprint(article_data)}
+        for link, article_data in batch.items() if link not in existing_links
+    ]
+    duplicates = find_duplicate_fingerprints([entry["fingerprint"] for entry in entries])
+    for entry in entries:
+        if entry["fingerprint"] in duplicates:
+            logger.info(f"Duplicate filtered (fingerprint) for link={entry['link']}")
+    return [entry for entry in entries if entry["fingerprint"] not in duplicates]
+
+
+def bulk_insert_articles(db: Session, feed_id: UUID, entries: List[dict]) -> list:
+    """Insert entries from ``select_new_entries`` with INSERT ... ON CONFLICT DO NOTHING RETURNING.
+
+    The returned rows are only the articles that were actually inserted.
+    """
+    rows = [{
+        "id": entry.get("id") or uuid4(),
+        "feed_id": feed_id,
+        "title": entry["title"],
+        "link": entry["link"],
+        "summary": entry["summary"],
+        "content": entry["content"],
+        "publish_date": entry["publish_date"],
+        "fingerprint": entry["fingerprint"],
+        "near_duplicate_of": entry.get("near_duplicate_of"),
+    } for entry in entries]
+
+    inserted = []
+    for i in range(0, len(rows), BULK_INGEST_CHUNK_SIZE):
+        stmt = pg_insert(Article).values(rows[i:i + BULK_INGEST_CHUNK_SIZE])
+        # No explicit conflict target: a partitioned articles table has no unique
+        # (feed_id, link) index, see shared/partitioning.py and _store_feed_articles
+        stmt = stmt.on_conflict_do_nothing().returning(
+            Article.id, Article.feed_id, Article.title, Article.link,
+            Article.summary, Article.content, Article.publish_date, Article.near_duplicate_of
+        )
+        inserted.extend(db.execute(stmt).all())
+    return inserted
+
+
+def insert_articles_individually(db: Session, feed_id: UUID, entries: List[dict]) -> List[Article]:
+    """Per-entry ingest path (one flush per article)."""
+    new_articles = []
+    for entry in entries:
+        article = Article(
+            id=entry.get("id") or uuid4(),
+            feed_id=feed_id,
+            title=entry["title"],
+            link=entry["link"],
+            summary=entry["summary"],
+            content=entry["content"],
+            publish_date=entry["publish_date"],
+            fingerprint=entry["fingerprint"],
+            near_duplicate_of=entry.get("near_duplicate_of")
+        )
+        db.add(article)
+        db.flush()  # Ensure article has an ID
+        new_articles.append(article)
+    return new_articles
+
+
+def _load_active_feed(feed_id: UUID) -> Optional[dict]:
     db = next(get_db())
     try:
         feed = db.query(NewsFeed).filter(NewsFeed.id == feed_id).first()
         if not feed or not feed.is_active:
-            return
-        
-        logger.info(f"Fetching articles from feed: {feed.source_url}")
-        
-        # Fetch articles based on feed type
-        if feed.type == FeedType.RSS:
-            articles_data = await NewsFeedProcessor.fetch_rss_feed(feed.source_url)
-        elif feed.type == FeedType.MCP:
-            articles_data = await NewsFeedProcessor.fetch_mcp_feed(feed.source_url)
-        else:
-            logger.error(f"Unknown feed type: {feed.type}")
-            return
-        
-        # Store new articles with deduplication
-        new_articles_count = 0
-        for article_data in articles_data:
-            # Check if article already exists
-            existing = db.query(Article).filter(
-                and_(
+            return None
+        return {
+            "id": feed.id,
+            "source_url": feed.source_url,
+            "type": feed.type,
+            "etag": feed.etag,
+            "last_modified": feed.last_modified,
+            "body_hash": feed.body_hash,
+        }
+    finally:
+        db.close()
+
+
+def _known_links(feed_id: UUID, links: List[str]) -> set:
+    """Links among ``links`` already stored for the feed (used by the incremental parser)."""
+    if not links:
+        return set()
+    db = next(get_db())
+    try:
+        rows = db.execute(
+            select(Article.link).where(Article.feed_id == feed_id, Article.link.in_(links))
+        )
+        return {link for (link,) in rows}
+    finally:
+        db.close()
+
+
+def _select_new_entries(feed_id: UUID, articles_data: List[dict]) -> List[dict]:
+    db = next(get_db())
+    try:
+        entries = select_new_entries(db, feed_id, articles_data)
+    finally:
+        db.close()
+    assign_near_duplicates(entries)
+    return entries
+
+
+def _store_feed_articles(feed_id: UUID, entries: List[dict], validators: Optional[dict] = None) -> list:
+    """Insert new articles for a feed and stamp last_fetched; returns the inserted rows.
+    
+    ``validators`` (etag, last_modified, body_hash) are saved in the same
+    transaction, so a body is only marked as seen once its articles are stored.
+    
+    Scheduled polls, manual fetches and sweeps can overlap on one feed. The
+    transaction holds a per-feed advisory lock and drops entries whose link
+    was stored since ``select_new_entries`` ran, so (feed_id, link) stays
+    unique even on a partitioned articles table without that unique index.
+    """
+    db = next(get_db())
+    # Returned articles are read after the session closes
+    db.expire_on_commit = False
+    try:
+        if db.bind.dialect.name == "postgresql":
+            db.execute(
+                text("SELECT pg_advisory_xact_lock(:namespace, hashtext(:feed_id))"),
+                {"namespace": FEED_INGEST_LOCK_NAMESPACE, "feed_id": str(feed_id)}
+            )
+        if entries:
+            stored = set(db.execute(
+                select(Article.link).where(
                     Article.feed_id == feed_id,
-                    Article.link == article_data["link"]
+                    Article.link.in_([entry["link"] for entry in entries])
                 )
-            ).first()
-            
-            if not existing:
-                # Compute fingerprint and check Redis set
-                try:
-                    pub_iso = article_data.get("publish_date").isoformat() if article_data.get("publish_date") else ""
-                except Exception:
-                    pub_iso = ""
-                fp_src = f"{article_data['link']}|{article_data['title']}|{pub_iso}"
-                fp = hashlib.sha256(fp_src.encode("utf-8", errors="ignore")).hexdigest()
-
-                allow_insert = True
-                try:
-                    dedup_enabled = os.getenv("DEDUP_ENABLED", "true").lower() in ("1", "true", "yes")
-                    if dedup_enabled and redis_client:
-                        fp_key = "reviewer:fingerprints"
-                        if redis_client.sismember(fp_key, fp):
-                            # Record duplicate event timestamp for metrics windowing
-                            try:
-                                redis_client.lpush("reviewer:duplicates:events", str(int(datetime.utcnow().timestamp())))
-                                redis_client.ltrim("reviewer:duplicates:events", 0, 99999)
-                            except Exception:
-                                pass
-                            logger.info(f"Duplicate filtered (fingerprint) for link={article_data['link']}")
-                            allow_insert = False
-                        else:
-                            redis_client.sadd(fp_key, fp)
-                            # Ensure TTL on the set key (approximate)
-                            try:
-                                redis_client.expire(fp_key, int(os.getenv("DEDUP_TTL", "2592000")))
-                            except Exception:
-                                pass
-                except Exception as e:
-                    logger.warning(f"Dedup check failed; proceeding: {e}")
-
-                if allow_insert:
-                    article = Article(
-                        feed_id=feed_id,
-                        title=article_data["title"],
-                        link=article_data["link"],
-                        summary=article_data["summary"],
-                        content=article_data["content"],
-                        publish_date=article_data["publish_date"]
-                    )
-                    try:
-                        article.fingerprint = fp
-                    except Exception:
-                        pass
-                    db.add(article)
-                    db.flush()  # Ensure article has an ID
-                    new_articles_count += 1
-                    
-                    # Automatically send new article to reviewer service
-                    await send_article_to_reviewer(article)
+            ).scalars())
+            dropped = {entry["id"] for entry in entries if entry["link"] in stored}
+            entries = [entry for entry in entries if entry["link"] not in stored]
+            # Copies of a representative that is not stored after all start their own cluster
+            for entry in entries:
+                if entry.get("near_duplicate_of") in dropped:
+                    entry["near_duplicate_of"] = None
         
-        # Update last_fetched timestamp
-        feed.last_fetched = datetime.utcnow()
+        if BULK_INGEST_ENABLED and db.bind.dialect.name == "postgresql":
+            new_articles = bulk_insert_articles(db, feed_id, entries)
+        else:
+            new_articles = insert_articles_individually(db, feed_id, entries)
+        
+        # Update last_fetched timestamp (and the conditional GET validators)
+        values = {NewsFeed.last_fetched: datetime.utcnow()}
+        if validators and validators.get("result") == "fetched":
+            values.update({
+                NewsFeed.etag: validators.get("etag"),
+                NewsFeed.last_modified: validators.get("last_modified"),
+                NewsFeed.body_hash: validators.get("body_hash"),
+            })
+        db.query(NewsFeed).filter(NewsFeed.id == feed_id).update(values, synchronize_session=False)
         
+        # Copies of an already reviewed representative take its review now
+        copy_cluster_reviews(db, [article.id for article in new_articles if article.near_duplicate_of])
+        
+        db.commit()
+        return new_articles
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _touch_unchanged_feed(feed_id: UUID, validators: dict) -> None:
+    """Stamp last_fetched for a feed whose body did not change (no parse, no dedup)."""
+    db = next(get_db())
+    try:
+        db.query(NewsFeed).filter(NewsFeed.id == feed_id).update({
+            NewsFeed.last_fetched: datetime.utcnow(),
+            NewsFeed.etag: validators.get("etag"),
+            NewsFeed.last_modified: validators.get("last_modified"),
+        }, synchronize_session=False)
         db.commit()
-        logger.info(f"Fetched {new_articles_count} new articles from {feed.source_url}")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+async def fetch_feed_articles(feed_id: UUID, client: Optional[httpx.AsyncClient] = None) -> dict:
+    """Fetch, store and forward new articles for one feed, then plan its next poll.
+    
+    Database work runs in a worker thread so concurrent sweeps don't block
+    the event loop. Returns counters and phase timings for sweep reports.
+    """
+    report = await _fetch_and_store(feed_id, client)
+    if report.get("status") == "skipped":
+        poll_scheduler.remove(feed_id)
+        poll_failures.pop(str(feed_id), None)
+        return report
+    if report.get("status") == "error":
+        failures = poll_failures[str(feed_id)] = poll_failures.get(str(feed_id), 0) + 1
+        poll_stats["failed"] += 1
+    else:
+        failures = 0
+        poll_failures.pop(str(feed_id), None)
+    try:
+        due_at, interval = await asyncio.to_thread(_record_poll, feed_id, report, failures)
+        poll_scheduler.schedule(feed_id, due_at)
+        report["poll_interval_seconds"] = interval
+    except Exception as e:
+        logger.warning(f"Could not plan next poll for feed {feed_id}: {e}")
+    return report
+
+
+async def _fetch_and_store(feed_id: UUID, client: Optional[httpx.AsyncClient] = None) -> dict:
+    report = {"entries": 0, "new_articles": 0}
+    try:
+        feed = await asyncio.to_thread(_load_active_feed, feed_id)
+        if not feed:
+            report["status"] = "skipped"
+            return report
+        
+        logger.info(f"Fetching articles from feed: {feed['source_url']}")
+        client = client or http_client
+        
+        validators = None
+        if FEED_CONDITIONAL_GET:
+            validators = {key: feed[key] for key in ("etag", "last_modified", "body_hash")}
+        
+        # Fetch articles based on feed type; parsing stops early at already-stored entries.
+        # A failed download raises, so the poll is reported as an error (retried with
+        # backoff) and nothing is stored or stamped.
+        known_links = lambda links: _known_links(feed_id, links)
+        started = time.perf_counter()
+        if feed["type"] == FeedType.RSS:
+            articles_data = await NewsFeedProcessor.fetch_rss_feed(feed["source_url"], client, validators, known_links)
+        elif feed["type"] == FeedType.MCP:
+            articles_data = await NewsFeedProcessor.fetch_mcp_feed(feed["source_url"], client, validators, known_links)
+        else:
+            logger.error(f"Unknown feed type: {feed['type']}")
+            report["status"] = "error"
+            report["error"] = f"Unknown feed type: {feed['type']}"
+            return report
+        report["entries"] = len(articles_data)
+        report["download_seconds"] = round(time.perf_counter() - started, 4)
+        
+        # 304 or identical body: nothing to parse, dedup or store
+        if validators and validators.get("result") in ("not_modified", "unchanged"):
+            report["status"] = validators["result"]
+            await asyncio.to_thread(_touch_unchanged_feed, feed_id, validators)
+            logger.info(f"Feed unchanged ({validators['result']}): {feed['source_url']}")
+            return report
+        if validators:
+            report["conditional"] = validators.get("result")
+        
+        # Deduplicate, then download full text only for the entries that survive
+        started = time.perf_counter()
+        entries = await asyncio.to_thread(_select_new_entries, feed_id, articles_data)
+        report["candidates"] = len(entries)
+        report["near_duplicates"] = sum(1 for entry in entries if entry["near_duplicate_of"])
+        report["dedup_seconds"] = round(time.perf_counter() - started, 4)
+        
+        # Near-duplicates are stored with their cluster but not enriched or reviewed
+        started = time.perf_counter()
+        representatives = [entry for entry in entries if not entry["near_duplicate_of"]]
+        report["enriched"] = await NewsFeedProcessor.enrich_articles(representatives, client)
+        report["enrich_seconds"] = round(time.perf_counter() - started, 4)
+        
+        # Store new articles
+        started = time.perf_counter()
+        new_articles = await asyncio.to_thread(_store_feed_articles, feed_id, entries, validators)
+        report["store_seconds"] = round(time.perf_counter() - started, 4)
+        report["new_articles"] = len(new_articles)
+        logger.info(f"Fetched {len(new_articles)} new articles from {feed['source_url']}")
+        
+        # Only committed representatives can be pointed at by later copies
+        await asyncio.to_thread(index_representatives, entries, {article.id for article in new_articles})
+        
+        # Forward only newly inserted cluster representatives to the reviewer, after they are committed
+        to_review = [article for article in new_articles if not article.near_duplicate_of]
+        if to_review:
+            report["sent_to_reviewer"] = await send_articles_to_reviewer(to_review)
         
     except Exception as e:
         logger.error(f"Error fetching articles for feed {feed_id}: {e}")
+        report["status"] = "error"
+        report["error"] = str(e)
+    return report
+
+
+def _list_due_feeds(force: bool = False) -> List[dict]:
+    """Active feeds whose next poll is due (all active feeds when forced).
+    
+    Feeds without a planned poll yet are due when not fetched within
+    FEED_MIN_REFETCH_MINUTES.
+    """
+    db = next(get_db())
+    try:
+        query = db.query(NewsFeed.id, NewsFeed.source_url).filter(NewsFeed.is_active == True)
+        if not force:
+            cutoff = datetime.utcnow() - timedelta(minutes=FEED_MIN_REFETCH_MINUTES)
+            query = query.filter(
+                (NewsFeed.next_fetch_at <= datetime.now(timezone.utc))
+                | (NewsFeed.next_fetch_at.is_(None)
+                   & (NewsFeed.last_fetched.is_(None) | (NewsFeed.last_fetched < cutoff)))
+            )
+        return [{"id": feed_id, "url": url} for feed_id, url in query.all()]
+    finally:
+        db.close()
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _record_poll(feed_id: UUID, report: dict, failures: int = 0):
+    """Learn the feed's poll interval from this fetch and its publish history; returns (due_at, interval).
+    
+    After a failed fetch (``failures`` in a row) the learned interval and
+    unchanged ratio are kept and only the retry is scheduled, with backoff.
+    """
+    db = next(get_db())
+    try:
+        if failures:
+            interval = retry_interval(failures)
+            due_at = jittered(datetime.now(timezone.utc), interval)
+            db.query(NewsFeed).filter(NewsFeed.id == feed_id).update(
+                {NewsFeed.next_fetch_at: due_at}, synchronize_session=False
+            )
+            db.commit()
+            return due_at, interval
+        
+        feed = db.query(
+            NewsFeed.poll_interval_seconds, NewsFeed.poll_unchanged_ratio
+        ).filter(NewsFeed.id == feed_id).one()
+        publish_dates = db.execute(
+            select(Article.publish_date)
+            .where(Article.feed_id == feed_id, Article.publish_date.isnot(None))
+            .order_by(Article.publish_date.desc())
+            .limit(POLL_HISTORY_SIZE)
+        ).scalars().all()
+        
+        # 304, identical body, or nothing new stored
+        brought_nothing = report.get("status") in ("not_modified", "unchanged") or not report.get("new_articles")
+        unchanged_ratio = update_unchanged_ratio(feed.poll_unchanged_ratio, brought_nothing)
+        interval = compute_interval(
+            [_as_utc(d) for d in publish_dates], unchanged_ratio,
+            report.get("new_articles", 0), feed.poll_interval_seconds
+        )
+        due_at = jittered(datetime.now(timezone.utc), interval)
+        
+        db.query(NewsFeed).filter(NewsFeed.id == feed_id).update({
+            NewsFeed.poll_interval_seconds: interval,
+            NewsFeed.poll_unchanged_ratio: unchanged_ratio,
+            NewsFeed.next_fetch_at: due_at,
+        }, synchronize_session=False)
+        db.commit()
+        return due_at, interval
+    except Exception:
         db.rollback()
+        raise
     finally:
         db.close()
 
 
+def _load_schedule() -> dict:
+    """Next due time of every active feed (feed id -> aware UTC datetime)."""
+    db = next(get_db())
+    try:
+        now = datetime.now(timezone.utc)
+        rows = db.query(
+            NewsFeed.id, NewsFeed.next_fetch_at, NewsFeed.last_fetched, NewsFeed.poll_interval_seconds
+        ).filter(NewsFeed.is_active == True).all()
+        schedule = {}
+        for feed_id, next_fetch_at, last_fetched, interval in rows:
+            if next_fetch_at is not None:
+                schedule[str(feed_id)] = _as_utc(next_fetch_at)
+            elif last_fetched is not None:
+                schedule[str(feed_id)] = _as_utc(last_fetched) + timedelta(seconds=interval or POLL_DEFAULT_SECONDS)
+            else:
+                schedule[str(feed_id)] = now
+        return schedule
+    finally:
+        db.close()
+
+
+def _feeds_by_id(feed_ids: List[str]) -> List[dict]:
+    db = next(get_db())
+    try:
+        rows = db.query(NewsFeed.id, NewsFeed.source_url).filter(
+            NewsFeed.id.in_([UUID(feed_id) for feed_id in feed_ids])
+        ).all()
+        return [{"id": feed_id, "url": url} for feed_id, url in rows]
+    finally:
+        db.close()
+
+
+async def _scheduler_loop():
+    """Fetch each feed when its own next poll is due.
+    
+    Sleeps until the earliest due time in the heap (at most 30s, so feeds
+    added elsewhere are noticed), then fetches every due feed with the same
+    bounded concurrency as /feeds/fetch-all. Feeds that come due while a
+    sweep is running are deferred briefly rather than fetched twice, and
+    feeds of a sweep that raised are put back to be retried shortly.
+    """
+    last_reload = 0.0
+    while True:
+        try:
+            if time.monotonic() - last_reload > POLL_RELOAD_SECONDS:
+                poll_scheduler.replace_all(await asyncio.to_thread(_load_schedule))
+                last_reload = time.monotonic()
+            
+            now = datetime.now(timezone.utc)
+            due_ids = poll_scheduler.pop_due(now)
+            if due_ids and _sweep_lock.locked():
+                for feed_id in due_ids:
+                    poll_scheduler.schedule(feed_id, now + timedelta(seconds=30))
+                poll_stats["deferred"] += len(due_ids)
+            elif due_ids:
+                swept = False
+                try:
+                    async with _sweep_lock:
+                        feeds = await asyncio.to_thread(_feeds_by_id, due_ids)
+                        await run_sweep(feeds, lambda feed_id: fetch_feed_articles(feed_id, http_client))
+                    poll_stats["dispatched"] += len(feeds)
+                    swept = True
+                finally:
+                    if not swept:
+                        # Popped feeds the sweep did not reschedule would otherwise wait for the next reload
+                        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+                        for feed_id in due_ids:
+                            if feed_id not in poll_scheduler:
+                                poll_scheduler.schedule(feed_id, retry_at)
+            
+            next_due = poll_scheduler.next_due()
+            delay = 30.0
+            if next_due is not None:
+                delay = min(max((next_due - datetime.now(timezone.utc)).total_seconds(), 1.0), 30.0)
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Feed scheduler iteration failed: {e}")
+            await asyncio.sleep(30)
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
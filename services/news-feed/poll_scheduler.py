@@ -0,0 +1,136 @@
+"""
+Adaptive per-feed polling.
+
+Each feed gets its own poll interval instead of the global sweep period:
+
+- The publish history (recent ``Article.publish_date`` values) gives the
+  typical gap between items; the feed is polled about twice per gap.
+- ``poll_unchanged_ratio`` is an EWMA of fetches that brought nothing new
+  (HTTP 304, identical body, or no new articles). Feeds that keep answering
+  "nothing new" back off up to POLL_UNCHANGED_BACKOFF times the publish-rate
+  target. A fetch that finds new articles pulls the interval back down.
+- A failed fetch leaves both alone and is retried after POLL_MIN_SECONDS,
+  doubling with each consecutive failure up to POLL_MAX_SECONDS.
+- Intervals are clamped to [POLL_MIN_SECONDS, POLL_MAX_SECONDS], and due
+  times get +/- POLL_JITTER so feeds that share a host do not line up.
+
+``PollScheduler`` keeps the next due time of every active feed in a heap so
+the service's scheduler loop wakes up exactly when the next feed is due.
+"""
+import heapq
+import os
+import random
+import statistics
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+POLL_MIN_SECONDS = int(os.getenv("POLL_MIN_SECONDS", "120"))
+POLL_MAX_SECONDS = int(os.getenv("POLL_MAX_SECONDS", "86400"))
+POLL_DEFAULT_SECONDS = int(os.getenv("POLL_DEFAULT_SECONDS", "900"))
+POLL_JITTER = float(os.getenv("POLL_JITTER", "0.1"))
+POLL_UNCHANGED_BACKOFF = float(os.getenv("POLL_UNCHANGED_BACKOFF", "4"))
+# Publish dates considered when estimating a feed's rate
+POLL_HISTORY_SIZE = int(os.getenv("POLL_HISTORY_SIZE", "20"))
+
+# Weight of the latest fetch in poll_unchanged_ratio
+UNCHANGED_EWMA_WEIGHT = 0.3
+
+
+def update_unchanged_ratio(previous: Optional[float], brought_nothing: bool) -> float:
+    """Fold one fetch outcome into the EWMA of fetches that found nothing new."""
+    sample = 1.0 if brought_nothing else 0.0
+    if previous is None:
+        return sample
+    return (1 - UNCHANGED_EWMA_WEIGHT) * previous + UNCHANGED_EWMA_WEIGHT * sample
+
+
+def publish_gap_seconds(publish_dates: Sequence[datetime]) -> Optional[float]:
+    """Median gap between consecutive publish dates, or None with too little history."""
+    ordered = sorted(d for d in publish_dates if d is not None)
+    gaps = [
+        (later - earlier).total_seconds()
+        for earlier, later in zip(ordered, ordered[1:])
+        if later > earlier
+    ]
+    if len(gaps) < 2:
+        return None
+    return statistics.median(gaps)
+
+
+def compute_interval(
+    publish_dates: Sequence[datetime],
+    unchanged_ratio: float,
+    new_articles: int,
+    previous_interval: Optional[int],
+) -> int:
+    """Next poll interval in seconds for a feed."""
+    gap = publish_gap_seconds(publish_dates)
+    if gap is not None:
+        target = gap / 2
+    else:
+        target = previous_interval or POLL_DEFAULT_SECONDS
+
+    interval = target * (1 + (POLL_UNCHANGED_BACKOFF - 1) * unchanged_ratio)
+    if new_articles and previous_interval:
+        # Something new arrived: do not wait longer than last time
+        interval = min(interval, previous_interval)
+    return int(min(max(interval, POLL_MIN_SECONDS), POLL_MAX_SECONDS))
+
+
+def retry_interval(failures: int) -> int:
+    """Seconds until the next attempt after ``failures`` consecutive failed fetches."""
+    return int(min(POLL_MIN_SECONDS * 2 ** min(max(failures - 1, 0), 20), POLL_MAX_SECONDS))
+
+
+def jittered(now: datetime, interval: int) -> datetime:
+    """Due time ``interval`` seconds from ``now``, spread by POLL_JITTER."""
+    factor = 1 + random.uniform(-POLL_JITTER, POLL_JITTER)
+    return now + timedelta(seconds=interval * factor)
+
+
+class PollScheduler:
+    """Heap of (due time, feed id) with lazy removal of superseded entries."""
+
+    def __init__(self):
+        self._heap: List[Tuple[datetime, str]] = []
+        self._due: Dict[str, datetime] = {}
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def __contains__(self, feed_id) -> bool:
+        return str(feed_id) in self._due
+
+    def schedule(self, feed_id, due_at: datetime) -> None:
+        key = str(feed_id)
+        self._due[key] = due_at
+        heapq.heappush(self._heap, (due_at, key))
+
+    def remove(self, feed_id) -> None:
+        self._due.pop(str(feed_id), None)
+
+    def replace_all(self, entries: Dict[str, datetime]) -> None:
+        """Reset to ``entries`` (feed id -> due time), e.g. after reloading from the database."""
+        self._due = {str(k): v for k, v in entries.items()}
+        self._heap = [(due_at, key) for key, due_at in self._due.items()]
+        heapq.heapify(self._heap)
+
+    def next_due(self) -> Optional[datetime]:
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime, limit: Optional[int] = None) -> List[str]:
+        """Feed ids due at ``now``, earliest first. They stay unscheduled until rescheduled."""
+        due = []
+        while self._heap and (limit is None or len(due) < limit):
+            self._drop_stale()
+            if not self._heap or self._heap[0][0] > now:
+                break
+            _, key = heapq.heappop(self._heap)
+            del self._due[key]
+            due.append(key)
+        return due
+
+    def _drop_stale(self) -> None:
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
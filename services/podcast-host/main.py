@@ -12,9 +12,10 @@ from fastapi import FastAPI, HTTPException, Depends
 from fastapi.responses import FileResponse, PlainTextResponse
 from pydantic import BaseModel
 
-from shared.database import get_db, create_tables
+from shared.database import get_async_db, create_tables
 from shared.models import Episode, EpisodeMetadata, AudioFile, PublishRecord
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -27,6 +28,23 @@ LOCAL_STORAGE_PATH = os.getenv("LOCAL_STORAGE_PATH", "/app/storage")
 LOCAL_SERVER_URL = os.getenv("LOCAL_SERVER_URL", "http://localhost:8080")
 
 
+async def _load_episode_bundle(episode_id: UUID, db: AsyncSession):
+    """Fetch an episode with its metadata and audio file in one round trip."""
+    result = await db.execute(
+        select(Episode, EpisodeMetadata, AudioFile)
+        .outerjoin(EpisodeMetadata, EpisodeMetadata.episode_id == Episode.id)
+        .outerjoin(AudioFile, AudioFile.episode_id == Episode.id)
+        .where(Episode.id == episode_id)
+    )
+    row = result.first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Episode not found")
+    episode, metadata, audio_file = row
+    if not audio_file:
+        raise HTTPException(status_code=404, detail="Audio file not found")
+    return episode, metadata, audio_file
+
+
 class EpisodeResponse(BaseModel):
     id: str
     title: str
@@ -56,26 +74,11 @@ async def health_check():
 
 
 @app.get("/episodes/{episode_id}")
-async def get_episode_info(episode_id: UUID, db: Session = Depends(get_db)):
+async def get_episode_info(episode_id: UUID, db: AsyncSession = Depends(get_async_db)):
     """Get episode information."""
     try:
-        # Get episode from database
-        episode = db.query(Episode).filter(Episode.id == episode_id).first()
-        if not episode:
-            raise HTTPException(status_code=404, detail="Episode not found")
-        
-        # Get metadata
-        metadata = db.query(EpisodeMetadata).filter(
-            EpisodeMetadata.episode_id == episode_id
-        ).first()
-        
-        # Get audio file
-        audio_file = db.query(AudioFile).filter(
-            AudioFile.episode_id == episode_id
-        ).first()
-        
-        if not audio_file:
-            raise HTTPException(status_code=404, detail="Audio file not found")
+        # Get episode, metadata and audio file from database
+        episode, metadata, audio_file = await _load_episode_bundle(episode_id, db)
         
         return EpisodeResponse(
             id=str(episode.id),
@@ -93,24 +96,11 @@ async def get_episode_info(episode_id: UUID, db: Session = Depends(get_db)):
 
 
 @app.get("/rss/episodes/{episode_id}")
-async def get_episode_rss(episode_id: UUID, db: Session = Depends(get_db)):
+async def get_episode_rss(episode_id: UUID, db: AsyncSession = Depends(get_async_db)):
     """Generate RSS feed for a specific episode."""
     try:
         # Get episode data
-        episode = db.query(Episode).filter(Episode.id == episode_id).first()
-        if not episode:
-            raise HTTPException(status_code=404, detail="Episode not found")
-        
-        metadata = db.query(EpisodeMetadata).filter(
-            EpisodeMetadata.episode_id == episode_id
-        ).first()
-        
-        audio_file = db.query(AudioFile).filter(
-            AudioFile.episode_id == episode_id
-        ).first()
-        
-        if not audio_file:
-            raise HTTPException(status_code=404, detail="Audio file not found")
+        episode, metadata, audio_file = await _load_episode_bundle(episode_id, db)
         
         # Generate RSS XML
         title = metadata.title if metadata else "Untitled Episode"
@@ -151,24 +141,11 @@ async def get_episode_rss(episode_id: UUID, db: Session = Depends(get_db)):
 
 
 @app.get("/podcast/episodes/{episode_id}")
-async def get_podcast_episode(episode_id: UUID, db: Session = Depends(get_db)):
+async def get_podcast_episode(episode_id: UUID, db: AsyncSession = Depends(get_async_db)):
     """Get podcast episode page."""
     try:
         # Get episode data
-        episode = db.query(Episode).filter(Episode.id == episode_id).first()
-        if not episode:
-            raise HTTPException(status_code=404, detail="Episode not found")
-        
-        metadata = db.query(EpisodeMetadata).filter(
-            EpisodeMetadata.episode_id == episode_id
-        ).first()
-        
-        audio_file = db.query(AudioFile).filter(
-            AudioFile.episode_id == episode_id
-        ).first()
-        
-        if not audio_file:
-            raise HTTPException(status_code=404, detail="Audio file not found")
+        episode, metadata, audio_file = await _load_episode_bundle(episode_id, db)
         
         title = metadata.title if metadata else "Untitled Episode"
         description = metadata.description if metadata else "No description"
@@ -219,17 +196,16 @@ async def get_podcast_episode(episode_id: UUID, db: Session = Depends(get_db)):
 
 
 @app.get("/api/episodes")
-async def list_episodes(db: Session = Depends(get_db)):
+async def list_episodes(db: AsyncSession = Depends(get_async_db)):
     """List all episodes."""
     try:
-        episodes = db.query(Episode).all()
+        result = await db.execute(
+            select(Episode, EpisodeMetadata)
+            .outerjoin(EpisodeMetadata, EpisodeMetadata.episode_id == Episode.id)
+        )
         episode_list = []
         
-        for episode in episodes:
-            metadata = db.query(EpisodeMetadata).filter(
-                EpisodeMetadata.episode_id == episode.id
-            ).first()
-            
+        for episode, metadata in result.all():
             episode_list.append({
                 "id": str(episode.id),
                 "title": metadata.title if metadata else "Untitled Episode",
@@ -3,23 +3,30 @@ Reviewer Service – Two-tier Light/Heavy orchestration with Redis-backed config
 Backwards-compatible with existing /review-article endpoint; now persists review fields on Article.
 """
 import asyncio
+import hashlib
 import json
 import logging
 import os
-import threading
+import random
+import re
+import socket
 import time
+from collections import deque
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from uuid import UUID
 
 import httpx
 import redis
+import redis.asyncio as aioredis
 from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
 from pydantic import BaseModel, Field
+from sqlalchemy import select, text, tuple_
 from sqlalchemy.orm import Session
 
-from shared.database import get_db, create_tables
+from shared.database import get_db, create_tables, get_pool_prometheus_lines
 from shared.models import Article, NewsFeed
+from shared.clusters import copy_cluster_reviews
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -31,6 +38,12 @@ app = FastAPI(title="Reviewer Service", version="1.0.0")
 REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
 LIGHT_REVIEWER_URL = os.getenv("LIGHT_REVIEWER_URL", "http://light-reviewer:8000")
 HEAVY_REVIEWER_URL = os.getenv("HEAVY_REVIEWER_URL", "http://heavy-reviewer:8000")
+REVIEWER_HTTP_TIMEOUT = float(os.getenv("REVIEWER_HTTP_TIMEOUT", "60"))
+# Largest batch the light reviewer's /review-batch accepts (same variable as in light-reviewer);
+# larger review batches are split into chunks of this size
+LIGHT_BATCH_MAX = int(os.getenv("LIGHT_BATCH_MAX", "8"))
+# Extra /review-batch timeout per article; keep at least the light reviewer's LIGHT_BATCH_TIMEOUT_PER_ITEM
+REVIEW_BATCH_TIMEOUT_PER_ITEM = float(os.getenv("REVIEW_BATCH_TIMEOUT_PER_ITEM", "10"))
 
 # Reviewer defaults (can be overridden via Redis config)
 DEFAULT_CONF_THRESHOLD = float(os.getenv("REVIEWER_CONF_THRESHOLD", "0.4"))  # Light reviewer threshold
@@ -39,6 +52,18 @@ DEFAULT_LIGHT_MODEL = os.getenv("REVIEWER_LIGHT_MODEL", "qwen2:0.5b")
 DEFAULT_HEAVY_MODEL = os.getenv("REVIEWER_HEAVY_MODEL", "qwen3:4b")
 DEFAULT_HEAVY_ENABLED = os.getenv("REVIEWER_HEAVY_ENABLED", "true").lower() == "true"
 
+# Largest number of review requests accepted by one /enqueue-batch call
+ENQUEUE_BATCH_MAX = int(os.getenv("REVIEWER_ENQUEUE_BATCH_MAX", "1000"))
+
+# Review results cached by content hash; a hit skips the Light/Heavy reviewers
+REVIEW_CACHE_ENABLED = os.getenv("REVIEW_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+REVIEW_CACHE_TTL = int(os.getenv("REVIEW_CACHE_TTL", "604800"))
+# Bump when prompts or response parsing change so older cached reviews are not reused
+REVIEW_CACHE_VERSION = "1"
+
+# Seconds the review path reuses the reviewer:config hash before reading it again
+REVIEWER_CONFIG_TTL_SECONDS = float(os.getenv("REVIEWER_CONFIG_TTL_SECONDS", "5"))
+
 
 class ArticleReview(BaseModel):
     """Review result for an article."""
@@ -78,6 +103,7 @@ class ReviewerConfig(BaseModel):
 
 class FeedReviewRequest(BaseModel):
     feed_id: str
+    article_id: Optional[str] = None
     title: str
     url: str
     content: Optional[str] = None
@@ -106,7 +132,7 @@ class ReviewerClient:
     def __init__(self, light_url: str = LIGHT_REVIEWER_URL, heavy_url: str = HEAVY_REVIEWER_URL):
         self.light_url = light_url
         self.heavy_url = heavy_url
-        self.client = httpx.AsyncClient(timeout=60.0)
+        self.client = httpx.AsyncClient(timeout=REVIEWER_HTTP_TIMEOUT)
     
     async def generate_light_review(self, request: FeedReviewRequest) -> Dict[str, Any]:
         """Generate review using Light Reviewer service."""
@@ -122,6 +148,37 @@ class ReviewerClient:
             logger.error(f"Error calling Light Reviewer service: {e}")
             raise HTTPException(status_code=500, detail=f"Light review generation failed: {str(e)}")
     
+    async def generate_light_review_batch(self, requests: List[FeedReviewRequest]) -> List[Dict[str, Any]]:
+        """Light reviews of several items through ``/review-batch``, in request order.
+        
+        Requests are sent in concurrent chunks of at most LIGHT_BATCH_MAX items.
+        """
+        chunks = [requests[i:i + LIGHT_BATCH_MAX] for i in range(0, len(requests), max(1, LIGHT_BATCH_MAX))]
+        results = await asyncio.gather(*(self._light_review_chunk(chunk) for chunk in chunks))
+        return [result for chunk_results in results for result in chunk_results]
+    
+    async def _light_review_chunk(self, requests: List[FeedReviewRequest]) -> List[Dict[str, Any]]:
+        try:
+            response = await self.client.post(
+                f"{self.light_url}/review-batch",
+                json=[request.dict() for request in requests],
+                timeout=REVIEWER_HTTP_TIMEOUT + REVIEW_BATCH_TIMEOUT_PER_ITEM * len(requests)
+            )
+            if response.status_code == 413:
+                logger.warning(
+                    f"Light Reviewer rejected a batch of {len(requests)} as too large; "
+                    f"LIGHT_BATCH_MAX ({LIGHT_BATCH_MAX}) is above its limit, reviewing singly"
+                )
+            response.raise_for_status()
+            results = response.json()
+            if len(results) != len(requests):
+                raise ValueError(f"expected {len(requests)} results, got {len(results)}")
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error calling Light Reviewer batch endpoint: {e}")
+            raise HTTPException(status_code=500, detail=f"Light batch review failed: {str(e)}")
+    
     async def generate_heavy_review(self, request: FeedReviewRequest) -> Dict[str, Any]:
         """Generate review using Heavy Reviewer service."""
         try:
@@ -137,12 +194,87 @@ class ReviewerClient:
             raise HTTPException(status_code=500, detail=f"Heavy review generation failed: {str(e)}")
 
 
+class ReviewCache:
+    """Review results in Redis, keyed by normalized title + content and the reviewer configuration.
+    
+    Title and content are case-folded with whitespace collapsed, so re-ingested
+    copies of an article hit the same entry. The key also covers the models,
+    heavy routing settings and REVIEW_CACHE_VERSION, so a config change starts
+    from a cold cache rather than returning reviews made under other settings.
+    Hits and misses are counted in Redis across replicas.
+    
+    Results with zero confidence are never stored: the Light and Heavy
+    Reviewers answer 200 with a zero-confidence fallback when Ollama is down
+    or their output cannot be parsed, and those must not outlive the outage.
+    The client is ``redis.asyncio`` so lookups do not block the event loop.
+    """
+    
+    _WHITESPACE = re.compile(r"\s+")
+    
+    def __init__(self, redis_client: aioredis.Redis, ttl_seconds: int = REVIEW_CACHE_TTL, prefix: str = "reviewer:cache"):
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+        self.stats_key = "reviewer:metrics:cache"
+    
+    def key(self, title: str, content: str, cfg: "ReviewerConfig") -> str:
+        normalized = self._WHITESPACE.sub(" ", f"{title or ''}\n{content or ''}").strip().casefold()
+        config_version = "|".join([
+            REVIEW_CACHE_VERSION, cfg.light_model, cfg.heavy_model,
+            str(cfg.heavy_enabled), str(cfg.heavy_conf_threshold),
+        ])
+        digest = hashlib.sha256(f"{config_version}\n{normalized}".encode("utf-8", errors="ignore")).hexdigest()
+        return f"{self.prefix}:{digest}"
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached result (tags, summary, confidence, model, reviewer_type) or None."""
+        return (await self.get_many([key]))[0]
+    
+    async def get_many(self, keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """``get`` for several keys: one MGET, then one pipeline for the hit/miss counters."""
+        if not keys:
+            return []
+        try:
+            raws = await self.redis.mget(keys)
+            hits = sum(1 for raw in raws if raw)
+            pipe = self.redis.pipeline(transaction=False)
+            if hits:
+                pipe.hincrby(self.stats_key, "hits", hits)
+            if hits < len(keys):
+                pipe.hincrby(self.stats_key, "misses", len(keys) - hits)
+            await pipe.execute()
+            return [json.loads(raw) if raw else None for raw in raws]
+        except Exception as e:
+            logger.warning(f"Review cache lookup failed: {e}")
+            return [None] * len(keys)
+    
+    async def put(self, key: str, result: Dict[str, Any]) -> None:
+        if not result.get("confidence"):
+            # Fallback or unparseable review; ask the reviewers again next time
+            return
+        try:
+            await self.redis.set(key, json.dumps(result), ex=self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Review cache write failed: {e}")
+    
+    async def counts(self) -> Dict[str, int]:
+        stats = await self.redis.hgetall(self.stats_key) or {}
+        return {"hits": int(stats.get("hits", 0)), "misses": int(stats.get("misses", 0))}
+
+
 class ArticleReviewer:
-    """Handles article review and categorization logic."""
+    """Handles article review and categorization logic.
+    
+    The review path talks to Redis through ``aredis`` (``redis.asyncio``) so
+    config reads and metric writes do not block other reviews on the event
+    loop. ``redis`` (sync) is kept for the stats endpoints.
+    """
     
     def __init__(self):
         self.reviewer_client = ReviewerClient()
         self.redis = redis.Redis.from_url(REDIS_URL, decode_responses=True)
+        self.aredis = aioredis.from_url(REDIS_URL, decode_responses=True)
+        self._config: Optional[tuple] = None  # (monotonic time loaded, ReviewerConfig)
         self.config_key = "reviewer:config"
         self.metrics_prefix = "reviewer:metrics"
         self.lat_list_light = f"{self.metrics_prefix}:lat:light"
@@ -150,6 +282,7 @@ class ArticleReviewer:
         self.err_list = f"{self.metrics_prefix}:errors"
         self.conf_hist = f"{self.metrics_prefix}:conf_hist"
         self.queue_key = "reviewer:queue"
+        self.cache = ReviewCache(self.aredis) if REVIEW_CACHE_ENABLED else None
     
     
     def _convert_service_response_to_review(self, service_response: Dict[str, Any], article_id: UUID, model: str) -> ArticleReview:
@@ -180,15 +313,81 @@ class ArticleReviewer:
         logger.info(f"Reviewing article: {article.title[:80]}...")
 
         # Load runtime config
-        cfg = self._load_config()
+        cfg = await self._load_config()
 
-        timings: Dict[str, float] = {}
-        reviewer_type = "light"
-        fallback_used = False
-        model_used = cfg.light_model
+        [(cache_key, cached)] = await self._cached_reviews([article], cfg)
+        if cached:
+            return cached
+
+        # Use provided client or default
+        client = reviewer_client or self.reviewer_client
+        return await self._complete_review(article, cfg, client, cache_key)
+
+    async def review_articles(self, articles: List[Article]) -> List[Dict[str, Any]]:
+        """Review several articles, with one batched light call for those not in the cache.
+        
+        Results are in input order and have the shape ``review_article``
+        returns. Low-confidence items still go to the heavy reviewer one by
+        one. If the batch call fails, the light pass falls back to single
+        calls per article.
+        """
+        cfg = await self._load_config()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(articles)
+        misses = []
+        for index, (article, (cache_key, cached)) in enumerate(zip(articles, await self._cached_reviews(articles, cfg))):
+            if cached:
+                results[index] = cached
+            else:
+                misses.append((index, article, cache_key))
 
-        # Create request for reviewer services
-        feed_request = FeedReviewRequest(
+        light_results: List[Optional[Dict[str, Any]]] = [None] * len(misses)
+        light_ms = None
+        if len(misses) > 1:
+            t0 = datetime.utcnow()
+            try:
+                light_results = await self.reviewer_client.generate_light_review_batch(
+                    [self._feed_request(article) for _, article, _ in misses]
+                )
+                # Each article is charged its share of the batch call
+                light_ms = (datetime.utcnow() - t0).total_seconds() * 1000.0 / len(misses)
+            except Exception as e:
+                logger.warning(f"Batched light review of {len(misses)} articles failed, reviewing singly: {e}")
+
+        completed = await asyncio.gather(*(
+            self._complete_review(article, cfg, self.reviewer_client, cache_key, light_result, light_ms)
+            for (_, article, cache_key), light_result in zip(misses, light_results)
+        ))
+        for (index, _, _), result in zip(misses, completed):
+            results[index] = result
+        return results
+
+    async def _cached_reviews(self, articles: List[Article], cfg: ReviewerConfig) -> List[tuple]:
+        """``(cache_key, result)`` per article, looked up in one batch.
+        
+        ``result`` is set when the same content was reviewed under the same config.
+        """
+        if self.cache is None:
+            return [(None, None)] * len(articles)
+        keys = [self.cache.key(article.title, article.content or article.summary or "", cfg) for article in articles]
+        found = []
+        for article, cache_key, cached in zip(articles, keys, await self.cache.get_many(keys)):
+            if not cached:
+                found.append((cache_key, None))
+                continue
+            review = self._convert_service_response_to_review(cached, article.id, cached["model"])
+            review.review_metadata.update({"reviewer_type": cached["reviewer_type"], "cache_hit": True})
+            found.append((cache_key, {
+                "review": review,
+                "reviewer_type": cached["reviewer_type"],
+                "fallback": False,
+                "timings": {},
+                "cache_hit": True,
+            }))
+        return found
+
+    def _feed_request(self, article: Article) -> FeedReviewRequest:
+        """Request for the reviewer services."""
+        return FeedReviewRequest(
             feed_id=str(article.feed_id),
             title=article.title,
             url=article.link,
@@ -196,25 +395,39 @@ class ArticleReviewer:
             published=article.publish_date.isoformat() if article.publish_date else ""
         )
 
-        # Use provided client or default
-        client = reviewer_client or self.reviewer_client
+    async def _complete_review(
+        self,
+        article: Article,
+        cfg: ReviewerConfig,
+        client: ReviewerClient,
+        cache_key: Optional[str],
+        light_result: Optional[Dict[str, Any]] = None,
+        light_ms: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Light pass (unless ``light_result`` came from a batch), heavy routing and caching."""
+        timings: Dict[str, float] = {}
+        reviewer_type = "light"
+        fallback_used = False
+        light_failed = False
+        model_used = cfg.light_model
+
+        feed_request = self._feed_request(article)
         
         # LIGHT pass
         t0 = datetime.utcnow()
         try:
-            light_result = await client.generate_light_review(feed_request)
+            if light_result is None:
+                light_result = await client.generate_light_review(feed_request)
             review = self._convert_service_response_to_review(light_result, article.id, cfg.light_model)
-            timings["light_ms"] = (datetime.utcnow() - t0).total_seconds() * 1000.0
-            self._record_latency("light", timings["light_ms"]) 
-            self._record_confidence(review.confidence)
+            timings["light_ms"] = light_ms if light_ms is not None else (datetime.utcnow() - t0).total_seconds() * 1000.0
+            await self._record_pass("light", timings["light_ms"], review.confidence)
             model_used = cfg.light_model
         except Exception as e:
             logger.warning(f"Light review failed, using fallback heuristics: {e}")
+            light_failed = True
             review = self._fallback_review(article, model=cfg.light_model, error=e)
             timings["light_ms"] = (datetime.utcnow() - t0).total_seconds() * 1000.0
-            self._record_error(str(e))
-            self._record_latency("light", timings["light_ms"]) 
-            self._record_confidence(review.confidence)
+            await self._record_pass("light", timings["light_ms"], review.confidence, error=str(e))
 
         # Route to HEAVY if enabled and below heavy threshold
         if cfg.heavy_enabled and (review.confidence < cfg.heavy_conf_threshold):
@@ -228,13 +441,12 @@ class ArticleReviewer:
                     heavy_result = await client.generate_heavy_review(feed_request)
                     review = self._convert_service_response_to_review(heavy_result, article.id, cfg.heavy_model)
                     timings["heavy_ms"] = (datetime.utcnow() - t1).total_seconds() * 1000.0
-                    self._record_latency("heavy", timings["heavy_ms"]) 
-                    self._record_confidence(review.confidence)
+                    await self._record_pass("heavy", timings["heavy_ms"], review.confidence)
                     break
                 except Exception as he:
                     last_exc = he
                     retries += 1
-                    self._record_error(str(he))
+                    await self._record_error(str(he))
             else:
                 # Fallback to light output
                 fallback_used = True
@@ -251,6 +463,16 @@ class ArticleReviewer:
             "fallback_used": fallback_used,
         })
 
+        # Heuristic or degraded results are not cached so the next attempt asks the reviewers again
+        if cache_key and not (light_failed or fallback_used):
+            await self.cache.put(cache_key, {
+                "tags": review.tags,
+                "summary": review.summary,
+                "confidence": review.confidence,
+                "model": model_used,
+                "reviewer_type": reviewer_type,
+            })
+
         return {
             "review": review,
             "reviewer_type": reviewer_type,
@@ -289,16 +511,19 @@ class ArticleReviewer:
             }
         )
 
-    def _load_config(self) -> ReviewerConfig:
+    async def _load_config(self, refresh: bool = False) -> ReviewerConfig:
+        """Runtime config from ``reviewer:config``, reused for REVIEWER_CONFIG_TTL_SECONDS unless ``refresh``."""
+        if not refresh and self._config and time.monotonic() - self._config[0] < REVIEWER_CONFIG_TTL_SECONDS:
+            return self._config[1]
         try:
-            cfg_map = self.redis.hgetall(self.config_key) or {}
+            cfg_map = await self.aredis.hgetall(self.config_key) or {}
             conf_threshold = float(cfg_map.get("conf_threshold", DEFAULT_CONF_THRESHOLD))
             heavy_conf_threshold = float(cfg_map.get("heavy_conf_threshold", DEFAULT_HEAVY_CONF_THRESHOLD))
             heavy_enabled = str(cfg_map.get("heavy_enabled", str(DEFAULT_HEAVY_ENABLED))).lower() in ("1", "true", "yes")
             light_model = cfg_map.get("light_model", DEFAULT_LIGHT_MODEL)
             heavy_model = cfg_map.get("heavy_model", DEFAULT_HEAVY_MODEL)
             light_workers = int(cfg_map.get("light_workers", 1))
-            return ReviewerConfig(
+            cfg = ReviewerConfig(
                 conf_threshold=conf_threshold,
                 heavy_conf_threshold=heavy_conf_threshold,
                 heavy_enabled=heavy_enabled,
@@ -308,155 +533,662 @@ class ArticleReviewer:
             )
         except Exception:
             return ReviewerConfig()
+        self._config = (time.monotonic(), cfg)
+        return cfg
 
-    def _record_latency(self, which: str, ms: float) -> None:
+    async def _record_pass(self, which: str, ms: float, confidence: float, error: Optional[str] = None) -> None:
+        """Latency, confidence bucket and (optionally) error of one light/heavy pass, in one round trip."""
         try:
+            now = int(datetime.utcnow().timestamp())
             key = self.lat_list_light if which == "light" else self.lat_list_heavy
-            self.redis.lpush(key, f"{int(datetime.utcnow().timestamp())}|{int(ms)}")
-            self.redis.ltrim(key, 0, 4999)
+            bucket = max(0, min(19, int(confidence / 0.05)))
+            pipe = self.aredis.pipeline(transaction=False)
+            if error is not None:
+                pipe.lpush(self.err_list, f"{now}|{error[:200]}")
+                pipe.ltrim(self.err_list, 0, 999)
+            pipe.lpush(key, f"{now}|{int(ms)}")
+            pipe.ltrim(key, 0, 4999)
+            pipe.hincrby(self.conf_hist, f"bucket_{bucket}", 1)
+            await pipe.execute()
         except Exception:
             pass
 
-    def _record_error(self, message: str) -> None:
+    async def _record_error(self, message: str) -> None:
         try:
-            self.redis.lpush(self.err_list, f"{int(datetime.utcnow().timestamp())}|{message[:200]}")
-            self.redis.ltrim(self.err_list, 0, 999)
+            pipe = self.aredis.pipeline(transaction=False)
+            pipe.lpush(self.err_list, f"{int(datetime.utcnow().timestamp())}|{message[:200]}")
+            pipe.ltrim(self.err_list, 0, 999)
+            await pipe.execute()
         except Exception:
             pass
 
-    def _record_confidence(self, confidence: float) -> None:
+
+# Initialize services
+article_reviewer = ArticleReviewer()
+
+# Reliable review queue: a Redis stream read through a consumer group
+REVIEW_STREAM_GROUP = os.getenv("REVIEW_STREAM_GROUP", "reviewers")
+REVIEW_CONSUMER = os.getenv("REVIEW_CONSUMER") or f"{socket.gethostname()}-{os.getpid()}"
+# Attempts before an item goes to the dead-letter stream
+REVIEW_MAX_ATTEMPTS = int(os.getenv("REVIEW_MAX_ATTEMPTS", "5"))
+# Retry delay: base * 2^(attempt - 1), capped, with +/-20% jitter
+REVIEW_RETRY_BASE_SECONDS = float(os.getenv("REVIEW_RETRY_BASE_SECONDS", "5"))
+REVIEW_RETRY_MAX_SECONDS = float(os.getenv("REVIEW_RETRY_MAX_SECONDS", "600"))
+# Delivered but unacknowledged this long means the consumer died; must exceed the slowest review
+REVIEW_CLAIM_IDLE_SECONDS = float(os.getenv("REVIEW_CLAIM_IDLE_SECONDS", "900"))
+REVIEW_DEAD_LETTER_MAXLEN = int(os.getenv("REVIEW_DEAD_LETTER_MAXLEN", "10000"))
+# How long an enqueued article is not queued again (marker reviewer:dispatched:<article_id>)
+REVIEW_DISPATCH_TTL_SECONDS = int(os.getenv("REVIEW_DISPATCH_TTL_SECONDS", "3600"))
+
+# Move due retries back onto the stream; ZREM decides which replica moves each one
+PROMOTE_RETRIES_LUA = """
+local moved = 0
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+for _, member in ipairs(due) do
+    if redis.call('ZREM', KEYS[1], member) == 1 then
+        redis.call('XADD', KEYS[2], '*', 'payload', member)
+        moved = moved + 1
+    end
+end
+return moved
+"""
+
+
+def retry_delay_seconds(attempts: int) -> float:
+    """Backoff before attempt ``attempts + 1``."""
+    delay = min(REVIEW_RETRY_BASE_SECONDS * 2 ** max(0, attempts - 1), REVIEW_RETRY_MAX_SECONDS)
+    return delay * random.uniform(0.8, 1.2)
+
+
+class ReviewQueue:
+    """``reviewer:queue`` as a Redis stream with per-item acks, delayed retries and dead-lettering.
+    
+    Every reviewer replica reads through the same consumer group, so each
+    item is delivered to one consumer and stays pending until acked.
+    A failed item is acked and parked in ``<key>:retry`` (a sorted set scored
+    by due time) with exponential backoff. After REVIEW_MAX_ATTEMPTS it goes to
+    ``<key>:dead`` instead. Items left pending by a dead consumer are
+    reclaimed after REVIEW_CLAIM_IDLE_SECONDS and count as a failed attempt.
+    Acked entries are deleted, so the stream length is the number of items
+    waiting or in progress.
+    """
+    
+    def __init__(self, redis_client: aioredis.Redis, key: str = "reviewer:queue",
+                 group: str = REVIEW_STREAM_GROUP, consumer: str = REVIEW_CONSUMER):
+        self.redis = redis_client
+        self.key = key
+        self.group = group
+        self.consumer = consumer
+        self.retry_key = f"{key}:retry"
+        self.dead_key = f"{key}:dead"
+        self._promote = redis_client.register_script(PROMOTE_RETRIES_LUA)
+        # Process-local counters (exported by /metrics/prometheus)
+        self.stats = {"acked": 0, "retried": 0, "dead_lettered": 0, "reclaimed": 0}
+    
+    async def ensure_group(self) -> None:
+        """Create the consumer group (and stream), converting a list-based queue left by older releases."""
+        if await self.redis.type(self.key) == "list":
+            legacy_key = f"{self.key}:legacy:{self.consumer}"
+            try:
+                await self.redis.rename(self.key, legacy_key)
+            except redis.ResponseError:
+                pass  # Another replica converted it first
+            else:
+                # Oldest items sit at the tail of the list
+                items = list(reversed(await self.redis.lrange(legacy_key, 0, -1)))
+                if items:
+                    pipe = self.redis.pipeline(transaction=False)
+                    for item in items:
+                        pipe.xadd(self.key, {"payload": item})
+                    await pipe.execute()
+                await self.redis.delete(legacy_key)
+                logger.info(f"Moved {len(items)} items from the list queue to the {self.key} stream")
         try:
-            bucket = max(0, min(19, int(confidence / 0.05)))
-            bucket_label = f"bucket_{bucket}"
-            self.redis.hincrby(self.conf_hist, bucket_label, 1)
+            await self.redis.xgroup_create(self.key, self.group, id="0", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+    
+    async def add(self, items: List[Dict[str, Any]]) -> int:
+        """Append items in one MULTI/EXEC pipeline (all or none); returns the queue length."""
+        pipe = self.redis.pipeline(transaction=True)
+        for item in items:
+            pipe.xadd(self.key, {"payload": json.dumps(item)})
+        pipe.xlen(self.key)
+        return (await pipe.execute())[-1]
+    
+    async def add_undispatched(self, items: List[Dict[str, Any]]) -> tuple:
+        """Append the items whose article was not enqueued in the last REVIEW_DISPATCH_TTL_SECONDS.
+        
+        Each ``article_id`` takes a ``reviewer:dispatched:<id>`` marker with
+        SET NX, so news-feed ingest and the overseer's periodic dispatch never
+        queue one article twice. Markers are removed again if the add fails.
+        Returns ``(items added, queue length)``.
+        """
+        markers = [f"reviewer:dispatched:{item['article_id']}" if item.get("article_id") else None for item in items]
+        pipe = self.redis.pipeline(transaction=False)
+        for marker in markers:
+            if marker:
+                pipe.set(marker, 1, nx=True, ex=REVIEW_DISPATCH_TTL_SECONDS)
+        fresh = iter(await pipe.execute())
+        to_add = [(item, marker) for item, marker in zip(items, markers) if marker is None or next(fresh)]
+        if not to_add:
+            return 0, await self.redis.xlen(self.key)
+        try:
+            queue_length = await self.add([item for item, _ in to_add])
         except Exception:
-            pass
+            taken = [marker for _, marker in to_add if marker]
+            if taken:
+                await self.redis.delete(*taken)
+            raise
+        return len(to_add), queue_length
+    
+    async def read(self, count: int = 1, block_ms: Optional[int] = None) -> List[tuple]:
+        """Claim up to ``count`` new items for this consumer as ``(entry_id, payload)`` pairs."""
+        response = await self.redis.xreadgroup(
+            self.group, self.consumer, {self.key: ">"}, count=count, block=block_ms
+        )
+        return [(entry_id, fields.get("payload", "")) for _, entries in response or [] for entry_id, fields in entries]
+    
+    async def ack(self, entry_ids: List[str]) -> None:
+        if not entry_ids:
+            return
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.xack(self.key, self.group, *entry_ids)
+        pipe.xdel(self.key, *entry_ids)
+        await pipe.execute()
+        self.stats["acked"] += len(entry_ids)
+    
+    async def requeue(self, entry_id: str, payload: str) -> None:
+        """Put an item back at the end of the stream without counting an attempt (e.g. on shutdown)."""
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.xadd(self.key, {"payload": payload})
+        pipe.xack(self.key, self.group, entry_id)
+        pipe.xdel(self.key, entry_id)
+        await pipe.execute()
+    
+    async def fail(self, entry_id: str, payload: str, error: str) -> str:
+        """Record a failed attempt: schedule a retry with backoff or dead-letter the item.
+        
+        Returns ``"retry"`` or ``"dead"``.
+        """
+        try:
+            item = json.loads(payload)
+            if not isinstance(item, dict):
+                raise ValueError("payload is not an object")
+        except ValueError:
+            # Unparseable payloads can never succeed
+            await self.dead_letter(entry_id, payload, error, attempts=1)
+            return "dead"
+        
+        attempts = int(item.get("attempts", 0)) + 1
+        if attempts >= REVIEW_MAX_ATTEMPTS:
+            await self.dead_letter(entry_id, payload, error, attempts)
+            return "dead"
+        
+        item.update({"attempts": attempts, "last_error": error[:500]})
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.zadd(self.retry_key, {json.dumps(item): time.time() + retry_delay_seconds(attempts)})
+        pipe.xack(self.key, self.group, entry_id)
+        pipe.xdel(self.key, entry_id)
+        await pipe.execute()
+        self.stats["retried"] += 1
+        return "retry"
+    
+    async def dead_letter(self, entry_id: str, payload: str, error: str, attempts: int) -> None:
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.xadd(
+            self.dead_key,
+            {
+                "payload": payload,
+                "error": error[:500],
+                "attempts": attempts,
+                "failed_at": datetime.utcnow().isoformat(),
+            },
+            maxlen=REVIEW_DEAD_LETTER_MAXLEN,
+            approximate=True,
+        )
+        pipe.xack(self.key, self.group, entry_id)
+        pipe.xdel(self.key, entry_id)
+        await pipe.execute()
+        self.stats["dead_lettered"] += 1
+        logger.error(f"Dead-lettered queue item {entry_id} after {attempts} attempts: {error[:200]}")
+    
+    async def promote_due_retries(self, limit: int = 100) -> int:
+        """Move retries whose backoff has elapsed back onto the stream."""
+        return await self._promote(keys=[self.retry_key, self.key], args=[time.time(), limit])
+    
+    async def reclaim_stale(self, limit: int = 100) -> int:
+        """Take over items a dead consumer left pending and count them as failed attempts."""
+        min_idle_ms = int(REVIEW_CLAIM_IDLE_SECONDS * 1000)
+        pending = await self.redis.xpending_range(
+            self.key, self.group, min="-", max="+", count=limit, idle=min_idle_ms
+        )
+        if not pending:
+            return 0
+        # XCLAIM re-checks the idle time, so only one replica gets each entry
+        claimed = await self.redis.xclaim(
+            self.key, self.group, self.consumer, min_idle_ms, [p["message_id"] for p in pending]
+        )
+        owners = {p["message_id"]: p["consumer"] for p in pending}
+        for entry_id, fields in claimed:
+            if not fields:
+                # Deleted while pending (acked elsewhere); just drop the reference
+                await self.redis.xack(self.key, self.group, entry_id)
+                continue
+            await self.fail(entry_id, fields.get("payload", ""), f"Reclaimed from stalled consumer {owners.get(entry_id)}")
+        self.stats["reclaimed"] += len(claimed)
+        return len(claimed)
+    
+    async def counts(self) -> Dict[str, int]:
+        """Items in the stream, delivered but unacked, waiting for a retry, and dead-lettered."""
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.xlen(self.key)
+        pipe.xpending(self.key, self.group)
+        pipe.zcard(self.retry_key)
+        pipe.xlen(self.dead_key)
+        try:
+            length, pending, retrying, dead = await pipe.execute()
+        except redis.ResponseError:
+            # Group not created yet
+            return {"length": 0, "pending": 0, "retrying": 0, "dead": 0}
+        return {"length": length, "pending": pending["pending"], "retrying": retrying, "dead": dead}
 
 
-# Initialize services
-article_reviewer = ArticleReviewer()
+review_queue = ReviewQueue(aioredis.from_url(REDIS_URL, decode_responses=True), key=article_reviewer.queue_key)
+
 
 # Queue worker state
-queue_worker_running = False
-queue_worker_thread = None
+# Review batches in flight per process; each is an asyncio task on the service's event loop.
+# Size it to the light-reviewer replicas behind LIGHT_REVIEWER_URL.
+REVIEW_CONCURRENCY = int(os.getenv("REVIEW_CONCURRENCY", "4"))
+# How long stopping the pool waits for in-flight reviews before cancelling them
+REVIEW_DRAIN_SECONDS = float(os.getenv("REVIEW_DRAIN_SECONDS", "60"))
+# How often due retries are moved back to the stream and stalled consumers are checked
+REVIEW_MAINTENANCE_SECONDS = float(os.getenv("REVIEW_MAINTENANCE_SECONDS", "2"))
+REVIEW_RECLAIM_INTERVAL_SECONDS = float(os.getenv("REVIEW_RECLAIM_INTERVAL_SECONDS", "60"))
+# Items per light-reviewer call (/review-batch); a worker waits up to the linger time to fill a batch
+REVIEW_BATCH_SIZE = int(os.getenv("REVIEW_BATCH_SIZE", "8"))
+REVIEW_BATCH_LINGER_MS = int(os.getenv("REVIEW_BATCH_LINGER_MS", "50"))
+PRODUCTION_LOCK_KEY = "podcast:production:active"
+
+
+def queue_request(item_data: Dict[str, Any]) -> FeedReviewRequest:
+    """Review request from a queue payload (queue bookkeeping fields are ignored)."""
+    return FeedReviewRequest(**{k: v for k, v in item_data.items() if k in FeedReviewRequest.model_fields})
+
+
+def load_queue_articles(requests: List[FeedReviewRequest]) -> List[Optional[Article]]:
+    """Articles queue items refer to (None when missing), detached from their session.
+    
+    Items carry ``article_id`` and the whole batch is loaded with one
+    primary key lookup. Items queued by older releases only have the feed and
+    URL, which match uq_articles_feed_link; they are loaded with a second query.
+    """
+    keys: List[Optional[tuple]] = []
+    for request in requests:
+        try:
+            if request.article_id:
+                keys.append(("id", UUID(request.article_id)))
+            else:
+                keys.append(("link", (UUID(request.feed_id), request.url)))
+        except ValueError:
+            # Not a UUID: no such article
+            keys.append(None)
+    ids = {key[1] for key in keys if key and key[0] == "id"}
+    links = {key[1] for key in keys if key and key[0] == "link"}
+    
+    db = next(get_db())
+    try:
+        found: Dict[tuple, Article] = {}
+        if ids:
+            for article in db.execute(select(Article).where(Article.id.in_(ids))).scalars():
+                found[("id", article.id)] = article
+        if links:
+            for article in db.execute(
+                select(Article).where(tuple_(Article.feed_id, Article.link).in_(links))
+            ).scalars():
+                found.setdefault(("link", (article.feed_id, article.link)), article)
+        return [found.get(key) if key else None for key in keys]
+    finally:
+        db.close()
+
+
+# Review results are written back in batches: every REVIEW_WRITE_BATCH results or REVIEW_WRITE_INTERVAL_MS
+REVIEW_WRITE_BATCH = int(os.getenv("REVIEW_WRITE_BATCH", "50"))
+REVIEW_WRITE_INTERVAL_MS = int(os.getenv("REVIEW_WRITE_INTERVAL_MS", "500"))
 
-def queue_worker():
-    """Background worker to process queue items continuously."""
-    global queue_worker_running
+
+def write_reviews(rows: List[Dict[str, Any]]) -> int:
+    """Store review results with one ``UPDATE ... FROM (VALUES ...)``; returns the rows updated.
+    
+    Near-duplicate copies of the reviewed articles get the same review in the
+    same transaction.
+    """
+    # A later result for the same article wins
+    by_id = {str(row["article_id"]): row for row in rows}
+    values = []
+    params: Dict[str, Any] = {}
+    for i, (article_id, row) in enumerate(by_id.items()):
+        values.append(
+            f"(CAST(:id{i} AS uuid), CAST(:tags{i} AS varchar[]), :summary{i}, "
+            f"CAST(:confidence{i} AS double precision), CAST(:type{i} AS varchar), CAST(:processed{i} AS timestamptz))"
+        )
+        params.update({
+            f"id{i}": article_id,
+            f"tags{i}": list(row["review_tags"] or []),
+            f"summary{i}": row["review_summary"],
+            f"confidence{i}": row["confidence"],
+            f"type{i}": row["reviewer_type"],
+            f"processed{i}": row["processed_at"],
+        })
+    statement = text(
+        "UPDATE articles AS a SET review_tags = v.review_tags, review_summary = v.review_summary, "
+        "confidence = v.confidence, reviewer_type = v.reviewer_type, processed_at = v.processed_at "
+        f"FROM (VALUES {', '.join(values)}) "
+        "AS v(id, review_tags, review_summary, confidence, reviewer_type, processed_at) "
+        "WHERE a.id = v.id"
+    )
+    db = next(get_db())
+    try:
+        result = db.execute(statement, params)
+        copy_cluster_reviews(db, by_id.keys())
+        db.commit()
+        return result.rowcount
+    finally:
+        db.close()
+
+
+class ReviewWriteBuffer:
+    """Buffers queue review results and stores them with one UPDATE per flush.
+    
+    A flush happens once ``batch_size`` results are buffered or
+    ``interval_ms`` after the first buffered result. The queue entries are
+    acked only after their batch is committed. If the write fails, each entry
+    is recorded as a failed attempt (see ``ReviewQueue.fail``).
+    """
+    
+    def __init__(self, batch_size: int = REVIEW_WRITE_BATCH, interval_ms: int = REVIEW_WRITE_INTERVAL_MS):
+        self.batch_size = max(1, batch_size)
+        self.interval_ms = interval_ms
+        self._buffer: List[tuple] = []  # (row, entry_id, payload)
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+        self._flushes: set = set()
+        # Process-local counters (exported by /metrics/prometheus)
+        self.stats = {"flushes": 0, "rows": 0, "failed_flushes": 0, "flush_seconds": 0.0}
+    
+    def __len__(self) -> int:
+        return len(self._buffer)
     
-    logger.info("Queue worker started")
-    r = redis.from_url(REDIS_URL)
+    def add(self, row: Dict[str, Any], entry_id: str, payload: str) -> None:
+        self._buffer.append((row, entry_id, payload))
+        if len(self._buffer) >= self.batch_size:
+            task = asyncio.create_task(self.flush())
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+        elif self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._flush_after_interval())
     
-    # Create event loop for async operations
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    async def _flush_after_interval(self) -> None:
+        await asyncio.sleep(self.interval_ms / 1000.0)
+        await self.flush()
     
-    while queue_worker_running:
+    async def flush(self) -> None:
+        async with self._lock:
+            batch, self._buffer = self._buffer, []
+            if not batch:
+                return
+            started = time.perf_counter()
+            try:
+                await asyncio.to_thread(write_reviews, [row for row, _, _ in batch])
+            except Exception as e:
+                logger.error(f"Review write-back of {len(batch)} results failed: {e}")
+                self.stats["failed_flushes"] += 1
+                for _, entry_id, payload in batch:
+                    await review_queue.fail(entry_id, payload, f"Review write-back failed: {e}")
+                return
+            await review_queue.ack([entry_id for _, entry_id, _ in batch])
+            self.stats["flushes"] += 1
+            self.stats["rows"] += len(batch)
+            self.stats["flush_seconds"] += time.perf_counter() - started
+    
+    async def close(self) -> None:
+        """Write out everything buffered (used when the worker pool stops)."""
+        if self._timer is not None:
+            self._timer.cancel()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+        await self.flush()
+
+
+review_writer = ReviewWriteBuffer()
+
+
+class ReviewWorkerPool:
+    """Concurrent queue workers: ``concurrency`` review loops sharing one event loop and one HTTP client.
+    
+    Each loop takes a micro-batch of up to ``batch_size`` items from
+    ``review_queue``, waiting at most ``linger_ms`` for a partial batch to
+    fill, and reviews it with one light-reviewer call
+    (``ArticleReviewer.review_articles``). At most ``concurrency`` batches
+    are in flight. Results go to ``review_writer``, which stores and acks
+    them in batches. A maintenance task moves due
+    retries back to the stream and reclaims items of stalled consumers.
+    ``stop`` lets in-flight reviews finish (up to the drain timeout); reviews
+    still running after that are cancelled and their items requeued.
+    """
+    
+    def __init__(self, concurrency: int = REVIEW_CONCURRENCY, drain_seconds: float = REVIEW_DRAIN_SECONDS,
+                 batch_size: int = REVIEW_BATCH_SIZE, linger_ms: int = REVIEW_BATCH_LINGER_MS):
+        self.concurrency = max(1, concurrency)
+        self.drain_seconds = drain_seconds
+        self.batch_size = max(1, batch_size)
+        self.linger_ms = linger_ms
+        self._tasks: List[asyncio.Task] = []
+        self._maintenance: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+        self.in_flight = 0
+        # Process-local counters (exported by /metrics/prometheus)
+        self.stats = {"processed": 0, "failed": 0, "requeued": 0, "skipped": 0, "batches": 0}
+        self._completed_at: deque = deque(maxlen=10000)
+    
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+    
+    async def start(self) -> None:
+        if self.running:
+            logger.warning("Queue worker pool is already running")
+            return
+        await review_queue.ensure_group()
+        self._stopping = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._run(worker)) for worker in range(self.concurrency)]
+        self._maintenance = asyncio.create_task(self._maintain())
+        logger.info(
+            f"Queue worker pool started with {self.concurrency} workers (batches of up to {self.batch_size}) "
+            f"as consumer {review_queue.consumer}"
+        )
+    
+    async def stop(self) -> None:
+        if not self.running:
+            logger.warning("Queue worker pool is not running")
+            return
+        self._stopping.set()
+        logger.info(f"Draining queue worker pool ({self.in_flight} reviews in flight)")
+        _, pending = await asyncio.wait(self._tasks, timeout=self.drain_seconds)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        await review_writer.close()
+        if self._maintenance is not None:
+            await self._maintenance
+        self._tasks = []
+        logger.info("Queue worker pool stopped")
+    
+    def throughput_per_minute(self, window_seconds: int = 300) -> float:
+        """Reviews completed per minute over the last ``window_seconds``."""
+        cutoff = time.monotonic() - window_seconds
+        recent = sum(1 for completed in self._completed_at if completed >= cutoff)
+        return recent * 60.0 / window_seconds
+    
+    async def _wait_or_stop(self, seconds: float) -> None:
         try:
-            # Check if podcast production is active - if so, pause reviews
-            production_lock_key = "podcast:production:active"
-            if r.exists(production_lock_key):
-                production_info = r.get(production_lock_key)
-                logger.info(f"⏸️ Reviewer paused - Podcast production active: {production_info}")
-                time.sleep(10)  # Wait 10 seconds before checking again
-                continue
-            
-            # Get one item from the queue (blocking with timeout)
-            raw_item = r.brpop(article_reviewer.queue_key, timeout=5)
-            
-            if raw_item is None:
-                # No items in queue, continue
-                continue
-                
-            # Parse the queue item
-            item_data = json.loads(raw_item[1])
-            request = FeedReviewRequest(**{k: v for k, v in item_data.items() if k != "enqueued_at"})
-            
-            logger.info(f"Processing queue item for feed {request.feed_id}")
-            
-            # Process the review
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+    
+    async def _maintain(self) -> None:
+        last_reclaim = 0.0
+        while not self._stopping.is_set():
             try:
-                # Get database session
-                db = next(get_db())
-                
-                # Find the article by feed_id
-                article = db.query(Article).filter(Article.feed_id == request.feed_id).first()
-                if not article:
-                    logger.error(f"Article not found for feed_id: {request.feed_id}")
+                await review_queue.promote_due_retries()
+                if time.monotonic() - last_reclaim >= REVIEW_RECLAIM_INTERVAL_SECONDS:
+                    last_reclaim = time.monotonic()
+                    reclaimed = await review_queue.reclaim_stale()
+                    if reclaimed:
+                        logger.warning(f"Reclaimed {reclaimed} queue items from stalled consumers")
+            except Exception as e:
+                logger.error(f"Queue maintenance error: {e}")
+            await self._wait_or_stop(REVIEW_MAINTENANCE_SECONDS)
+    
+    async def _run(self, worker: int) -> None:
+        logger.info(f"Queue worker {worker} started")
+        while not self._stopping.is_set():
+            try:
+                # Pause while podcast production is active
+                if await review_queue.redis.exists(PRODUCTION_LOCK_KEY):
+                    production_info = await review_queue.redis.get(PRODUCTION_LOCK_KEY)
+                    logger.info(f"⏸️ Reviewer paused - Podcast production active: {production_info}")
+                    await self._wait_or_stop(10)
                     continue
                 
-                # Create a new reviewer client for this event loop
-                from services.reviewer.main import ReviewerClient
-                worker_reviewer_client = ReviewerClient()
-                
-                # Process the review asynchronously
-                result = loop.run_until_complete(article_reviewer.review_article(article, worker_reviewer_client, db))
-                
-                # Update article with review results
-                review = result["review"]
-                article.review_tags = review.tags
-                article.review_summary = review.summary
-                article.confidence = review.confidence
-                article.reviewer_type = result["reviewer_type"]
-                article.processed_at = datetime.utcnow()
-                
-                # Commit the review to database
-                db.commit()
-                db.close()
-                
-                logger.info(f"Successfully processed queue item for feed {request.feed_id}")
+                # Short block so a stop request is noticed quickly
+                items = await review_queue.read(count=self.batch_size, block_ms=1000)
+                if not items:
+                    continue
+                items = await self._fill_batch(items)
                 
-            except Exception as e:
-                logger.error(f"Error processing queue item for feed {request.feed_id}: {e}")
-                # Re-queue the item for retry (with backoff)
+                self.in_flight += len(items)
                 try:
-                    r.lpush(article_reviewer.queue_key, raw_item[1])
-                    logger.info(f"Re-queued failed item for feed {request.feed_id}")
-                except Exception as requeue_error:
-                    logger.error(f"Failed to re-queue item: {requeue_error}")
+                    await self._process_batch(items)
+                finally:
+                    self.in_flight -= len(items)
                     
-        except Exception as e:
-            logger.error(f"Queue worker error: {e}")
-            time.sleep(5)  # Wait before retrying
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Queue worker {worker} error: {e}")
+                await self._wait_or_stop(5)
+        logger.info(f"Queue worker {worker} stopped")
     
-    loop.close()
-    logger.info("Queue worker stopped")
-
-def start_queue_worker():
-    """Start the background queue worker."""
-    global queue_worker_running, queue_worker_thread
+    async def _fill_batch(self, items: List[tuple]) -> List[tuple]:
+        """Keep reading for up to ``linger_ms`` while the batch has room."""
+        deadline = time.monotonic() + self.linger_ms / 1000.0
+        while len(items) < self.batch_size:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms < 1:
+                break
+            items += await review_queue.read(count=self.batch_size - len(items), block_ms=remaining_ms)
+        return items
     
-    if queue_worker_running:
-        logger.warning("Queue worker is already running")
-        return
-        
-    queue_worker_running = True
-    queue_worker_thread = threading.Thread(target=queue_worker, daemon=True)
-    queue_worker_thread.start()
-    logger.info("Queue worker thread started")
-
-def stop_queue_worker():
-    """Stop the background queue worker."""
-    global queue_worker_running, queue_worker_thread
+    async def _fail(self, entry_id: str, payload: str, error: str) -> None:
+        self.stats["failed"] += 1
+        try:
+            if await review_queue.fail(entry_id, payload, error) == "retry":
+                self.stats["requeued"] += 1
+        except Exception as requeue_error:
+            # Still pending; reclaimed once REVIEW_CLAIM_IDLE_SECONDS pass
+            logger.error(f"Failed to schedule retry for {entry_id}: {requeue_error}")
     
-    if not queue_worker_running:
-        logger.warning("Queue worker is not running")
-        return
+    async def _process_batch(self, items: List[tuple]) -> None:
+        entries = []  # (entry_id, payload, request)
+        for entry_id, payload in items:
+            try:
+                entries.append((entry_id, payload, queue_request(json.loads(payload))))
+            except ValueError as e:
+                # Malformed item: retrying cannot help
+                self.stats["failed"] += 1
+                await review_queue.dead_letter(entry_id, payload, f"Invalid queue item: {e}", attempts=1)
+        if not entries:
+            return
+        logger.info(f"Processing {len(entries)} queue items ({entries[0][0]} .. {entries[-1][0]})")
         
-    queue_worker_running = False
-    if queue_worker_thread:
-        queue_worker_thread.join(timeout=10)
-    logger.info("Queue worker stopped")
+        handled = set()
+        try:
+            articles = await asyncio.to_thread(load_queue_articles, [request for _, _, request in entries])
+            to_review = []
+            for (entry_id, payload, request), article in zip(entries, articles):
+                if not article:
+                    handled.add(entry_id)
+                    await self._fail(entry_id, payload, f"Article not found: {request.article_id or request.url}")
+                elif article.reviewer_type:
+                    # Already reviewed (e.g. dispatched twice); nothing to do
+                    handled.add(entry_id)
+                    await review_queue.ack([entry_id])
+                    self.stats["skipped"] += 1
+                else:
+                    to_review.append((entry_id, payload, article))
+            if not to_review:
+                return
+            
+            results = await article_reviewer.review_articles([article for _, _, article in to_review])
+            self.stats["batches"] += 1
+            
+            # Stored and acked with the next write-back batch
+            for (entry_id, payload, article), result in zip(to_review, results):
+                review = result["review"]
+                review_writer.add({
+                    "article_id": article.id,
+                    "review_tags": review.tags,
+                    "review_summary": review.summary,
+                    "confidence": review.confidence,
+                    "reviewer_type": result["reviewer_type"],
+                    "processed_at": datetime.utcnow(),
+                }, entry_id, payload)
+                handled.add(entry_id)
+                self.stats["processed"] += 1
+                self._completed_at.append(time.monotonic())
+            logger.info(f"Reviewed {len(to_review)} queue items")
+            
+        except asyncio.CancelledError:
+            # Drain timed out: hand the items back without counting an attempt
+            for entry_id, payload, _ in entries:
+                if entry_id not in handled:
+                    await review_queue.requeue(entry_id, payload)
+                    self.stats["requeued"] += 1
+            raise
+        except Exception as e:
+            logger.error(f"Error processing {len(entries)} queue items: {e}")
+            for entry_id, payload, _ in entries:
+                if entry_id not in handled:
+                    await self._fail(entry_id, payload, str(e))
+
+
+queue_worker_pool = ReviewWorkerPool()
+
+
+async def start_queue_worker():
+    """Start the background queue worker pool."""
+    await queue_worker_pool.start()
+
+
+async def stop_queue_worker():
+    """Stop the background queue worker pool, letting in-flight reviews finish."""
+    await queue_worker_pool.stop()
 
 # Create tables on startup
 @app.on_event("startup")
 async def startup_event():
     create_tables()
-    start_queue_worker()
+    await start_queue_worker()
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    stop_queue_worker()
+    await stop_queue_worker()
+    await review_queue.redis.aclose()
+    await article_reviewer.aredis.aclose()
     logger.info("Reviewer Service started")
 
 
@@ -469,7 +1201,7 @@ async def health_check():
         heavy_lat = _avg_latency_ms(r, article_reviewer.lat_list_heavy, window_seconds=300)
     except Exception:
         light_lat = heavy_lat = 0.0
-    cfg = article_reviewer._load_config()
+    cfg = await article_reviewer._load_config()
     return {
         "status": "ok",
         "service": "reviewer",
@@ -507,6 +1239,8 @@ async def review_article(
         article.confidence = review.confidence
         article.reviewer_type = reviewer_type
         article.processed_at = datetime.utcnow()
+        db.flush()
+        copy_cluster_reviews(db, [article.id])
         
         # Commit the review to database
         db.commit()
@@ -529,7 +1263,16 @@ async def review_article(
 @app.post("/review")
 async def review_feed(request: FeedReviewRequest):
     """Review a feed item (stateless) and return tags/summary/confidence."""
-    cfg = article_reviewer._load_config()
+    cfg = await article_reviewer._load_config()
+    cache = article_reviewer.cache
+    
+    # Same content under the same config was reviewed before
+    cache_key = None
+    if cache is not None:
+        cache_key = cache.key(request.title, request.content or "", cfg)
+        cached = await cache.get(cache_key)
+        if cached:
+            return {**cached, "cached": True}
     
     # Start with light reviewer
     try:
@@ -540,24 +1283,31 @@ async def review_feed(request: FeedReviewRequest):
         if cfg.heavy_enabled and confidence < cfg.heavy_conf_threshold:
             try:
                 heavy_result = await article_reviewer.reviewer_client.generate_heavy_review(request)
-                return {
+                result = {
                     "tags": heavy_result.get("tags", ["news", "general"]),
                     "summary": heavy_result.get("summary", "Review completed"),
                     "confidence": heavy_result.get("confidence", 0.0),
                     "model": cfg.heavy_model,
                     "reviewer_type": "heavy",
                 }
+                if cache_key:
+                    await cache.put(cache_key, result)
+                return result
             except Exception as e:
                 logger.warning(f"Heavy reviewer failed, falling back to light result: {e}")
-                # Fall through to return light result
+                # Fall through to return light result (not cached: heavy should be retried)
+                cache_key = None
         
-        return {
+        result = {
             "tags": light_result.get("tags", ["news", "general"]),
             "summary": light_result.get("summary", "Review completed"),
             "confidence": confidence,
             "model": cfg.light_model,
             "reviewer_type": "light",
         }
+        if cache_key:
+            await cache.put(cache_key, result)
+        return result
         
     except Exception as e:
         logger.error(f"Review failed: {e}")
@@ -572,7 +1322,7 @@ async def review_feed(request: FeedReviewRequest):
 
 @app.get("/config", response_model=ReviewerConfig)
 async def get_config():
-    return article_reviewer._load_config()
+    return await article_reviewer._load_config(refresh=True)
 
 
 @app.put("/config", response_model=ReviewerConfig)
@@ -589,7 +1339,7 @@ async def put_config(cfg: ReviewerConfig):
         })
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to save config: {e}")
-    return article_reviewer._load_config()
+    return await article_reviewer._load_config(refresh=True)
 
 
 def _window_metrics(r: redis.Redis, window_seconds: int, hist: Dict[str, str]) -> MetricsWindow:
@@ -655,7 +1405,7 @@ async def get_metrics():
     last_1h = _window_metrics(r, 3600, hist)
     qlen = 0
     try:
-        qlen = r.llen(article_reviewer.queue_key)
+        qlen = (await review_queue.counts())["length"]
     except Exception:
         pass
     return MetricsResponse(last_5m=last_5m, last_1h=last_1h, queue_length=qlen)
@@ -691,20 +1441,16 @@ async def get_prometheus_metrics():
         except Exception:
             continue
     
-    # Queue length
-    queue_length = 0
+    # Queue length, in-progress, retrying and dead-lettered items
+    queue_counts = {"length": 0, "pending": 0, "retrying": 0, "dead": 0}
     try:
-        queue_length = r.llen(article_reviewer.queue_key)
+        queue_counts = await review_queue.counts()
     except Exception:
         pass
+    queue_length = queue_counts["length"]
     
-    # Worker count from configuration
-    workers_active = 1
-    try:
-        cfg = article_reviewer.get_config()
-        workers_active = cfg.light_workers
-    except Exception:
-        workers_active = int(os.getenv("WORKERS_ACTIVE", "1"))
+    # Queue worker pool
+    workers_active = sum(1 for task in queue_worker_pool._tasks if not task.done())
     
     # Confidence histogram
     hist = r.hgetall(article_reviewer.conf_hist) or {}
@@ -714,6 +1460,30 @@ async def get_prometheus_metrics():
     
     # Worker metrics
     metrics.append(f"reviewer_workers_active {workers_active}")
+    metrics.append(f"reviewer_worker_concurrency {queue_worker_pool.concurrency}")
+    metrics.append(f"reviewer_reviews_in_flight {queue_worker_pool.in_flight}")
+    metrics.append(f"reviewer_review_batch_size {queue_worker_pool.batch_size}")
+    metrics.append(f"reviewer_review_batches_total {queue_worker_pool.stats['batches']}")
+    metrics.append(f"reviewer_queue_throughput_per_minute {queue_worker_pool.throughput_per_minute():.2f}")
+    metrics.append(f'reviewer_queue_items_total{{result="processed"}} {queue_worker_pool.stats["processed"]}')
+    metrics.append(f'reviewer_queue_items_total{{result="failed"}} {queue_worker_pool.stats["failed"]}')
+    metrics.append(f'reviewer_queue_items_total{{result="requeued"}} {queue_worker_pool.stats["requeued"]}')
+    metrics.append(f'reviewer_queue_items_total{{result="skipped"}} {queue_worker_pool.stats["skipped"]}')
+    
+    # Review cache (hits and misses across replicas)
+    if article_reviewer.cache is not None:
+        cache_counts = await article_reviewer.cache.counts()
+        cache_lookups = cache_counts["hits"] + cache_counts["misses"]
+        metrics.append(f'reviewer_review_cache_requests_total{{result="hit"}} {cache_counts["hits"]}')
+        metrics.append(f'reviewer_review_cache_requests_total{{result="miss"}} {cache_counts["misses"]}')
+        metrics.append(f"reviewer_review_cache_hit_ratio {cache_counts['hits'] / cache_lookups if cache_lookups else 0.0:.4f}")
+    
+    # Batched review write-back
+    metrics.append(f"reviewer_write_buffer_size {len(review_writer)}")
+    metrics.append(f"reviewer_write_flushes_total {review_writer.stats['flushes']}")
+    metrics.append(f"reviewer_write_failed_flushes_total {review_writer.stats['failed_flushes']}")
+    metrics.append(f"reviewer_write_rows_total {review_writer.stats['rows']}")
+    metrics.append(f"reviewer_write_flush_seconds_total {review_writer.stats['flush_seconds']:.4f}")
     
     # Latency metrics
     if light_latencies:
@@ -730,6 +1500,13 @@ async def get_prometheus_metrics():
     
     # Queue length
     metrics.append(f"reviewer_queue_length {queue_length}")
+    metrics.append(f"reviewer_queue_pending {queue_counts['pending']}")
+    metrics.append(f"reviewer_queue_retrying {queue_counts['retrying']}")
+    metrics.append(f"reviewer_queue_dead_letter_length {queue_counts['dead']}")
+    metrics.append(f'reviewer_queue_events_total{{event="acked"}} {review_queue.stats["acked"]}')
+    metrics.append(f'reviewer_queue_events_total{{event="retried"}} {review_queue.stats["retried"]}')
+    metrics.append(f'reviewer_queue_events_total{{event="dead_lettered"}} {review_queue.stats["dead_lettered"]}')
+    metrics.append(f'reviewer_queue_events_total{{event="reclaimed"}} {review_queue.stats["reclaimed"]}')
     
     # Total reviews
     metrics.append(f"reviewer_light_total {len(light_latencies)}")
@@ -743,12 +1520,46 @@ async def get_prometheus_metrics():
     prometheus_output = "\n".join([
         "# HELP reviewer_workers_active Number of active reviewer workers",
         "# TYPE reviewer_workers_active gauge",
+        "# HELP reviewer_worker_concurrency Configured concurrent reviews per process",
+        "# TYPE reviewer_worker_concurrency gauge",
+        "# HELP reviewer_reviews_in_flight Queue reviews currently running",
+        "# TYPE reviewer_reviews_in_flight gauge",
+        "# HELP reviewer_review_batch_size Configured queue items per light-reviewer call",
+        "# TYPE reviewer_review_batch_size gauge",
+        "# HELP reviewer_review_batches_total Queue micro-batches reviewed",
+        "# TYPE reviewer_review_batches_total counter",
+        "# HELP reviewer_queue_throughput_per_minute Queue reviews completed per minute (last 5 minutes)",
+        "# TYPE reviewer_queue_throughput_per_minute gauge",
+        "# HELP reviewer_queue_items_total Queue items by outcome",
+        "# TYPE reviewer_queue_items_total counter",
+        "# HELP reviewer_review_cache_requests_total Review cache lookups by result",
+        "# TYPE reviewer_review_cache_requests_total counter",
+        "# HELP reviewer_review_cache_hit_ratio Share of review cache lookups that skipped the reviewers",
+        "# TYPE reviewer_review_cache_hit_ratio gauge",
+        "# HELP reviewer_write_buffer_size Review results waiting for the next batched write",
+        "# TYPE reviewer_write_buffer_size gauge",
+        "# HELP reviewer_write_flushes_total Batched review write-backs committed",
+        "# TYPE reviewer_write_flushes_total counter",
+        "# HELP reviewer_write_failed_flushes_total Batched review write-backs that failed",
+        "# TYPE reviewer_write_failed_flushes_total counter",
+        "# HELP reviewer_write_rows_total Review results stored by batched write-backs",
+        "# TYPE reviewer_write_rows_total counter",
+        "# HELP reviewer_write_flush_seconds_total Time spent in batched write-backs",
+        "# TYPE reviewer_write_flush_seconds_total counter",
         "# HELP reviewer_light_latency_seconds Average latency for light reviewer",
         "# TYPE reviewer_light_latency_seconds gauge",
         "# HELP reviewer_heavy_latency_seconds Average latency for heavy reviewer", 
         "# TYPE reviewer_heavy_latency_seconds gauge",
         "# HELP reviewer_queue_length Current queue length",
         "# TYPE reviewer_queue_length gauge",
+        "# HELP reviewer_queue_pending Queue items delivered to a consumer and not yet acked",
+        "# TYPE reviewer_queue_pending gauge",
+        "# HELP reviewer_queue_retrying Failed queue items waiting out their retry backoff",
+        "# TYPE reviewer_queue_retrying gauge",
+        "# HELP reviewer_queue_dead_letter_length Items in the dead-letter stream",
+        "# TYPE reviewer_queue_dead_letter_length gauge",
+        "# HELP reviewer_queue_events_total Queue acks, retries, dead-letters and reclaims by this process",
+        "# TYPE reviewer_queue_events_total counter",
         "# HELP reviewer_light_total Total light reviews processed",
         "# TYPE reviewer_light_total counter",
         "# HELP reviewer_heavy_total Total heavy reviews processed",
@@ -756,7 +1567,8 @@ async def get_prometheus_metrics():
         "# HELP reviewer_confidence_bucket_total Review count by confidence bucket",
         "# TYPE reviewer_confidence_bucket_total counter",
         "",
-        *metrics
+        *metrics,
+        *get_pool_prometheus_lines("reviewer")
     ])
     
     from fastapi.responses import PlainTextResponse
@@ -809,16 +1621,12 @@ async def get_unreviewed_articles(
 async def enqueue_review(request: FeedReviewRequest):
     """Enqueue a feed review request for background processing."""
     try:
-        # Add the request to the Redis queue
-        r = article_reviewer.redis
+        # Add the request to the review stream
         request_data = request.dict()
         request_data["enqueued_at"] = datetime.utcnow().isoformat()
-        
-        # Push to the queue
-        r.lpush(article_reviewer.queue_key, json.dumps(request_data))
-        
-        # Get current queue length
-        queue_length = r.llen(article_reviewer.queue_key)
+        added, queue_length = await review_queue.add_undispatched([request_data])
+        if not added:
+            return {"status": "already_queued", "feed_id": request.feed_id, "queue_position": queue_length}
         
         logger.info(f"Enqueued review request for feed {request.feed_id}, queue length: {queue_length}")
         
@@ -835,31 +1643,76 @@ async def enqueue_review(request: FeedReviewRequest):
         raise HTTPException(status_code=500, detail=f"Failed to enqueue review: {str(e)}")
 
 
+@app.post("/enqueue-batch")
+async def enqueue_review_batch(requests: List[FeedReviewRequest]):
+    """Enqueue several feed review requests with one Redis round trip.
+    
+    Requests keep their order: the queue worker takes them in the order given.
+    The batch is added in one transaction, so an error response means none
+    of it was queued and the caller can safely send it again. Articles
+    enqueued within REVIEW_DISPATCH_TTL_SECONDS are skipped (see
+    ``ReviewQueue.add_undispatched``).
+    """
+    if len(requests) > ENQUEUE_BATCH_MAX:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch of {len(requests)} exceeds the limit of {ENQUEUE_BATCH_MAX} requests"
+        )
+    try:
+        enqueued_at = datetime.utcnow().isoformat()
+        # One XADD per new request, in order, in a single MULTI/EXEC
+        added, queue_length = await review_queue.add_undispatched(
+            [{**request.dict(), "enqueued_at": enqueued_at} for request in requests]
+        )
+        
+        logger.info(
+            f"Enqueued {added} review requests ({len(requests) - added} already queued), "
+            f"queue length: {queue_length}"
+        )
+        
+        return {
+            "status": "enqueued",
+            "enqueued": added,
+            "skipped": len(requests) - added,
+            "queue_length": queue_length,
+            "estimated_wait_minutes": queue_length * 0.5,  # Assume 30 seconds per review
+            "enqueued_at": enqueued_at
+        }
+        
+    except Exception as e:
+        logger.error(f"Error enqueuing review batch: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to enqueue reviews: {str(e)}")
+
+
 @app.get("/queue/status")
 async def get_queue_status():
     """Get current queue status."""
     try:
-        r = article_reviewer.redis
-        queue_length = r.llen(article_reviewer.queue_key)
+        counts = await review_queue.counts()
+        queue_length = counts["length"]
         
         # Get some queue items for preview (without removing them)
         preview_items = []
         if queue_length > 0:
-            # Get last 5 items from the queue (most recent)
-            raw_items = r.lrange(article_reviewer.queue_key, 0, 4)
-            for item in raw_items:
+            # Last 5 items of the stream (most recent)
+            for entry_id, fields in await review_queue.redis.xrevrange(review_queue.key, count=5):
                 try:
-                    item_data = json.loads(item)
+                    item_data = json.loads(fields.get("payload", ""))
                     preview_items.append({
+                        "id": entry_id,
                         "feed_id": item_data.get("feed_id"),
                         "title": item_data.get("title", "")[:50] + "..." if len(item_data.get("title", "")) > 50 else item_data.get("title", ""),
-                        "enqueued_at": item_data.get("enqueued_at")
+                        "enqueued_at": item_data.get("enqueued_at"),
+                        "attempts": item_data.get("attempts", 0)
                     })
                 except Exception:
                     continue
         
         return {
             "queue_length": queue_length,
+            "in_progress": counts["pending"],
+            "retrying": counts["retrying"],
+            "dead_letter": counts["dead"],
             "estimated_processing_time_minutes": queue_length * 0.5,
             "preview_items": preview_items,
             "status": "active" if queue_length > 0 else "empty"
@@ -870,31 +1723,60 @@ async def get_queue_status():
         raise HTTPException(status_code=500, detail=f"Failed to get queue status: {str(e)}")
 
 
-@app.post("/queue/process")
-async def process_queue_item():
-    """Process one item from the queue (for manual testing)."""
+@app.get("/queue/dead-letter")
+async def get_dead_letter_items(limit: int = 20):
+    """Most recent items that exhausted their retries, with the last error."""
+    entries = await review_queue.redis.xrevrange(review_queue.dead_key, count=limit)
+    return {
+        "dead_letter_length": await review_queue.redis.xlen(review_queue.dead_key),
+        "items": [{"id": entry_id, **fields} for entry_id, fields in entries]
+    }
+
+
+async def _process_queue_entry(entry_id: str, payload: str) -> Dict[str, Any]:
+    """Review one stream entry statelessly, then ack it or record the failure."""
+    try:
+        item_data = json.loads(payload)
+        request = queue_request(item_data)
+    except ValueError as e:
+        await review_queue.dead_letter(entry_id, payload, f"Invalid queue item: {e}", attempts=1)
+        return {"id": entry_id, "status": "dead_lettered", "error": str(e)}
+    
     try:
-        r = article_reviewer.redis
-        
-        # Get one item from the queue
-        raw_item = r.rpop(article_reviewer.queue_key)
-        if not raw_item:
-            return {"status": "empty", "message": "No items in queue"}
-        
-        # Parse the queue item
-        item_data = json.loads(raw_item)
-        request = FeedReviewRequest(**{k: v for k, v in item_data.items() if k != "enqueued_at"})
-        
         # Process the review
         result = await review_feed(request)
-        
+        await review_queue.ack([entry_id])
         return {
-            "status": "processed",
+            "id": entry_id,
             "feed_id": request.feed_id,
+            "status": "processed",
             "result": result,
             "processing_time": datetime.utcnow().isoformat(),
             "enqueued_at": item_data.get("enqueued_at")
         }
+    except Exception as e:
+        logger.error(f"Error processing queue item for feed {request.feed_id}: {e}")
+        outcome = await review_queue.fail(entry_id, payload, str(e))
+        return {
+            "id": entry_id,
+            "feed_id": request.feed_id,
+            "status": "failed",
+            "retry": outcome == "retry",
+            "error": str(e),
+            "processing_time": datetime.utcnow().isoformat(),
+            "enqueued_at": item_data.get("enqueued_at")
+        }
+
+
+@app.post("/queue/process")
+async def process_queue_item():
+    """Process one item from the queue (for manual testing)."""
+    try:
+        await review_queue.ensure_group()
+        items = await review_queue.read(count=1)
+        if not items:
+            return {"status": "empty", "message": "No items in queue"}
+        return await _process_queue_entry(*items[0])
         
     except Exception as e:
         logger.error(f"Error processing queue item: {e}")
@@ -904,43 +1786,11 @@ async def process_queue_item():
 async def process_queue_batch(batch_size: int = 10):
     """Process multiple items from the queue in a batch."""
     try:
-        r = article_reviewer.redis
-        processed_items = []
-        
-        for _ in range(batch_size):
-            # Get one item from the queue
-            raw_item = r.rpop(article_reviewer.queue_key)
-            
-            if raw_item is None:
-                break  # No more items in queue
-                
-            # Parse the queue item
-            item_data = json.loads(raw_item)
-            request = FeedReviewRequest(**{k: v for k, v in item_data.items() if k != "enqueued_at"})
-            
-            try:
-                # Process the review
-                result = await review_feed(request)
-                
-                processed_items.append({
-                    "feed_id": request.feed_id,
-                    "status": "processed",
-                    "result": result,
-                    "processing_time": datetime.utcnow().isoformat(),
-                    "enqueued_at": item_data.get("enqueued_at")
-                })
-                
-            except Exception as e:
-                logger.error(f"Error processing queue item for feed {request.feed_id}: {e}")
-                # Re-queue the failed item
-                r.lpush(article_reviewer.queue_key, raw_item)
-                processed_items.append({
-                    "feed_id": request.feed_id,
-                    "status": "failed",
-                    "error": str(e),
-                    "processing_time": datetime.utcnow().isoformat(),
-                    "enqueued_at": item_data.get("enqueued_at")
-                })
+        await review_queue.ensure_group()
+        processed_items = [
+            await _process_queue_entry(entry_id, payload)
+            for entry_id, payload in await review_queue.read(count=batch_size)
+        ]
         
         return {
             "status": "completed",
@@ -956,7 +1806,7 @@ async def process_queue_batch(batch_size: int = 10):
 async def start_worker():
     """Start the background queue worker."""
     try:
-        start_queue_worker()
+        await start_queue_worker()
         return {"status": "started", "message": "Queue worker started"}
     except Exception as e:
         logger.error(f"Error starting queue worker: {e}")
@@ -966,7 +1816,7 @@ async def start_worker():
 async def stop_worker():
     """Stop the background queue worker."""
     try:
-        stop_queue_worker()
+        await stop_queue_worker()
         return {"status": "stopped", "message": "Queue worker stopped"}
     except Exception as e:
         logger.error(f"Error stopping queue worker: {e}")
@@ -987,9 +1837,15 @@ async def get_worker_status():
             production_info = r.get(production_lock_key)
     
     return {
-        "status": "running" if queue_worker_running else "stopped",
-        "worker_running": queue_worker_running,
-        "thread_alive": queue_worker_thread.is_alive() if queue_worker_thread else False,
+        "status": "running" if queue_worker_pool.running else "stopped",
+        "worker_running": queue_worker_pool.running,
+        "workers_alive": sum(1 for task in queue_worker_pool._tasks if not task.done()),
+        "concurrency": queue_worker_pool.concurrency,
+        "in_flight": queue_worker_pool.in_flight,
+        "batch_size": queue_worker_pool.batch_size,
+        "batch_linger_ms": queue_worker_pool.linger_ms,
+        "write_buffer": len(review_writer),
+        "throughput_per_minute": round(queue_worker_pool.throughput_per_minute(), 2),
         "production_active": production_active,
         "production_info": production_info,
         "paused": production_active
@@ -1111,6 +1967,8 @@ async def review_article_background(article_id: UUID):
         article.confidence = review.confidence
         article.reviewer_type = reviewer_type
         article.processed_at = datetime.utcnow()
+        db.flush()
+        copy_cluster_reviews(db, [article.id])
         db.commit()
         
     except Exception as e:
@@ -3,11 +3,11 @@ Shared modules for the Podcast AI application.
 """
 
 try:
-    from .database import create_tables, get_db, get_db_session
+    from .database import create_tables, get_db, get_db_session, get_async_db
     from .models import Base
     from .schemas import *
 except ImportError:
-    from database import create_tables, get_db, get_db_session
+    from database import create_tables, get_db, get_db_session, get_async_db
     from models import Base
     from schemas import *
 
@@ -15,5 +15,6 @@ __all__ = [
     "create_tables",
     "get_db", 
     "get_db_session",
+    "get_async_db",
     "Base",
 ]
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""
+Review propagation for near-duplicate clusters.
+
+news-feed stores syndicated copies of a story with ``near_duplicate_of``
+pointing at the cluster representative and only sends the representative
+to the reviewer. ``copy_cluster_reviews`` gives the unreviewed members the
+representative's review. The reviewer calls it when it writes a review
+back, and news-feed calls it when it stores a copy whose representative
+was already reviewed.
+"""
+from typing import Iterable
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+
+def copy_cluster_reviews(db: Session, article_ids: Iterable) -> int:
+    """Copy representatives' reviews to their unreviewed cluster members; returns the rows updated.
+
+    ``article_ids`` may name representatives, members or both. The caller commits.
+    """
+    ids = [str(article_id) for article_id in article_ids]
+    if not ids or db.get_bind().dialect.name != "postgresql":
+        return 0
+    result = db.execute(text(
+        "UPDATE articles AS d SET review_tags = r.review_tags, review_summary = r.review_summary, "
+        "confidence = r.confidence, reviewer_type = r.reviewer_type, processed_at = now() "
+        "FROM articles AS r "
+        "WHERE d.near_duplicate_of = r.id AND d.reviewer_type IS NULL AND r.reviewer_type IS NOT NULL "
+        "AND (r.id = ANY(CAST(:ids AS uuid[])) OR d.id = ANY(CAST(:ids AS uuid[])))"
+    ), {"ids": ids})
+    return result.rowcount
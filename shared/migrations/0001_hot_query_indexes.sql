@@ -0,0 +1,42 @@
+-- Indexes for the hot query shapes:
+--   articles (feed_id, link)         ingest dedup in news-feed fetch_feed_articles
+--   articles collection_id           collections service and snapshots
+--   articles reviewer_type IS NULL   overseer send_articles_to_reviewer
+--   (articles created_at windows and listings use (created_at, id) from 0004)
+--   episodes (group_id, status, created_at DESC)  cadence checks
+
+-- Collapse existing (feed_id, link) duplicates onto the oldest row so the
+-- unique index can be built. Episode links are moved to the surviving row.
+CREATE TEMP TABLE _article_dupes ON COMMIT DROP AS
+SELECT id, keep_id
+FROM (
+    SELECT id,
+           first_value(id) OVER (PARTITION BY feed_id, link ORDER BY created_at, id) AS keep_id
+    FROM articles
+) ranked
+WHERE id <> keep_id;
+
+INSERT INTO episode_article_link (episode_id, article_id)
+SELECT l.episode_id, d.keep_id
+FROM episode_article_link l
+JOIN _article_dupes d ON d.id = l.article_id
+ON CONFLICT DO NOTHING;
+
+DELETE FROM episode_article_link l USING _article_dupes d WHERE l.article_id = d.id;
+DELETE FROM articles a USING _article_dupes d WHERE a.id = d.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_articles_feed_link
+    ON articles (feed_id, link);
+
+CREATE INDEX IF NOT EXISTS ix_articles_collection_id
+    ON articles (collection_id);
+
+CREATE INDEX IF NOT EXISTS ix_articles_unreviewed_created_at
+    ON articles (created_at)
+    WHERE reviewer_type IS NULL;
+
+CREATE INDEX IF NOT EXISTS ix_episodes_group_status_created_at
+    ON episodes (group_id, status, created_at DESC);
+
+ANALYZE articles;
+ANALYZE episodes;
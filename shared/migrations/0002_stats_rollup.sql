@@ -0,0 +1,108 @@
+-- Precomputed row counts for the /metrics and /stats endpoints.
+--
+-- stats_counters holds one running total per counter name. Statement-level
+-- triggers with transition tables keep it current for every writer (feed
+-- ingest, review write-back, episode status changes, admin edits), applying
+-- one aggregated delta per statement so bulk inserts cost a single upsert.
+-- Each backend writes to its own slot (pid mod 8) so concurrent transactions
+-- do not queue on one hot row; readers sum the slots.
+--
+-- Counter names:
+--   articles_total, articles_by_reviewer:<light|heavy|unreviewed>
+--   episodes_total, episodes_by_status:<DRAFT|VOICED|PUBLISHED>
+--   news_feeds_total, news_feeds_active
+--   podcast_groups_total, podcast_groups_by_status:<ACTIVE|PAUSED|ARCHIVED>
+--   presenters_total, writers_total, collections_total
+
+CREATE TABLE IF NOT EXISTS stats_counters (
+    name  VARCHAR(128) NOT NULL,
+    slot  SMALLINT NOT NULL DEFAULT 0,
+    value BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (name, slot)
+);
+
+-- Counter keys contributed by one row (aliased r) of the given table
+CREATE OR REPLACE FUNCTION stats_key_expr(table_name text) RETURNS text AS $$
+BEGIN
+    RETURN CASE table_name
+        WHEN 'articles' THEN
+            $k$ARRAY['articles_total', 'articles_by_reviewer:' || COALESCE(r.reviewer_type, 'unreviewed')]$k$
+        WHEN 'episodes' THEN
+            $k$ARRAY['episodes_total', 'episodes_by_status:' || COALESCE(r.status::text, 'NONE')]$k$
+        WHEN 'news_feeds' THEN
+            $k$ARRAY['news_feeds_total'] || CASE WHEN r.is_active THEN ARRAY['news_feeds_active'] ELSE ARRAY[]::text[] END$k$
+        WHEN 'podcast_groups' THEN
+            $k$ARRAY['podcast_groups_total', 'podcast_groups_by_status:' || COALESCE(r.status::text, 'NONE')]$k$
+        WHEN 'presenters' THEN $k$ARRAY['presenters_total']$k$
+        WHEN 'writers' THEN $k$ARRAY['writers_total']$k$
+        WHEN 'collections' THEN $k$ARRAY['collections_total']$k$
+    END;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION stats_rows_changed() RETURNS trigger AS $$
+DECLARE
+    key_expr text := stats_key_expr(TG_TABLE_NAME);
+    deltas_sql text;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        deltas_sql := 'SELECT k, 1 AS d FROM new_rows r, unnest(' || key_expr || ') k';
+    ELSIF TG_OP = 'DELETE' THEN
+        deltas_sql := 'SELECT k, -1 AS d FROM old_rows r, unnest(' || key_expr || ') k';
+    ELSE
+        deltas_sql := 'SELECT k, 1 AS d FROM new_rows r, unnest(' || key_expr || ') k '
+                   || 'UNION ALL SELECT k, -1 AS d FROM old_rows r, unnest(' || key_expr || ') k';
+    END IF;
+
+    EXECUTE 'INSERT INTO stats_counters AS c (name, slot, value) '
+         || 'SELECT k, $1, sum(d) FROM (' || deltas_sql || ') u '
+         || 'GROUP BY k HAVING sum(d) <> 0 ORDER BY k '
+         || 'ON CONFLICT (name, slot) DO UPDATE SET value = c.value + EXCLUDED.value'
+    USING mod(pg_backend_pid(), 8)::smallint;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- (Re)create the counting triggers. Called again after articles is
+-- converted to a partitioned table (shared/partitioning.py).
+CREATE OR REPLACE FUNCTION stats_install_triggers() RETURNS void AS $$
+DECLARE
+    t text;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['articles', 'episodes', 'news_feeds', 'podcast_groups',
+                             'presenters', 'writers', 'collections'] LOOP
+        EXECUTE 'DROP TRIGGER IF EXISTS stats_insert ON ' || t;
+        EXECUTE 'DROP TRIGGER IF EXISTS stats_update ON ' || t;
+        EXECUTE 'DROP TRIGGER IF EXISTS stats_delete ON ' || t;
+        EXECUTE 'CREATE TRIGGER stats_insert AFTER INSERT ON ' || t
+             || ' REFERENCING NEW TABLE AS new_rows'
+             || ' FOR EACH STATEMENT EXECUTE FUNCTION stats_rows_changed()';
+        EXECUTE 'CREATE TRIGGER stats_update AFTER UPDATE ON ' || t
+             || ' REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows'
+             || ' FOR EACH STATEMENT EXECUTE FUNCTION stats_rows_changed()';
+        EXECUTE 'CREATE TRIGGER stats_delete AFTER DELETE ON ' || t
+             || ' REFERENCING OLD TABLE AS old_rows'
+             || ' FOR EACH STATEMENT EXECUTE FUNCTION stats_rows_changed()';
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Recount everything from the base tables. Used to seed the counters and
+-- after changes the triggers cannot see (TRUNCATE, detached partitions).
+CREATE OR REPLACE FUNCTION stats_rebuild() RETURNS void AS $$
+DECLARE
+    t text;
+BEGIN
+    LOCK TABLE stats_counters IN EXCLUSIVE MODE;
+    DELETE FROM stats_counters;
+    FOREACH t IN ARRAY ARRAY['articles', 'episodes', 'news_feeds', 'podcast_groups',
+                             'presenters', 'writers', 'collections'] LOOP
+        EXECUTE 'INSERT INTO stats_counters (name, slot, value) '
+             || 'SELECT k, 0, count(*) FROM ' || t || ' r, unnest(' || stats_key_expr(t) || ') k '
+             || 'GROUP BY k';
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT stats_install_triggers();
+SELECT stats_rebuild();
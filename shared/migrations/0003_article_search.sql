@@ -0,0 +1,21 @@
+-- Full-text search for the article browser (api-gateway list_all_articles).
+--
+-- search_vector is a stored generated column weighting title (A), summary (B)
+-- and the first 20000 characters of content (C), with a GIN index so
+-- websearch_to_tsquery matches are index lookups instead of ILIKE scans.
+-- The expression is kept in sync with ARTICLE_SEARCH_DOCUMENT in shared/models.py.
+--
+-- Adding a stored generated column rewrites articles once.
+
+ALTER TABLE articles
+    ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(summary, '')), 'B') ||
+        setweight(to_tsvector('english'::regconfig, left(coalesce(content, ''), 20000)), 'C')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS ix_articles_search_vector
+    ON articles USING GIN (search_vector);
+
+ANALYZE articles;
@@ -0,0 +1,13 @@
+-- Keyset pagination on (created_at DESC, id DESC) for /api/news-feed/articles,
+-- /api/episodes and /api/writers/{id}/scripts. The composite indexes serve the
+-- cursor range scan and its ordering directly, and also cover the
+-- created_at range counts (no single-column created_at indexes are needed).
+
+CREATE INDEX IF NOT EXISTS ix_articles_created_at_id
+    ON articles (created_at, id);
+
+CREATE INDEX IF NOT EXISTS ix_episodes_created_at_id
+    ON episodes (created_at, id);
+
+CREATE INDEX IF NOT EXISTS ix_episodes_group_created_at_id
+    ON episodes (group_id, created_at, id);
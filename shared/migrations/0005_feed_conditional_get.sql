@@ -0,0 +1,8 @@
+-- HTTP validators for conditional feed fetches (news-feed fetch_feed_articles).
+-- etag / last_modified are the raw response headers replayed as
+-- If-None-Match / If-Modified-Since; body_hash is the SHA-256 of the last
+-- body that was parsed, so a 200 with identical content is skipped too.
+
+ALTER TABLE news_feeds ADD COLUMN IF NOT EXISTS etag VARCHAR(512);
+ALTER TABLE news_feeds ADD COLUMN IF NOT EXISTS last_modified VARCHAR(64);
+ALTER TABLE news_feeds ADD COLUMN IF NOT EXISTS body_hash VARCHAR(64);
@@ -0,0 +1,16 @@
+-- Adaptive per-feed polling (news-feed poll_scheduler.py).
+-- poll_interval_seconds is learnt from the feed's publish history and how
+-- often fetches come back unchanged (poll_unchanged_ratio, an EWMA of
+-- 304 / identical-body / no-new-article fetches); next_fetch_at is when the
+-- feed is due again.
+
+ALTER TABLE news_feeds ADD COLUMN IF NOT EXISTS poll_interval_seconds INTEGER;
+ALTER TABLE news_feeds ADD COLUMN IF NOT EXISTS poll_unchanged_ratio DOUBLE PRECISION;
+ALTER TABLE news_feeds ADD COLUMN IF NOT EXISTS next_fetch_at TIMESTAMP WITH TIME ZONE;
+
+CREATE INDEX IF NOT EXISTS ix_news_feeds_active_next_fetch_at
+    ON news_feeds (next_fetch_at) WHERE is_active;
+
+-- Publish history per feed (most recent publish dates)
+CREATE INDEX IF NOT EXISTS ix_articles_feed_publish_date
+    ON articles (feed_id, publish_date);
@@ -0,0 +1,8 @@
+-- Near-duplicate clusters (news-feed near_dup.py). An article whose title
+-- and lead text closely match a recent article from any feed points at that
+-- cluster representative and is not sent to the reviewer.
+
+ALTER TABLE articles ADD COLUMN IF NOT EXISTS near_duplicate_of UUID;
+
+CREATE INDEX IF NOT EXISTS ix_articles_near_duplicate_of
+    ON articles (near_duplicate_of) WHERE near_duplicate_of IS NOT NULL;
@@ -0,0 +1,58 @@
+"""
+Versioned SQL migrations.
+
+Each ``NNNN_description.sql`` file in this directory is applied once, in
+filename order, and recorded in the ``schema_migrations`` table. Migrations
+run inside a transaction guarded by an advisory lock so that services
+starting at the same time do not race each other.
+"""
+import logging
+from pathlib import Path
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent
+
+# Arbitrary constant shared by every service for pg_advisory_xact_lock
+MIGRATION_LOCK_KEY = 7_351_002
+
+
+def list_migrations() -> List[Path]:
+    """Return migration files in the order they are applied."""
+    return sorted(MIGRATIONS_DIR.glob("[0-9][0-9][0-9][0-9]_*.sql"))
+
+
+def run_migrations(engine: Engine) -> List[str]:
+    """Apply pending migrations and return the versions that were applied."""
+    if engine.dialect.name != "postgresql":
+        return []
+
+    applied_now: List[str] = []
+    with engine.begin() as conn:
+        # Under the lock: concurrent CREATE TABLE IF NOT EXISTS can still collide on pg_type
+        conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS schema_migrations ("
+            " version VARCHAR(128) PRIMARY KEY,"
+            " applied_at TIMESTAMPTZ NOT NULL DEFAULT now())"
+        ))
+
+    for path in list_migrations():
+        version = path.stem
+        with engine.begin() as conn:
+            conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+            already = conn.execute(
+                text("SELECT 1 FROM schema_migrations WHERE version = :v"), {"v": version}
+            ).first()
+            if already:
+                continue
+            logger.info(f"Applying migration {version}")
+            conn.exec_driver_sql(path.read_text())
+            conn.execute(text("INSERT INTO schema_migrations (version) VALUES (:v)"), {"v": version})
+            applied_now.append(version)
+
+    return applied_now
@@ -8,15 +8,29 @@ from uuid import UUID, uuid4
 
 from sqlalchemy import (
     Column, String, Text, Integer, DateTime, Enum as SQLEnum,
-    ForeignKey, Table, JSON, Boolean, Float
+    ForeignKey, Table, JSON, Boolean, Float, Index, Computed, text
 )
-from sqlalchemy.dialects.postgresql import UUID as PGUUID, ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PGUUID, ARRAY, TSVECTOR
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 
+try:
+    from .partitioning import ARTICLES_PARTITIONING_ENABLED
+except ImportError:
+    from partitioning import ARTICLES_PARTITIONING_ENABLED
+
 Base = declarative_base()
 
+# Text search configuration and weighted document for articles.search_vector
+# (kept in sync with shared/migrations/0003_article_search.sql)
+ARTICLE_SEARCH_CONFIG = "english"
+ARTICLE_SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(summary, '')), 'B') || "
+    "setweight(to_tsvector('english'::regconfig, left(coalesce(content, ''), 20000)), 'C')"
+)
+
 # Association tables
 podcast_group_presenter = Table(
     'podcast_group_presenter',
@@ -44,7 +58,10 @@ episode_article_link = Table(
     'episode_article_link',
     Base.metadata,
     Column('episode_id', PGUUID(as_uuid=True), ForeignKey('episodes.id'), primary_key=True),
-    Column('article_id', PGUUID(as_uuid=True), ForeignKey('articles.id'), primary_key=True)
+    # A partitioned articles table has no unique index on id alone, so the
+    # foreign key is dropped there (see shared/partitioning.py)
+    Column('article_id', PGUUID(as_uuid=True),
+           *(() if ARTICLES_PARTITIONING_ENABLED else (ForeignKey('articles.id'),)), primary_key=True)
 )
 
 
@@ -136,12 +153,23 @@ class Writer(Base):
 
 class NewsFeed(Base):
     __tablename__ = "news_feeds"
+    __table_args__ = (
+        Index("ix_news_feeds_active_next_fetch_at", "next_fetch_at", postgresql_where=text("is_active")),
+    )
 
     id = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
     source_url = Column(String(500), nullable=False)
     name = Column(String(255))
     type = Column(SQLEnum(FeedType, native_enum=False), nullable=False)
     last_fetched = Column(DateTime(timezone=True))
+    # Conditional GET validators (shared/migrations/0005_feed_conditional_get.sql)
+    etag = Column(String(512))
+    last_modified = Column(String(64))
+    body_hash = Column(String(64))  # SHA-256 hex of the last parsed body
+    # Adaptive polling (shared/migrations/0006_feed_poll_schedule.sql)
+    poll_interval_seconds = Column(Integer)
+    poll_unchanged_ratio = Column(Float)
+    next_fetch_at = Column(DateTime(timezone=True))
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -153,6 +181,20 @@ class NewsFeed(Base):
 
 class Article(Base):
     __tablename__ = "articles"
+    # Kept in sync with shared/migrations/0001, 0003, 0004, 0006 and 0007
+    __table_args__ = (
+        # A partitioned articles table cannot have this unique index (see
+        # shared/partitioning.py); news-feed then serializes inserts per feed
+        (Index("ix_articles_feed_id_link", "feed_id", "link") if ARTICLES_PARTITIONING_ENABLED
+         else Index("uq_articles_feed_link", "feed_id", "link", unique=True)),
+        Index("ix_articles_collection_id", "collection_id"),
+        Index("ix_articles_created_at_id", "created_at", "id"),
+        Index("ix_articles_unreviewed_created_at", "created_at", postgresql_where=text("reviewer_type IS NULL")),
+        Index("ix_articles_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_articles_feed_publish_date", "feed_id", "publish_date"),
+        Index("ix_articles_near_duplicate_of", "near_duplicate_of",
+              postgresql_where=text("near_duplicate_of IS NOT NULL")),
+    )
 
     id = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
     feed_id = Column(PGUUID(as_uuid=True), ForeignKey('news_feeds.id'), nullable=False)
@@ -165,6 +207,7 @@ class Article(Base):
 
     # Reviewer enhancement fields
     fingerprint = Column(String(128))  # SHA-256 hex of source_url|title|published
+    near_duplicate_of = Column(PGUUID(as_uuid=True))  # cluster representative (not reviewed itself)
     reviewer_type = Column(String(10))  # 'light' | 'heavy'
     review_tags = Column(ARRAY(String))  # tags assigned by reviewer
     review_summary = Column(Text)  # concise reviewer summary
@@ -173,14 +216,28 @@ class Article(Base):
     review_metadata = Column(JSON)  # auxiliary metadata (model, fallback, timings, etc.)
     collection_id = Column(PGUUID(as_uuid=True), ForeignKey('collections.id'))
 
+    # Full-text search document, generated by Postgres; deferred so listings don't load it
+    search_vector = deferred(Column(TSVECTOR, Computed(ARTICLE_SEARCH_DOCUMENT, persisted=True)))
+
     # Relationships
     news_feed = relationship("NewsFeed", back_populates="articles")
-    episodes = relationship("Episode", secondary=episode_article_link, back_populates="articles")
+    # Joins are spelled out because article_id may have no foreign key
+    episodes = relationship(
+        "Episode", secondary=episode_article_link, back_populates="articles",
+        primaryjoin="Article.id == foreign(episode_article_link.c.article_id)",
+        secondaryjoin="Episode.id == foreign(episode_article_link.c.episode_id)"
+    )
     collection = relationship("Collection", back_populates="articles")
 
 
 class Episode(Base):
     __tablename__ = "episodes"
+    # Kept in sync with shared/migrations/0001, 0002 and 0004
+    __table_args__ = (
+        Index("ix_episodes_group_status_created_at", "group_id", "status", text("created_at DESC")),
+        Index("ix_episodes_created_at_id", "created_at", "id"),
+        Index("ix_episodes_group_created_at_id", "group_id", "created_at", "id"),
+    )
 
     id = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
     group_id = Column(PGUUID(as_uuid=True), ForeignKey('podcast_groups.id'), nullable=False)
@@ -192,7 +249,11 @@ class Episode(Base):
     podcast_group = relationship("PodcastGroup", back_populates="episodes")
     episode_metadata = relationship("EpisodeMetadata", back_populates="episode", uselist=False)
     audio_file = relationship("AudioFile", back_populates="episode", uselist=False)
-    articles = relationship("Article", secondary=episode_article_link, back_populates="episodes")
+    articles = relationship(
+        "Article", secondary=episode_article_link, back_populates="episodes",
+        primaryjoin="Episode.id == foreign(episode_article_link.c.episode_id)",
+        secondaryjoin="Article.id == foreign(episode_article_link.c.article_id)"
+    )
 
 
 class EpisodeMetadata(Base):
@@ -0,0 +1,94 @@
+"""
+Keyset (cursor) pagination and planner-estimated counts for listing endpoints.
+
+Listings are ordered by ``(created_at DESC NULLS FIRST, id DESC)``, which is
+Postgres' default for DESC and a backward scan of the ``(created_at, id)``
+indexes. A cursor is an opaque token holding the sort key of the last row on
+the previous page, so each page is an index range scan however deep the
+client scrolls, instead of OFFSET skipping every earlier row. Rows without a
+``created_at`` come first and carry a null timestamp in their cursor.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, or_, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+# Accepted values for the ``count`` query parameter
+COUNT_MODES = ("exact", "estimated", "none")
+
+
+def encode_cursor(created_at: Optional[datetime], row_id: Any) -> str:
+    """Build the opaque cursor for the row a page ended on."""
+    payload = json.dumps({"t": created_at.isoformat() if created_at else None, "id": str(row_id)})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Tuple[Optional[datetime], UUID]:
+    """Parse a cursor produced by ``encode_cursor``. Raises ValueError if malformed."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        created_at = datetime.fromisoformat(payload["t"]) if payload["t"] is not None else None
+        return created_at, UUID(payload["id"])
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {token}") from e
+
+
+def keyset_order(created_at_column, id_column) -> tuple:
+    """ORDER BY clauses matching ``keyset_after``."""
+    return created_at_column.desc().nulls_first(), id_column.desc()
+
+
+def keyset_after(created_at_column, id_column, cursor: str):
+    """Filter selecting the rows after ``cursor`` in ``keyset_order``."""
+    created_at, row_id = decode_cursor(cursor)
+    if created_at is None:
+        # Still among the rows without a timestamp; every timestamped row follows them
+        return or_(and_(created_at_column.is_(None), id_column < row_id), created_at_column.isnot(None))
+    # NULL created_at compares as unknown, so the (already listed) null rows are excluded
+    return tuple_(created_at_column, id_column) < tuple_(created_at, row_id)
+
+
+def next_cursor(rows, limit: int, created_at_attr: str = "created_at", id_attr: str = "id") -> Optional[str]:
+    """Cursor for the following page, or None when this page was the last one."""
+    if len(rows) < limit or not rows:
+        return None
+    last = rows[-1]
+    return encode_cursor(getattr(last, created_at_attr), getattr(last, id_attr))
+
+
+class _ExplainJson(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON) <statement>`` with the statement's parameters bound normally."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_ExplainJson)
+def _compile_explain_json(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def _plan_rows(plan: Any) -> int:
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def estimated_count(db: Session, query) -> int:
+    """Row count the planner expects ``query`` to return (no rows are read)."""
+    return _plan_rows(db.execute(_ExplainJson(query.order_by(None))).scalar())
+
+
+async def estimated_count_async(db: AsyncSession, query) -> int:
+    """Async variant of ``estimated_count``."""
+    return _plan_rows((await db.execute(_ExplainJson(query.order_by(None)))).scalar())
@@ -0,0 +1,292 @@
+"""
+Optional monthly range partitioning of the ``articles`` table on ``created_at``.
+
+Partitioning is opt-in (ARTICLES_PARTITIONING_ENABLED). Once enabled:
+- ``enable_articles_partitioning`` converts the plain table in place. It is a
+  one-off run by hand (``make db-partition-articles``) in a maintenance
+  window: it copies the whole table under ACCESS EXCLUSIVE in one
+  transaction, so the scheduled maintenance task never calls it.
+- ``ensure_article_partitions`` keeps partitions created ahead of time,
+  moving any rows that already landed in ``articles_default`` for a month.
+- ``apply_article_retention`` detaches or drops partitions older than
+  ARTICLES_RETENTION_MONTHS, skipping any partition whose articles are still
+  linked to an episode.
+
+PostgreSQL requires every unique index on a partitioned table to include the
+partition key, so on a partitioned ``articles`` the primary key becomes
+``(id, created_at)`` and the foreign key from
+``episode_article_link.article_id`` is dropped (retention checks links itself).
+A unique ``(feed_id, link, created_at)`` index would not stop duplicate links,
+so ``uq_articles_feed_link`` is replaced by the plain ``ix_articles_feed_id_link``
+and news-feed keeps ``(feed_id, link)`` unique by storing each feed's articles
+under a per-feed advisory lock (``_store_feed_articles``).
+"""
+import logging
+import os
+from datetime import datetime, date
+from typing import Dict, Any, List
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+ARTICLES_PARTITIONING_ENABLED = os.getenv("ARTICLES_PARTITIONING_ENABLED", "false").lower() in ("1", "true", "yes")
+ARTICLES_PARTITIONS_AHEAD = int(os.getenv("ARTICLES_PARTITIONS_AHEAD", "2"))
+ARTICLES_RETENTION_MONTHS = int(os.getenv("ARTICLES_RETENTION_MONTHS", "0"))  # 0 disables retention
+ARTICLES_RETENTION_ACTION = os.getenv("ARTICLES_RETENTION_ACTION", "detach")  # 'detach' | 'drop'
+
+PARTITION_PREFIX = "articles_p"
+DEFAULT_PARTITION = "articles_default"
+
+# Advisory lock key for partition maintenance (distinct from the migrations lock)
+PARTITION_LOCK_KEY = 7_351_005
+
+
+def _month_start(d: date) -> date:
+    return date(d.year, d.month, 1)
+
+
+def _add_months(d: date, months: int) -> date:
+    month_index = d.year * 12 + (d.month - 1) + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARTITION_PREFIX}{month.year:04d}{month.month:02d}"
+
+
+def is_articles_partitioned(conn: Connection) -> bool:
+    return bool(conn.execute(text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table pt "
+        "JOIN pg_class c ON c.oid = pt.partrelid "
+        "WHERE c.relname = 'articles' AND pg_table_is_visible(c.oid))"
+    )).scalar())
+
+
+def list_article_partitions(conn: Connection) -> List[str]:
+    return list(conn.execute(text(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE p.relname = 'articles' AND pg_table_is_visible(p.oid) "
+        "ORDER BY c.relname"
+    )).scalars())
+
+
+def _stats_rollup_installed(conn: Connection) -> bool:
+    """Whether shared/migrations/0002_stats_rollup.sql has been applied."""
+    return bool(conn.execute(text("SELECT to_regprocedure('stats_rebuild()') IS NOT NULL")).scalar())
+
+
+def _copyable_columns(conn: Connection, table: str) -> str:
+    """Column list for copying rows of ``table``; generated columns (search_vector) are recomputed."""
+    return ", ".join(conn.execute(text(
+        "SELECT quote_ident(column_name) FROM information_schema.columns "
+        "WHERE table_name = :table AND table_schema = current_schema() "
+        "AND is_generated = 'NEVER' ORDER BY ordinal_position"
+    ), {"table": table}).scalars())
+
+
+def _create_month_partition(conn: Connection, month: date) -> bool:
+    """Create the partition for ``month``; returns False if it exists or was skipped.
+
+    Postgres refuses a new partition while the default partition holds rows
+    in its range. Those rows are moved into the new month (default detached,
+    month created, rows moved, default re-attached under a savepoint); if
+    that fails the conflict is logged and the month is left for the next run.
+    """
+    name = partition_name(month)
+    exists = conn.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}).scalar()
+    if exists:
+        return False
+    start, end = month.isoformat(), _add_months(month, 1).isoformat()
+    bounds = f"FOR VALUES FROM ('{start}') TO ('{end}')"
+
+    has_default = conn.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": DEFAULT_PARTITION}).scalar()
+    in_default = has_default and conn.execute(text(
+        f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE created_at >= :start AND created_at < :end)"
+    ), {"start": start, "end": end}).scalar()
+    if not in_default:
+        conn.exec_driver_sql(f"CREATE TABLE {name} PARTITION OF articles {bounds}")
+        return True
+
+    try:
+        with conn.begin_nested():
+            conn.exec_driver_sql(f"ALTER TABLE articles DETACH PARTITION {DEFAULT_PARTITION}")
+            conn.exec_driver_sql(f"CREATE TABLE {name} PARTITION OF articles {bounds}")
+            columns = _copyable_columns(conn, DEFAULT_PARTITION)
+            in_range = f"WHERE created_at >= '{start}' AND created_at < '{end}'"
+            moved = conn.exec_driver_sql(
+                f"INSERT INTO {name} ({columns}) SELECT {columns} FROM {DEFAULT_PARTITION} {in_range}"
+            ).rowcount
+            conn.exec_driver_sql(f"DELETE FROM {DEFAULT_PARTITION} {in_range}")
+            conn.exec_driver_sql(f"ALTER TABLE articles ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT")
+    except Exception as e:
+        logger.error(f"Skipped article partition {name}: could not move its rows out of {DEFAULT_PARTITION}: {e}")
+        return False
+
+    # Rows moved while the default was detached bypass the row-count triggers
+    if _stats_rollup_installed(conn):
+        conn.exec_driver_sql("SELECT stats_rebuild()")
+    logger.info(f"Moved {moved} articles from {DEFAULT_PARTITION} into {name}")
+    return True
+
+
+def ensure_article_partitions(engine: Engine, months_ahead: int = ARTICLES_PARTITIONS_AHEAD) -> List[str]:
+    """Create monthly partitions from the current month through ``months_ahead``."""
+    created: List[str] = []
+    with engine.begin() as conn:
+        if not is_articles_partitioned(conn):
+            return created
+        conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY})
+        this_month = _month_start(datetime.utcnow().date())
+        for offset in range(0, months_ahead + 1):
+            month = _add_months(this_month, offset)
+            if _create_month_partition(conn, month):
+                created.append(partition_name(month))
+    if created:
+        logger.info(f"Created article partitions: {created}")
+    return created
+
+
+def enable_articles_partitioning(engine: Engine, months_ahead: int = ARTICLES_PARTITIONS_AHEAD) -> bool:
+    """Convert ``articles`` into a monthly range-partitioned table. Idempotent.
+
+    Blocks all reads and writes of ``articles`` while the rows are copied.
+    """
+    with engine.begin() as conn:
+        conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY})
+        if is_articles_partitioned(conn):
+            return False
+
+        logger.info("Converting articles to a partitioned table")
+        conn.exec_driver_sql("LOCK TABLE articles IN ACCESS EXCLUSIVE MODE")
+        conn.exec_driver_sql(
+            "ALTER TABLE episode_article_link DROP CONSTRAINT IF EXISTS episode_article_link_article_id_fkey"
+        )
+        conn.exec_driver_sql("ALTER TABLE articles RENAME TO articles_unpartitioned")
+
+        # Free index names so the partitioned table can reuse them
+        index_names = conn.execute(text(
+            "SELECT indexname FROM pg_indexes WHERE tablename = 'articles_unpartitioned' "
+            "AND schemaname = current_schema()"
+        )).scalars().all()
+        for index_name in index_names:
+            conn.exec_driver_sql(f'ALTER INDEX "{index_name}" RENAME TO "{index_name}_unpartitioned"')
+
+        conn.exec_driver_sql(
+            "CREATE TABLE articles (LIKE articles_unpartitioned INCLUDING DEFAULTS INCLUDING GENERATED) "
+            "PARTITION BY RANGE (created_at)"
+        )
+        conn.exec_driver_sql("ALTER TABLE articles ALTER COLUMN created_at SET DEFAULT now()")
+        conn.exec_driver_sql("ALTER TABLE articles ALTER COLUMN created_at SET NOT NULL")
+        conn.exec_driver_sql("ALTER TABLE articles ADD PRIMARY KEY (id, created_at)")
+        conn.exec_driver_sql(
+            "ALTER TABLE articles ADD CONSTRAINT articles_feed_id_fkey "
+            "FOREIGN KEY (feed_id) REFERENCES news_feeds (id)"
+        )
+        conn.exec_driver_sql(
+            "ALTER TABLE articles ADD CONSTRAINT articles_collection_id_fkey "
+            "FOREIGN KEY (collection_id) REFERENCES collections (id)"
+        )
+
+        # One partition per month present in the data, plus the months ahead
+        oldest = conn.execute(text("SELECT min(created_at) FROM articles_unpartitioned")).scalar()
+        this_month = _month_start(datetime.utcnow().date())
+        month = _month_start(oldest.date()) if oldest else this_month
+        last = _add_months(this_month, months_ahead)
+        while month <= last:
+            _create_month_partition(conn, month)
+            month = _add_months(month, 1)
+        conn.exec_driver_sql(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF articles DEFAULT")
+
+        # The partition key must be set; backfill the rare rows without one
+        conn.exec_driver_sql(
+            "UPDATE articles_unpartitioned SET created_at = COALESCE(publish_date, now()) "
+            "WHERE created_at IS NULL"
+        )
+        columns = _copyable_columns(conn, "articles_unpartitioned")
+        conn.exec_driver_sql(
+            f"INSERT INTO articles ({columns}) SELECT {columns} FROM articles_unpartitioned"
+        )
+
+        conn.exec_driver_sql("CREATE INDEX ix_articles_collection_id ON articles (collection_id)")
+        conn.exec_driver_sql("CREATE INDEX ix_articles_created_at_id ON articles (created_at, id)")
+        conn.exec_driver_sql(
+            "CREATE INDEX ix_articles_unreviewed_created_at ON articles (created_at) WHERE reviewer_type IS NULL"
+        )
+        conn.exec_driver_sql("CREATE INDEX ix_articles_feed_id_link ON articles (feed_id, link)")
+        conn.exec_driver_sql("CREATE INDEX ix_articles_feed_publish_date ON articles (feed_id, publish_date)")
+        conn.exec_driver_sql(
+            "CREATE INDEX ix_articles_near_duplicate_of ON articles (near_duplicate_of) "
+            "WHERE near_duplicate_of IS NOT NULL"
+        )
+        if conn.execute(text(
+            "SELECT EXISTS (SELECT 1 FROM information_schema.columns "
+            "WHERE table_name = 'articles' AND table_schema = current_schema() AND column_name = 'search_vector')"
+        )).scalar():
+            conn.exec_driver_sql("CREATE INDEX ix_articles_search_vector ON articles USING GIN (search_vector)")
+
+        conn.exec_driver_sql("DROP TABLE articles_unpartitioned")
+        if _stats_rollup_installed(conn):
+            conn.exec_driver_sql("SELECT stats_install_triggers()")
+        conn.exec_driver_sql("ANALYZE articles")
+
+    logger.info("articles is now partitioned by month on created_at")
+    return True
+
+
+def apply_article_retention(
+    engine: Engine,
+    retention_months: int = ARTICLES_RETENTION_MONTHS,
+    action: str = ARTICLES_RETENTION_ACTION
+) -> Dict[str, Any]:
+    """Detach or drop monthly partitions entirely older than ``retention_months``.
+
+    A partition is kept if any of its articles is linked to an episode.
+    """
+    result: Dict[str, Any] = {"detached": [], "dropped": [], "kept_linked": []}
+    if retention_months <= 0:
+        return result
+
+    cutoff = _add_months(_month_start(datetime.utcnow().date()), -retention_months)
+    with engine.begin() as conn:
+        if not is_articles_partitioned(conn):
+            return result
+        conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY})
+        # Block new episode links while we decide, so a partition can't gain a link mid-check
+        conn.exec_driver_sql("LOCK TABLE episode_article_link IN SHARE MODE")
+
+        for name in list_article_partitions(conn):
+            if not name.startswith(PARTITION_PREFIX):
+                continue
+            try:
+                stamp = name[len(PARTITION_PREFIX):]
+                month = date(int(stamp[:4]), int(stamp[4:6]), 1)
+            except ValueError:
+                continue
+            if _add_months(month, 1) > cutoff:
+                continue
+
+            linked = conn.execute(text(
+                f"SELECT EXISTS (SELECT 1 FROM episode_article_link l JOIN {name} a ON a.id = l.article_id)"
+            )).scalar()
+            if linked:
+                result["kept_linked"].append(name)
+                continue
+
+            conn.exec_driver_sql(f"ALTER TABLE articles DETACH PARTITION {name}")
+            if action == "drop":
+                conn.exec_driver_sql(f"DROP TABLE {name}")
+                result["dropped"].append(name)
+            else:
+                result["detached"].append(name)
+
+        # Detaching bypasses the row-count triggers, so recount the rollup
+        if (result["detached"] or result["dropped"]) and _stats_rollup_installed(conn):
+            conn.exec_driver_sql("SELECT stats_rebuild()")
+
+    if result["detached"] or result["dropped"] or result["kept_linked"]:
+        logger.info(f"Article retention (cutoff {cutoff.isoformat()}): {result}")
+    return result
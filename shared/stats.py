@@ -0,0 +1,75 @@
+"""
+Precomputed counters for the metrics and stats endpoints.
+
+``stats_counters`` is maintained by the triggers installed in
+shared/migrations/0002_stats_rollup.sql, so reading it is a single scan of a
+few dozen rows no matter how large ``articles`` and ``episodes`` grow.
+"""
+from typing import Dict
+
+from sqlalchemy import text, func
+from sqlalchemy.orm import Session
+
+try:
+    from .models import (
+        Article, Episode, EpisodeStatus, NewsFeed, PodcastGroup,
+        Presenter, Writer, Collection
+    )
+except ImportError:
+    from models import (
+        Article, Episode, EpisodeStatus, NewsFeed, PodcastGroup,
+        Presenter, Writer, Collection
+    )
+
+
+def read_counters(db: Session) -> Dict[str, int]:
+    """Return every rollup counter by name."""
+    if db.get_bind().dialect.name != "postgresql":
+        return _count_live(db)
+    rows = db.execute(text("SELECT name, sum(value) FROM stats_counters GROUP BY name")).all()
+    return {name: int(value) for name, value in rows}
+
+
+def rebuild_counters(db: Session) -> None:
+    """Recount every counter from the base tables."""
+    db.execute(text("SELECT stats_rebuild()"))
+    db.commit()
+
+
+def episode_counts_by_status(counters: Dict[str, int]) -> Dict[str, int]:
+    """Episode counts keyed by ``EpisodeStatus`` value."""
+    return {
+        status.value: counters.get(f"episodes_by_status:{status.name}", 0)
+        for status in EpisodeStatus
+    }
+
+
+def article_counts_by_reviewer(counters: Dict[str, int]) -> Dict[str, int]:
+    """Article counts keyed by reviewer type, plus ``unreviewed``."""
+    return {
+        reviewer: counters.get(f"articles_by_reviewer:{reviewer}", 0)
+        for reviewer in ("light", "heavy", "unreviewed")
+    }
+
+
+def _count_live(db: Session) -> Dict[str, int]:
+    """Same counters computed directly (databases without the rollup triggers)."""
+    counters: Dict[str, int] = {}
+    for reviewer_type, count in db.query(Article.reviewer_type, func.count()).group_by(Article.reviewer_type):
+        counters[f"articles_by_reviewer:{reviewer_type or 'unreviewed'}"] = count
+    counters["articles_total"] = sum(counters.values())
+
+    for status, count in db.query(Episode.status, func.count()).group_by(Episode.status):
+        counters[f"episodes_by_status:{status.name if status else 'NONE'}"] = count
+    counters["episodes_total"] = db.query(Episode).count()
+
+    for status, count in db.query(PodcastGroup.status, func.count()).group_by(PodcastGroup.status):
+        counters[f"podcast_groups_by_status:{status.name if status else 'NONE'}"] = count
+    counters["podcast_groups_total"] = db.query(PodcastGroup).count()
+
+    counters["news_feeds_total"] = db.query(NewsFeed).count()
+    counters["news_feeds_active"] = db.query(NewsFeed).filter(NewsFeed.is_active == True).count()
+    counters["presenters_total"] = db.query(Presenter).count()
+    counters["writers_total"] = db.query(Writer).count()
+    counters["collections_total"] = db.query(Collection).count()
+    return counters